@@ -8,6 +8,17 @@ Created on 12 Nov 2022
 
 __version__ = "0.0.6"
 
+from axaremote.asyncaxaremote import (
+    AsyncAXARemote,
+    AsyncAXARemoteSerial,
+    AsyncAXARemoteTelnet,
+)
+from axaremote.axacalibration import AXATimingProfile
+from axaremote.axaclock import AXAVirtualClock
+from axaremote.axaestimator import AXAPositionEstimate
+from axaremote.axafleet import AXAFleet, AXAFleetResult
+from axaremote.axametrics import AXAMetrics, AXAMetricsServer
+from axaremote.axapoller import AsyncAXAPoller, AXAPoller
 from axaremote.axaremote import (
     AXARemote,
     AXARemoteError,
@@ -15,3 +26,5 @@ from axaremote.axaremote import (
     AXARemoteTelnet,
     AXAStatus,
 )
+from axaremote.axastore import AXAProfileStore
+from axaremote.axatrace import AXAReplayConnection
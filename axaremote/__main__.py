@@ -5,43 +5,86 @@ Created on 23 Nov 2022
 """
 
 import argparse
+import json
 import logging
 import sys
 import time
 
 from axaremote import AXARemoteError, AXARemoteSerial, AXARemoteTelnet, AXAStatus
+from axaremote.axastore import AXAProfileStore
+from axaremote.axatrace import AXATraceConnection
 
 _LOGGER = logging.getLogger(__name__)
 
 
-if __name__ == "__main__":
-    # Read command line arguments
+def argument_parser() -> argparse.ArgumentParser:
+    """
+    Returns the parser of the command line arguments.
+    """
     argparser = argparse.ArgumentParser()
+    argparser.add_argument("--debug", dest="debugLogging", action="store_true")
 
-    subparsers = argparser.add_subparsers()
+    # Accept --debug after the arguments of a command too, without overriding the value parsed
+    # before the command
+    debug_parser = argparse.ArgumentParser(add_help=False)
+    debug_parser.add_argument(
+        "--debug", dest="debugLogging", action="store_true", default=argparse.SUPPRESS
+    )
+
+    subparsers = argparser.add_subparsers(dest="command", required=True)
 
-    serial_parser = subparsers.add_parser("serial")
+    serial_parser = subparsers.add_parser("serial", parents=[debug_parser])
     serial_parser.add_argument("serial_port")
 
-    telnet_parser = subparsers.add_parser("telnet")
+    telnet_parser = subparsers.add_parser("telnet", parents=[debug_parser])
     telnet_parser.add_argument("host")
     telnet_parser.add_argument("port", type=int)
 
-    argparser.add_argument(
-        "action", choices=["status", "open", "close", "stop", "calibrate"]
-    )
-    argparser.add_argument(
-        "--close-time",
-        nargs="?",
-        const=1,
-        type=float,
-        dest="close_time",
-        required=False,
+    for parser in [serial_parser, telnet_parser]:
+        parser.add_argument(
+            "action", choices=["status", "open", "close", "stop", "calibrate"]
+        )
+        parser.add_argument(
+            "--close-time",
+            nargs="?",
+            const=1,
+            type=float,
+            dest="close_time",
+            required=False,
+            help="time in seconds to close the window from fully open to locked",
+        )
+        parser.add_argument("--wait", dest="wait", action="store_true")
+        parser.add_argument("--trace", dest="trace", required=False)
+        parser.add_argument("--profiles", dest="profiles", required=False)
+
+    simulator_parser = subparsers.add_parser("simulator", parents=[debug_parser])
+    simulator_parser.add_argument("--host", default="127.0.0.1")
+    simulator_parser.add_argument("--port", type=int, default=2323)
+    simulator_parser.add_argument("--serial", dest="serial", action="store_true")
+    simulator_parser.add_argument("--time-unlock", type=float, default=5)
+    simulator_parser.add_argument("--time-open", type=float, default=42)
+    simulator_parser.add_argument("--time-close", type=float, default=42)
+    simulator_parser.add_argument("--time-lock", type=float, default=16)
+    simulator_parser.add_argument("--latency", type=float, default=0.0)
+    simulator_parser.add_argument("--jitter", type=float, default=0.0)
+
+    bench_parser = subparsers.add_parser("bench", parents=[debug_parser])
+    bench_parser.add_argument(
+        "--transport", choices=["serial", "telnet"], action="append", dest="transports"
     )
-    argparser.add_argument("--wait", dest="wait", action="store_true")
-    argparser.add_argument("--debug", dest="debugLogging", action="store_true")
+    bench_parser.add_argument("--commands", type=int, default=500)
+    bench_parser.add_argument("--handshakes", type=int, default=5)
+    bench_parser.add_argument("--latency", type=float, default=0.0)
+    bench_parser.add_argument("--jitter", type=float, default=0.0)
+    bench_parser.add_argument("--cycles", type=int, default=10)
+    bench_parser.add_argument("--json", dest="json", action="store_true")
 
-    args = argparser.parse_args()
+    return argparser
+
+
+if __name__ == "__main__":
+    # Read command line arguments
+    args = argument_parser().parse_args()
 
     if args.debugLogging:
         logging.basicConfig(
@@ -50,12 +93,78 @@ if __name__ == "__main__":
     else:
         logging.basicConfig(format="%(message)s", level=logging.INFO)
 
+    if args.command == "bench":
+        # pylint: disable=import-outside-toplevel
+        from axaremote.benchmarks.roundtrip import format_results, run_benchmarks
+
+        if not args.debugLogging:
+            logging.getLogger("axaremote.axaremote").setLevel(logging.WARNING)
+        results = run_benchmarks(
+            args.transports,
+            args.commands,
+            args.handshakes,
+            args.latency,
+            args.jitter,
+            args.cycles,
+        )
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print(format_results(results))
+        sys.exit(0)
+
+    if args.command == "simulator":
+        # pylint: disable=import-outside-toplevel
+        from axaremote.axasimulator import (
+            AXARemoteSimulator,
+            AXASimulatorSerial,
+            AXASimulatorServer,
+        )
+
+        simulator = AXARemoteSimulator(
+            args.time_unlock,
+            args.time_open,
+            args.time_close,
+            args.time_lock,
+            args.latency,
+            args.jitter,
+        )
+        if args.serial:
+            simulator_transport = AXASimulatorSerial(simulator)
+        else:
+            simulator_transport = AXASimulatorServer(simulator, args.host, args.port)
+
+        with simulator_transport:
+            if args.serial:
+                _LOGGER.info("Serial port: %s", simulator_transport.serial_port)
+            else:
+                _LOGGER.info(
+                    "Listening on %s:%s",
+                    simulator_transport.host,
+                    simulator_transport.port,
+                )
+            try:
+                while True:
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                # Handle keyboard interrupt
+                pass
+
+        sys.exit(0)
+
+    profile_store = None
+    if args.profiles is not None:
+        profile_store = AXAProfileStore(args.profiles)
+
     if "serial_port" in args:
-        axa = AXARemoteSerial(args.serial_port)
+        axa = AXARemoteSerial(args.serial_port, profile_store=profile_store)
     elif "host" in args:
-        axa = AXARemoteTelnet(args.host, args.port)
+        axa = AXARemoteTelnet(args.host, args.port, profile_store=profile_store)
+
+    if args.trace is not None:
+        axa.connection = AXATraceConnection(axa.connection, args.trace)
 
-    if "close_time" in args:
+    if args.close_time is not None:
         axa.set_close_time(args.close_time)
 
     try:
@@ -74,8 +183,13 @@ if __name__ == "__main__":
             if axa.open():
                 _LOGGER.info("AXA Remote is opening")
                 if args.wait:
+                    next_sync = 0
                     while True:
-                        [status, position] = axa.sync_status()
+                        if axa.clock.time() >= next_sync:
+                            [status, position] = axa.sync_status()
+                            next_sync = axa.clock.time() + axa.next_poll_interval()
+                        else:
+                            [status, position] = axa.status()
                         if not args.debugLogging:
                             print(f"{status:9}: {position:5.1f} %", end="\r")
                         else:
@@ -90,8 +204,13 @@ if __name__ == "__main__":
             if axa.close():
                 _LOGGER.info("AXA Remote is closing")
                 if args.wait:
+                    next_sync = 0
                     while True:
-                        [status, position] = axa.sync_status()
+                        if axa.clock.time() >= next_sync:
+                            [status, position] = axa.sync_status()
+                            next_sync = axa.clock.time() + axa.next_poll_interval()
+                        else:
+                            [status, position] = axa.status()
                         if not args.debugLogging:
                             print(f"{status:9}: {position:5.1f} %", end="\r")
                         else:
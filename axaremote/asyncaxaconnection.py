@@ -0,0 +1,322 @@
+"""
+Implements the asyncio connection types for connecting to AXA Remote window openers.
+
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+
+import serial
+
+from axaremote.axaconnection import AXAConnectionError, AXALineBuffer
+
+logger = logging.getLogger(__name__)
+
+_SERIAL_TIMEOUT = 1.0
+_TCP_TIMEOUT = 1.0
+_RESET_QUIET_TIME = 0.05
+
+
+class AsyncAXAConnection(ABC):
+    """
+    Abstract class on which the different asyncio connection types are build.
+    """
+
+    is_open: bool = False
+
+    _reader: asyncio.StreamReader = None
+    _buffer: AXALineBuffer = None
+    _timeout: float = 1.0
+
+    @abstractmethod
+    async def open(self) -> bool:
+        """
+        Opens the connection to the AXA Remote.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self) -> bool:
+        """
+        Closes the connection to the AXA Remote.
+        """
+        raise NotImplementedError
+
+    async def reset(self) -> bool:
+        """
+        Discards any data that is waiting in the input buffer of the connection.
+        """
+        self._buffer.clear()
+        while True:
+            try:
+                data = await asyncio.wait_for(
+                    self._reader.read(1024), _RESET_QUIET_TIME
+                )
+            except asyncio.TimeoutError:
+                return True
+            except (ConnectionError, OSError) as ex:
+                logger.error("Connection lost: %s", ex)
+                await self.close()
+                raise AXAConnectionError(str(ex)) from ex
+
+            if not data:
+                logger.error("Connection lost")
+                await self.close()
+                raise AXAConnectionError("Connection lost")
+
+    async def readline(self) -> bytes:
+        """
+        Reads a line from the connection.
+
+        Returns as soon as a complete line is received. Returns the data received so far, which
+        might be empty, if no complete line is received within the timeout.
+        """
+        if self._reader is None:
+            raise AXAConnectionError("Connection is not open")
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._timeout
+        while True:
+            line = self._buffer.readline()
+            if line is not None:
+                return line
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return self._buffer.flush()
+
+            try:
+                data = await asyncio.wait_for(self._reader.read(1024), remaining)
+            except asyncio.TimeoutError:
+                return self._buffer.flush()
+            except (ConnectionError, OSError) as ex:
+                logger.error("Connection lost: %s", ex)
+                await self.close()
+                raise AXAConnectionError(str(ex)) from ex
+
+            if not data:
+                logger.error("Connection lost")
+                await self.close()
+                raise AXAConnectionError("Connection lost")
+            self._buffer.feed(data)
+
+    async def readlines(self) -> list[bytes]:
+        """
+        Reads all lines from the connection.
+        """
+        lines = []
+
+        while True:
+            line = await self.readline()
+            if not line:
+                break
+            lines.append(line)
+
+        return lines
+
+    @abstractmethod
+    async def write(self, data: bytes) -> int:
+        """
+        Output the given bytes over the connection.
+        """
+        raise NotImplementedError
+
+    async def flush(self) -> None:
+        """
+        Flush write buffers, if applicable.
+        """
+
+
+class AsyncAXASerialConnection(AsyncAXAConnection):
+    """
+    Class to handle the asyncio serial connection type.
+
+    The serial port is put in non blocking mode and watched by the event loop, this requires an
+    event loop that supports add_reader(), which is the case for the default event loop on POSIX
+    systems.
+    """
+
+    _connection: serial.Serial = None
+    _loop: asyncio.AbstractEventLoop = None
+
+    _timeout = _SERIAL_TIMEOUT
+
+    def __init__(self, serial_port: str):
+        assert serial_port is not None
+
+        self._serial_port = serial_port
+        self._buffer = AXALineBuffer()
+
+    def __str__(self):
+        return self._serial_port
+
+    async def open(self) -> bool:
+        if self._connection is not None:
+            return self.is_open
+
+        try:
+            connection = serial.Serial(
+                port=self._serial_port,
+                baudrate=19200,
+                bytesize=serial.EIGHTBITS,
+                parity=serial.PARITY_NONE,
+                stopbits=serial.STOPBITS_TWO,
+                timeout=0,
+            )
+
+            # Open the connection
+            if not connection.is_open:
+                connection.open()
+        except serial.SerialException as ex:
+            raise AXAConnectionError(str(ex)) from ex
+
+        self._loop = asyncio.get_running_loop()
+        self._reader = asyncio.StreamReader()
+        self._connection = connection
+        self._loop.add_reader(connection.fileno(), self._on_readable)
+
+        return self.is_open
+
+    def _on_readable(self) -> None:
+        """
+        Called by the event loop when data is waiting on the serial port.
+        """
+        try:
+            data = self._connection.read(max(1, self._connection.in_waiting))
+        except serial.SerialException as ex:
+            self._loop.remove_reader(self._connection.fileno())
+            self._reader.set_exception(ConnectionError(str(ex)))
+            return
+
+        if data:
+            self._reader.feed_data(data)
+
+    @property
+    def is_open(self):
+        """If the connection is open"""
+        if self._connection and self._connection.is_open:
+            return True
+
+        return False
+
+    async def close(self) -> bool:
+        if self._connection is not None:
+            try:
+                self._loop.remove_reader(self._connection.fileno())
+            except (ValueError, OSError):
+                pass
+            self._connection.close()
+            self._connection = None
+            self._reader = None
+        self._buffer.clear()
+
+        return True
+
+    async def reset(self) -> bool:
+        try:
+            self._connection.reset_input_buffer()
+            self._connection.reset_output_buffer()
+        except serial.SerialException as ex:
+            raise AXAConnectionError(str(ex)) from ex
+
+        # Also discard what the event loop already has read
+        self._reader = asyncio.StreamReader()
+        self._buffer.clear()
+
+        return True
+
+    async def write(self, data: bytes) -> int:
+        try:
+            self._connection.write(data)
+
+            return len(data)
+        except serial.SerialException as ex:
+            raise AXAConnectionError(str(ex)) from ex
+
+    async def flush(self) -> None:
+        await self._loop.run_in_executor(None, self._connection.flush)
+
+
+class AsyncAXATCPConnection(AsyncAXAConnection):
+    """
+    Class to handle the asyncio TCP connection type, as used by serial to network bridges like
+    esp-link.
+    """
+
+    _writer: asyncio.StreamWriter = None
+
+    _timeout = _TCP_TIMEOUT
+
+    def __init__(self, host: str, port: int):
+        assert host is not None
+        assert port is not None
+
+        self._host = host
+        self._port = port
+        self._buffer = AXALineBuffer()
+
+    def __str__(self):
+        return f"{self._host}:{self._port}"
+
+    async def open(self) -> bool:
+        if self._writer is not None:
+            return True
+
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self._host, self._port), _TCP_TIMEOUT
+            )
+        except (OSError, asyncio.TimeoutError) as ex:
+            raise AXAConnectionError(str(ex) or "Timeout") from ex
+
+        return True
+
+    @property
+    def is_open(self):
+        """If the connection is open"""
+        if self._writer and not self._writer.is_closing():
+            return True
+
+        return False
+
+    async def close(self) -> bool:
+        if self._writer is not None:
+            writer = self._writer
+            self._writer = None
+            self._reader = None
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+        self._buffer.clear()
+
+        return True
+
+    async def write(self, data: bytes) -> int:
+        if self._writer is None:
+            raise AXAConnectionError("Connection is not open")
+
+        try:
+            self._writer.write(data)
+
+            return len(data)
+        except (ConnectionError, OSError) as ex:
+            logger.error("Connection lost: %s", ex)
+            await self.close()
+            raise AXAConnectionError(str(ex)) from ex
+
+    async def flush(self) -> None:
+        if self._writer is None:
+            return
+
+        try:
+            await self._writer.drain()
+        except (ConnectionError, OSError) as ex:
+            logger.error("Connection lost: %s", ex)
+            await self.close()
+            raise AXAConnectionError(str(ex)) from ex
@@ -0,0 +1,198 @@
+"""
+Implements the asyncio AXA Remote class for controlling AXA Remote window openers.
+
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import asyncio
+import logging
+from typing import AsyncIterator
+
+from axaremote.asyncaxaconnection import (
+    AsyncAXAConnection,
+    AsyncAXASerialConnection,
+    AsyncAXATCPConnection,
+)
+from axaremote.axacalibration import AXATimingProfile
+from axaremote.axacommandqueue import AsyncAXACommandQueue
+from axaremote.axapoller import AsyncAXAPoller
+from axaremote.axaprotocol import AXAResponse
+from axaremote.axaremote import AXARemoteBase, _AXAProcedure
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAXARemote(AXARemoteBase):
+    """
+    AsyncAXARemote base class for interfacing with AXA Remote window openers using asyncio.
+
+    Has the same API as AXARemote, but all methods that communicate with the window opener are
+    coroutines.
+    """
+
+    connection: AsyncAXAConnection = None
+
+    _queue_class = AsyncAXACommandQueue
+    _lock_class = asyncio.Lock
+    _poller_class = AsyncAXAPoller
+
+    async def _run(self, procedure: _AXAProcedure):
+        """
+        Runs the given procedure, awaiting the I/O coroutines it requests one after another.
+        """
+        step = self._resume(procedure)
+        while not step.done:
+            result, error = None, None
+            try:
+                result = await step.function(*step.args)
+            except BaseException as ex:  # pylint: disable=broad-exception-caught
+                error = ex
+            step = self._resume(procedure, result, error)
+
+        return step.result
+
+    async def _sleep(self, seconds: float) -> None:
+        await self.clock.async_sleep(seconds)
+
+    async def _pause(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+    def _start_stop_timer(self, delay: float):
+        return asyncio.create_task(self._timed_stop(delay))
+
+    async def _timed_stop(self, delay: float) -> None:
+        await self.clock.async_sleep(delay)
+        await self._run(self._timed_stop_procedure())
+
+    def _stop_poller(self, poller) -> None:
+        asyncio.get_running_loop().create_task(poller.stop())
+
+    async def connect(self) -> bool:
+        """
+        Connect to the window opener.
+        """
+        return await self._run(self._connect_procedure())
+
+    async def disconnect(self) -> bool:
+        """
+        Disconnect from the window opener.
+        """
+        return await self._run(self._disconnect_procedure())
+
+    async def open(self) -> bool:
+        """
+        Opens the window opener.
+        """
+        return await self._run(self._move_procedure("OPEN", 100.0))
+
+    async def stop(self) -> bool:
+        """
+        Stops the window opening.
+        """
+        return await self._run(self._move_procedure("STOP", self._position))
+
+    async def close(self) -> bool:
+        """
+        Closes the window opener.
+        """
+        return await self._run(self._move_procedure("CLOSE", 0.0))
+
+    async def set_position(self, target_position: float) -> None:
+        """
+        Initiates the window opener to move to a given position.
+
+        The window opener is stopped by a timer task once the given position is reached.
+        """
+        await self._run(self._set_position_procedure(target_position))
+
+    async def raw_status(self) -> AXAResponse:
+        """
+        Returns the status as given by the AXA Remote.
+
+        If the raw status is cached concurrent callers share a single STATUS command.
+        """
+        return await self._run(self._raw_status_procedure())
+
+    async def sync_status(self) -> None:
+        """
+        Synchronises the raw state with the presumed state.
+        """
+        return await self._run(self._sync_status_procedure())
+
+    async def status(self) -> [int, float]:
+        """
+        Returns the current status of the window opener.
+        """
+        return await self._run(self._status_procedure())
+
+    async def changes(
+        self, position_step: float = 1.0, min_interval: float = 0.2
+    ) -> AsyncIterator[list]:
+        """
+        Returns an asynchronous iterator over the status changes of the window opener, see
+        subscribe().
+        """
+        changes = asyncio.Queue()
+        unsubscribe = self.subscribe(changes.put_nowait, position_step, min_interval)
+        try:
+            while True:
+                yield await changes.get()
+        finally:
+            unsubscribe()
+
+    async def calibrate(
+        self, runs: int = 3, min_interval: float = 0.1, max_interval: float = 2.0
+    ) -> AXATimingProfile | None:
+        """
+        Calibrates the AXA Remote window opener unlock, open, close and lock times.
+
+        The window opener is opened and closed the given number of times while the raw status is
+        polled, at most once per given minimal interval. Runs in which a status change came much
+        earlier than expected, or in which the window opener might not have been fully open, are
+        repeated. The average of the measured times is used to calculate
+        the position of the window opener and returned as timing profile.
+        """
+        return await self._run(
+            self._calibrate_procedure(runs, min_interval, max_interval)
+        )
+
+
+class AsyncAXARemoteSerial(AsyncAXARemote):
+    """
+    AXA Remote class for controlling AXA Remote window openers over a serial connection using
+    asyncio.
+    """
+
+    def __init__(self, serial_port: str, **kwargs) -> None:
+        """
+        Initializes the AsyncAXARemote object.
+        """
+        assert serial_port is not None
+
+        self.unique_id = serial_port
+
+        connection = AsyncAXASerialConnection(serial_port)
+
+        super().__init__(connection, **kwargs)
+
+
+class AsyncAXARemoteTelnet(AsyncAXARemote):
+    """
+    AXA Remote class for controlling AXA Remote window openers over a network connection using
+    asyncio.
+    """
+
+    def __init__(self, host: str, port: int, **kwargs) -> None:
+        """
+        Initializes the AsyncAXARemote object.
+        """
+        assert host is not None
+        assert port is not None
+
+        self.unique_id = f"{host}:{port}"
+
+        connection = AsyncAXATCPConnection(host, port)
+
+        super().__init__(connection, **kwargs)
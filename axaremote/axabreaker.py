@@ -0,0 +1,166 @@
+"""
+Implements the circuit breaker that stops the AXA Remote library from hammering offline window
+openers.
+
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import logging
+import random
+import threading
+from enum import Enum
+from typing import Final
+
+from axaremote.axaclock import AXAClock, AXAMonotonicClock
+
+logger = logging.getLogger(__name__)
+
+_FAILURE_THRESHOLD = 3
+_BACKOFF = 1.0
+_MAX_BACKOFF = 300.0
+_JITTER = 0.2
+
+
+class AXACircuitBreakerState(Enum):
+    """
+    The states of the circuit breaker.
+    """
+
+    CLOSED: Final = 0
+    OPEN: Final = 1
+    HALF_OPEN: Final = 2
+
+    def __str__(self):
+        return {
+            self.CLOSED: "Closed",
+            self.OPEN: "Open",
+            self.HALF_OPEN: "Half open",
+        }[self]
+
+
+class AXACircuitBreaker:
+    """
+    Per window opener circuit breaker.
+
+    After a number of consecutive failures the circuit breaker opens and no further attempts are
+    allowed until the backoff time has passed. Then a single probe is allowed, the half open state,
+    on success the circuit breaker closes again, on failure the backoff time is doubled, with some
+    jitter so not all offline window openers are probed at the same moment.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = _FAILURE_THRESHOLD,
+        backoff: float = _BACKOFF,
+        max_backoff: float = _MAX_BACKOFF,
+        jitter: float = _JITTER,
+        clock: AXAClock = None,
+    ):
+        assert failure_threshold > 0
+        assert 0 < backoff <= max_backoff
+        assert 0 <= jitter < 1
+
+        self.failure_threshold = failure_threshold
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.clock = clock or AXAMonotonicClock()
+
+        self._lock = threading.Lock()
+        self._state = AXACircuitBreakerState.CLOSED
+        self._failures = 0
+        self._trips = 0
+        self._retry_at = None
+
+        self._successes_total = 0
+        self._failures_total = 0
+        self._rejected_total = 0
+        self._probes_total = 0
+        self._trips_total = 0
+
+    @property
+    def state(self) -> AXACircuitBreakerState:
+        """The state of the circuit breaker"""
+        return self._state
+
+    def allow(self) -> bool:
+        """
+        Returns if an attempt to communicate with the window opener is allowed.
+        """
+        with self._lock:
+            if self._state == AXACircuitBreakerState.CLOSED:
+                return True
+
+            if (
+                self._state == AXACircuitBreakerState.OPEN
+                and self.clock.time() >= self._retry_at
+            ):
+                logger.debug("Probing if the device is back online")
+                self._state = AXACircuitBreakerState.HALF_OPEN
+                self._probes_total += 1
+                return True
+
+            self._rejected_total += 1
+            return False
+
+    def success(self) -> None:
+        """
+        Records a successful communication with the window opener.
+        """
+        with self._lock:
+            self._successes_total += 1
+            self._failures = 0
+            self._trips = 0
+            if self._state != AXACircuitBreakerState.CLOSED:
+                logger.info("Device is back online")
+                self._state = AXACircuitBreakerState.CLOSED
+                self._retry_at = None
+
+    def failure(self) -> None:
+        """
+        Records a failed communication with the window opener.
+        """
+        with self._lock:
+            self._failures_total += 1
+            self._failures += 1
+            if (
+                self._state == AXACircuitBreakerState.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                self._trip()
+
+    def _trip(self) -> None:
+        backoff = min(self.max_backoff, self.backoff * 2**self._trips)
+        backoff *= random.uniform(1 - self.jitter, 1 + self.jitter)
+
+        if self._state == AXACircuitBreakerState.CLOSED:
+            logger.info("Device is offline, retrying in %.1f seconds", backoff)
+        else:
+            logger.debug("Device is still offline, retrying in %.1f seconds", backoff)
+
+        self._state = AXACircuitBreakerState.OPEN
+        self._trips += 1
+        self._trips_total += 1
+        self._retry_at = self.clock.time() + backoff
+
+    def statistics(self) -> dict:
+        """
+        Returns the state and counters of the circuit breaker.
+        """
+        with self._lock:
+            retry_in = None
+            if self._retry_at is not None:
+                retry_in = max(0.0, self._retry_at - self.clock.time())
+
+            return {
+                "state": str(self._state),
+                "consecutive_failures": self._failures,
+                "retry_in": retry_in,
+                "successes": self._successes_total,
+                "failures": self._failures_total,
+                "rejected": self._rejected_total,
+                "probes": self._probes_total,
+                "trips": self._trips_total,
+            }
@@ -0,0 +1,175 @@
+"""
+Implements the calibration of the motion timings of AXA Remote window openers.
+
+The window opener only reports if it is Strong Locked, Weak Locked or UnLocked. The unlock time is
+the time from the OPEN command until the window opener reports UnLocked, the close time the time
+from the CLOSE command until the window opener reports Weak Locked and the lock time the time from
+Weak Locked until Strong Locked. The end of opening can not be observed, the open time is taken to
+be equal to the close time.
+
+None of the classes in this module perform any I/O.
+
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import logging
+from typing import NamedTuple
+
+from axaremote.axaprotocol import AXARawStatus
+
+logger = logging.getLogger(__name__)
+
+# Minimal time in seconds between two STATUS commands while calibrating
+_MIN_POLL_INTERVAL = 0.1
+# Maximal time in seconds between two STATUS commands while calibrating
+_MAX_POLL_INTERVAL = 2.0
+# Time in seconds around an expected status change in which the status is polled at the minimal
+# interval
+_BURST_WINDOW = 3.0
+# Time in seconds to wait for a status change
+_EDGE_TIMEOUT = 120.0
+# Maximal number of calibration runs, relative to the number of requested runs
+_MAX_RUNS_FACTOR = 2
+# Extra time, relative to the expected open time, to wait for the window opener to be fully open
+_OPEN_MARGIN = 0.25
+
+LOCKED_STATES = [AXARawStatus.STRONG_LOCKED, AXARawStatus.WEAK_LOCKED]
+
+
+class AXATimingProfile(NamedTuple):
+    """
+    The time in seconds to unlock, open, close and lock an AXA Remote window opener.
+    """
+
+    time_unlock: float
+    time_open: float
+    time_close: float
+    time_lock: float
+
+    def scaled(self, close_time: float) -> "AXATimingProfile":
+        """
+        Returns the profile with all times scaled proportionally, so closing the window from fully
+        open to locked, the close and the lock time together, takes the given close time.
+        """
+        assert close_time > 0
+
+        factor = close_time / (self.time_close + self.time_lock)
+        return AXATimingProfile(
+            self.time_unlock * factor,
+            self.time_open * factor,
+            self.time_close * factor,
+            self.time_lock * factor,
+        )
+
+    def __str__(self):
+        return (
+            f"unlock {self.time_unlock:.1f} s, open {self.time_open:.1f} s, "
+            f"close {self.time_close:.1f} s, lock {self.time_lock:.1f} s"
+        )
+
+
+def average_profiles(profiles: list[AXATimingProfile]) -> AXATimingProfile:
+    """
+    Returns the average of the given timing profiles.
+    """
+    assert len(profiles) > 0
+
+    return AXATimingProfile(*(sum(times) / len(profiles) for times in zip(*profiles)))
+
+
+class AXAEdgeDetector:
+    """
+    Times a change of the raw status, the edge, by polling the status.
+
+    The status is polled at the maximal interval while the edge is not expected yet and in a burst
+    at the minimal interval around and after the expected time of the edge, so the link is not
+    saturated while the edge is still timed accurately. The time of the edge is taken as the
+    midpoint between the last poll before and the first poll after the edge.
+    """
+
+    def __init__(
+        self,
+        states: list[AXARawStatus],
+        start: float,
+        expected: float,
+        min_interval: float = _MIN_POLL_INTERVAL,
+        max_interval: float = _MAX_POLL_INTERVAL,
+        timeout: float = _EDGE_TIMEOUT,
+        before: float = None,
+    ):
+        """
+        Initialises the edge detector for an edge to one of the given raw states, expected the
+        given number of seconds after the given monotonic start time.
+
+        The status is known not to have changed yet at the given monotonic before time, which
+        defaults to the start time.
+        """
+        assert len(states) > 0
+        assert expected >= 0
+        assert 0 < min_interval <= max_interval
+        assert timeout > 0
+
+        self.states = states
+        self.start = start
+        self.expected = expected
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.timeout = timeout
+        self.polls = 0
+        # Monotonic time of the first poll after the edge
+        self.sampled = None
+
+        self._before = start if before is None else before
+        self._burst_window = min(_BURST_WINDOW, max(min_interval, expected / 4))
+
+    def poll_interval(self, now: float) -> float:
+        """
+        Returns the number of seconds to wait before polling the status again.
+        """
+        time_to_edge = self.expected - (now - self.start)
+        if time_to_edge <= self._burst_window:
+            return self.min_interval
+
+        # Never poll more often than the minimal interval, also not just before the burst window
+        return max(
+            self.min_interval,
+            min(self.max_interval, time_to_edge - self._burst_window),
+        )
+
+    def offer(self, raw_state: AXARawStatus, sampled: float) -> float | None:
+        """
+        Offers a raw state sampled at the given monotonic time.
+
+        Returns the number of seconds since the start until the edge, once the edge is detected.
+        """
+        self.polls += 1
+        if raw_state in self.states:
+            self.sampled = sampled
+            return (self._before + sampled) / 2 - self.start
+
+        self._before = sampled
+        return None
+
+    @property
+    def accurate(self) -> bool:
+        """
+        If the edge was detected while polling at the minimal interval, an edge that comes much
+        earlier than expected is only timed to within the maximal interval.
+        """
+        return self.expected - (self._before - self.start) <= self._burst_window
+
+    def timed_out(self, now: float) -> bool:
+        """
+        If the edge has not been detected in time.
+        """
+        return now - self.start > self.timeout
+
+
+def open_wait(profile: AXATimingProfile) -> float:
+    """
+    Returns the number of seconds after the OPEN command after which the window opener is sure to
+    be fully open.
+    """
+    return profile.time_unlock + profile.time_open * (1 + _OPEN_MARGIN)
@@ -0,0 +1,187 @@
+"""
+Implements the clocks used for all timing of the motion model of the AXA Remote library.
+
+The monotonic clock is not affected by changes of the wall clock, like NTP adjustments or
+daylight saving time. The virtual clock only moves when it is advanced, so full open and close
+cycles can be simulated much faster than real time.
+
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class AXAClock(ABC):
+    """
+    Base class of the clocks, all times are in seconds.
+    """
+
+    @abstractmethod
+    def time(self) -> float:
+        """
+        Returns the current time of the clock.
+        """
+
+    @abstractmethod
+    def sleep(self, seconds: float) -> None:
+        """
+        Waits the given number of seconds.
+        """
+
+    @abstractmethod
+    async def async_sleep(self, seconds: float) -> None:
+        """
+        Waits the given number of seconds without blocking the event loop.
+        """
+
+    @abstractmethod
+    def call_later(self, delay: float, callback: Callable[[], None]):
+        """
+        Calls the given callback after the given delay, returns a timer that can be cancelled.
+        """
+
+    @abstractmethod
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        """
+        Waits till the given event is set or the given timeout passed, returns if the event is
+        set.
+        """
+
+    @abstractmethod
+    async def async_wait(self, event: asyncio.Event, timeout: float) -> bool:
+        """
+        Waits till the given event is set or the given timeout passed without blocking the event
+        loop, returns if the event is set.
+        """
+
+
+class AXAMonotonicClock(AXAClock):
+    """
+    Clock that follows the monotonic clock of the system.
+    """
+
+    def time(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+    async def async_sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+    def call_later(self, delay: float, callback: Callable[[], None]):
+        timer = threading.Timer(delay, callback)
+        timer.daemon = True
+        timer.start()
+
+        return timer
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        return event.wait(timeout)
+
+    async def async_wait(self, event: asyncio.Event, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+
+        return True
+
+
+class _AXAVirtualTimer:
+    """
+    Timer of the virtual clock.
+    """
+
+    __slots__ = ("callback", "cancelled")
+
+    def __init__(self, callback: Callable[[], None]):
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """
+        Stops the timer from calling its callback.
+        """
+        self.cancelled = True
+
+
+class AXAVirtualClock(AXAClock):
+    """
+    Clock that only moves when it is advanced.
+
+    Sleeping and waiting on the virtual clock advance it, so the code that sleeps drives the
+    simulation. Timers are called in order when the clock is advanced past their due time.
+    """
+
+    def __init__(self, start: float = 0.0):
+        self._lock = threading.Lock()
+        self._now = start
+        self._timers = []
+        self._sequence = itertools.count()
+
+    def time(self) -> float:
+        with self._lock:
+            return self._now
+
+    def advance(self, seconds: float) -> None:
+        """
+        Advances the clock by the given number of seconds, calling the timers that become due.
+        """
+        assert seconds >= 0
+
+        with self._lock:
+            target = self._now + seconds
+
+        while True:
+            with self._lock:
+                if not self._timers or self._timers[0][0] > target:
+                    self._now = max(self._now, target)
+                    return
+                due, _, timer = heapq.heappop(self._timers)
+                self._now = max(self._now, due)
+            # The callback is called without holding the lock, it might use the clock itself
+            if not timer.cancelled:
+                timer.callback()
+
+    def sleep(self, seconds: float) -> None:
+        self.advance(max(0.0, seconds))
+
+    async def async_sleep(self, seconds: float) -> None:
+        self.advance(max(0.0, seconds))
+        # Let other tasks run, like a real sleep would
+        await asyncio.sleep(0)
+
+    def call_later(self, delay: float, callback: Callable[[], None]):
+        timer = _AXAVirtualTimer(callback)
+        with self._lock:
+            heapq.heappush(
+                self._timers, (self._now + max(0.0, delay), next(self._sequence), timer)
+            )
+
+        return timer
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        if not event.is_set():
+            self.advance(max(0.0, timeout))
+
+        return event.is_set()
+
+    async def async_wait(self, event: asyncio.Event, timeout: float) -> bool:
+        # Let other tasks run and set the event first
+        await asyncio.sleep(0)
+        if not event.is_set():
+            await self.async_sleep(timeout)
+
+        return event.is_set()
@@ -0,0 +1,277 @@
+"""
+Implements the command queues that serialise the access to the connection of an AXA Remote.
+
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import asyncio
+import bisect
+import itertools
+import threading
+import time
+
+# Time in seconds a command waits for the queue to make progress before giving up
+_QUEUE_TIMEOUT = 10.0
+
+# Command priorities, lower values are served first
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+
+_LANES = {PRIORITY_HIGH: "high", PRIORITY_NORMAL: "normal"}
+
+
+class _Waiter:
+    """
+    A command waiting in the queue.
+    """
+
+    __slots__ = ("priority", "sequence", "enqueued", "granted", "future")
+
+    def __init__(self, priority: int, sequence: int, future=None):
+        self.priority = priority
+        self.sequence = sequence
+        self.enqueued = time.monotonic()
+        self.granted = False
+        self.future = future
+
+    def __lt__(self, other):
+        return (self.priority, self.sequence) < (other.priority, other.sequence)
+
+
+class _LaneStatistics:
+    """
+    Statistics of a single priority lane.
+    """
+
+    __slots__ = ("commands", "total_wait", "max_wait", "total_latency", "max_latency")
+
+    def __init__(self):
+        self.commands = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def as_dict(self) -> dict:
+        """
+        Returns the statistics as a dictionary.
+        """
+        return {
+            "commands": self.commands,
+            "average_wait": self.total_wait / self.commands if self.commands else 0.0,
+            "max_wait": self.max_wait,
+            "average_latency": (
+                self.total_latency / self.commands if self.commands else 0.0
+            ),
+            "max_latency": self.max_latency,
+        }
+
+
+class AXACommandQueueBase:
+    """
+    Bookkeeping shared by the blocking and the asyncio command queue.
+
+    Waiting commands are served in order of priority and, within the same priority, in the order
+    they arrived. When the connection is released it is handed over directly to the next waiting
+    command. A waiting command only gives up if the queue did not make any progress for the given
+    timeout, so a command that waits behind a lot of other commands does not time out as long as
+    these commands are processed.
+    """
+
+    def __init__(self, timeout: float = _QUEUE_TIMEOUT):
+        assert timeout > 0
+
+        self.timeout = timeout
+
+        self._holder = None
+        self._waiters = []
+        self._sequence = itertools.count()
+        self._progress = time.monotonic()
+
+        self._commands = 0
+        self._contended = 0
+        self._timeouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._last_wait = 0.0
+        self._lanes = {priority: _LaneStatistics() for priority in _LANES}
+
+    @property
+    def locked(self) -> bool:
+        """If a command is being processed"""
+        return self._holder is not None
+
+    @property
+    def depth(self) -> int:
+        """The number of commands being processed or waiting to be processed"""
+        return len(self._waiters) + (1 if self._holder is not None else 0)
+
+    def _waiter(self, priority: int, future=None) -> _Waiter:
+        assert priority in _LANES
+
+        return _Waiter(priority, next(self._sequence), future)
+
+    def _granted(self, waiter: _Waiter, contended: bool) -> None:
+        """
+        Records the statistics of a command that got access to the connection.
+        """
+        now = time.monotonic()
+
+        waiter.granted = True
+        self._holder = waiter
+        self._progress = now
+        self._commands += 1
+        if contended:
+            self._contended += 1
+
+        wait = now - waiter.enqueued
+        self._total_wait += wait
+        self._max_wait = max(self._max_wait, wait)
+        self._last_wait = wait
+
+        lane = self._lanes[waiter.priority]
+        lane.commands += 1
+        lane.total_wait += wait
+        lane.max_wait = max(lane.max_wait, wait)
+
+    def _remaining(self) -> float:
+        """
+        Returns the time left before a waiting command gives up.
+        """
+        return self._progress + self.timeout - time.monotonic()
+
+    def _timed_out(self, waiter: _Waiter) -> None:
+        self._waiters.remove(waiter)
+        self._timeouts += 1
+
+    def sent(self) -> None:
+        """
+        Records that the command holding the connection is written to the wire.
+
+        The time between enqueueing the command and this moment is recorded as the latency of the
+        priority lane of the command.
+        """
+        waiter = self._holder
+        if waiter is None:
+            return
+
+        latency = time.monotonic() - waiter.enqueued
+        lane = self._lanes[waiter.priority]
+        lane.total_latency += latency
+        lane.max_latency = max(lane.max_latency, latency)
+
+    def statistics(self) -> dict:
+        """
+        Returns the queue statistics.
+        """
+        return {
+            "depth": self.depth,
+            "commands": self._commands,
+            "contended": self._contended,
+            "timeouts": self._timeouts,
+            "total_wait": self._total_wait,
+            "max_wait": self._max_wait,
+            "last_wait": self._last_wait,
+            "average_wait": (
+                self._total_wait / self._commands if self._commands else 0.0
+            ),
+            "lanes": {
+                name: self._lanes[priority].as_dict()
+                for priority, name in _LANES.items()
+            },
+        }
+
+
+class AXACommandQueue(AXACommandQueueBase):
+    """
+    Thread safe priority queue for the commands of a single AXA Remote.
+    """
+
+    def __init__(self, timeout: float = _QUEUE_TIMEOUT):
+        super().__init__(timeout)
+
+        self._condition = threading.Condition()
+
+    def acquire(self, priority: int = PRIORITY_NORMAL) -> bool:
+        """
+        Waits till it's the callers turn to use the connection.
+
+        Returns False if the queue did not make progress within the timeout.
+        """
+        with self._condition:
+            waiter = self._waiter(priority)
+            if self._holder is None and not self._waiters:
+                self._granted(waiter, False)
+                return True
+
+            bisect.insort(self._waiters, waiter)
+            while not waiter.granted:
+                remaining = self._remaining()
+                if remaining <= 0:
+                    self._timed_out(waiter)
+                    return False
+                self._condition.wait(remaining)
+
+            return True
+
+    def release(self) -> None:
+        """
+        Hands the connection over to the next waiting command.
+        """
+        with self._condition:
+            self._progress = time.monotonic()
+            self._holder = None
+            if self._waiters:
+                self._granted(self._waiters.pop(0), True)
+                self._condition.notify_all()
+
+
+class AsyncAXACommandQueue(AXACommandQueueBase):
+    """
+    Priority queue for the commands of a single AXA Remote, for use from a single event loop.
+    """
+
+    async def acquire(self, priority: int = PRIORITY_NORMAL) -> bool:
+        """
+        Waits till it's the callers turn to use the connection.
+
+        Returns False if the queue did not make progress within the timeout.
+        """
+        if self._holder is None and not self._waiters:
+            self._granted(self._waiter(priority), False)
+            return True
+
+        waiter = self._waiter(priority, asyncio.get_running_loop().create_future())
+        bisect.insort(self._waiters, waiter)
+        try:
+            while not waiter.granted:
+                remaining = self._remaining()
+                if remaining <= 0:
+                    self._timed_out(waiter)
+                    return False
+                try:
+                    await asyncio.wait_for(asyncio.shield(waiter.future), remaining)
+                except asyncio.TimeoutError:
+                    pass
+        except asyncio.CancelledError:
+            if waiter.granted:
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+        return True
+
+    def release(self) -> None:
+        """
+        Hands the connection over to the next waiting command.
+        """
+        self._progress = time.monotonic()
+        self._holder = None
+        if self._waiters:
+            waiter = self._waiters.pop(0)
+            self._granted(waiter, True)
+            if not waiter.future.done():
+                waiter.future.set_result(True)
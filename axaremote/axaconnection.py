@@ -7,7 +7,9 @@ Created on 24 Aug 2023
 """
 
 import logging
-import telnetlib
+import select
+import socket
+import time
 from abc import ABC, abstractmethod
 
 import serial
@@ -15,7 +17,13 @@ import serial
 logger = logging.getLogger(__name__)
 
 _SERIAL_TIMEOUT = 1.0
-_TELNET_TIMEOUT = 1.0
+_SOCKET_TIMEOUT = 1.0
+_RECEIVE_BUFFER_SIZE = 1024
+_INITIAL_ROUND_TRIP_TIME = 0.025
+_RESET_MIN_QUIET_TIME = 0.01
+
+# Detect dead serial to network bridges within about 90 seconds
+_KEEPALIVE_OPTIONS = {"TCP_KEEPIDLE": 60, "TCP_KEEPINTVL": 10, "TCP_KEEPCNT": 3}
 
 
 class AXAConnectionError(Exception):
@@ -26,6 +34,75 @@ class AXAConnectionError(Exception):
     """
 
 
+class AXALineBuffer:
+    """
+    Reusable receive buffer that splits the received data into lines.
+
+    Lines are terminated by a carriage return, a line feed or a carriage return followed by a line
+    feed.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._skip_lf = False
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def feed(self, data: bytes) -> None:
+        """
+        Adds the received data to the buffer.
+        """
+        if self._skip_lf and data:
+            # The line feed of a carriage return line feed pair of the previous line
+            if data[:1] == b"\n":
+                data = data[1:]
+            self._skip_lf = False
+        self._buffer.extend(data)
+
+    def readline(self) -> bytes | None:
+        """
+        Returns the first complete line in the buffer, including the line terminator, or None if
+        the buffer does not contain a complete line.
+        """
+        buffer = self._buffer
+        end = buffer.find(b"\r")
+        lf = buffer.find(b"\n", 0, end if end != -1 else len(buffer))
+        if lf != -1:
+            end = lf
+        if end == -1:
+            return None
+
+        size = end + 1
+        if buffer[end] == 0x0D:
+            if size < len(buffer):
+                if buffer[size] == 0x0A:
+                    size += 1
+            else:
+                self._skip_lf = True
+
+        line = bytes(buffer[:size])
+        del buffer[:size]
+
+        return line
+
+    def flush(self) -> bytes:
+        """
+        Returns and removes all data in the buffer, complete line or not.
+        """
+        data = bytes(self._buffer)
+        self._buffer.clear()
+
+        return data
+
+    def clear(self) -> None:
+        """
+        Discards all data in the buffer.
+        """
+        self._buffer.clear()
+        self._skip_lf = False
+
+
 class AXAConnection(ABC):
     """
     Abstract class on which the different connection types are build.
@@ -99,6 +176,7 @@ class AXASerialConnection(AXAConnection):
         assert serial_port is not None
 
         self._serial_port = serial_port
+        self._buffer = AXALineBuffer()
 
     def __str__(self):
         return self._serial_port
@@ -143,6 +221,7 @@ class AXASerialConnection(AXAConnection):
         if self._connection is not None:
             self._connection.close()
             self._connection = None
+        self._buffer.clear()
 
         return True
 
@@ -150,20 +229,38 @@ class AXASerialConnection(AXAConnection):
         try:
             self._connection.reset_input_buffer()
             self._connection.reset_output_buffer()
+            self._buffer.clear()
 
             return True
         except serial.SerialException as ex:
             raise AXAConnectionError(str(ex)) from ex
 
-    def readline(self) -> str:
-        try:
-            return self._connection.readline()
-        except serial.SerialException as ex:
-            raise AXAConnectionError(str(ex)) from ex
+    def readline(self) -> bytes:
+        """
+        Reads a line from the connection.
 
-    def readlines(self) -> str:
+        Reads all data that is waiting in bulk and returns as soon as a complete line is received.
+        Returns the data received so far if no complete line is received within the timeout.
+        """
+        deadline = time.monotonic() + _SERIAL_TIMEOUT
         try:
-            return self._connection.readlines()
+            while True:
+                line = self._buffer.readline()
+                if line is not None:
+                    return line
+
+                if time.monotonic() >= deadline:
+                    return self._buffer.flush()
+
+                # Read whatever is waiting, or block till at least one byte is received, but not
+                # beyond the deadline
+                waiting = self._connection.in_waiting
+                if not waiting:
+                    self._connection.timeout = max(deadline - time.monotonic(), 0)
+                data = self._connection.read(waiting or 1)
+                if not data:
+                    return self._buffer.flush()
+                self._buffer.feed(data)
         except serial.SerialException as ex:
             raise AXAConnectionError(str(ex)) from ex
 
@@ -179,12 +276,14 @@ class AXASerialConnection(AXAConnection):
         self._connection.flush()
 
 
-class AXATelnetConnection(AXAConnection):
+class AXASocketConnection(AXAConnection):
     """
-    Class to handle the telnet connection type.
+    Class to handle the TCP connection type, as used by serial to network bridges like esp-link.
+
+    Uses a non blocking socket with a reusable receive buffer.
     """
 
-    _connection = None
+    _socket: socket.socket = None
 
     def __init__(self, host: str, port: int):
         assert host is not None
@@ -192,15 +291,29 @@ class AXATelnetConnection(AXAConnection):
 
         self._host = host
         self._port = port
+        self._buffer = AXALineBuffer()
+        self._receive_buffer = memoryview(bytearray(_RECEIVE_BUFFER_SIZE))
+        self._round_trip_time = _INITIAL_ROUND_TRIP_TIME
+        self._write_time = None
 
     def __str__(self):
         return f"{self._host}:{self._port}"
 
     def open(self) -> bool:
         try:
-            if self._connection is None:
-                connection = telnetlib.Telnet(self._host, self._port, _TELNET_TIMEOUT)
-                self._connection = connection
+            if self._socket is None:
+                connection = socket.create_connection(
+                    (self._host, self._port), _SOCKET_TIMEOUT
+                )
+                connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                for option, value in _KEEPALIVE_OPTIONS.items():
+                    if hasattr(socket, option):
+                        connection.setsockopt(
+                            socket.IPPROTO_TCP, getattr(socket, option), value
+                        )
+                connection.setblocking(False)
+                self._socket = connection
 
             return True
         except (OSError, TimeoutError) as ex:
@@ -209,42 +322,121 @@ class AXATelnetConnection(AXAConnection):
     @property
     def is_open(self):
         """If the connection is open"""
-        if self._connection:
+        if self._socket:
             return True
 
         return False
 
     def close(self) -> bool:
-        if self._connection is not None:
-            self._connection.close()
-            self._connection = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        self._buffer.clear()
 
         return True
 
-    def reset(self) -> bool:
-        try:
-            self.readlines()
+    def _connection_lost(self, ex: Exception) -> AXAConnectionError:
+        logger.error("Connection lost: %s", ex)
+        self.close()
+        return AXAConnectionError(str(ex))
 
-            return True
-        except EOFError as ex:
-            logger.error("Connection lost: %s", ex)
-            self.close()
-            raise AXAConnectionError(str(ex)) from ex
+    def _receive(self, timeout: float) -> bool:
+        """
+        Waits for data to be received and adds it to the line buffer.
 
-    def readline(self) -> str:
-        try:
-            return self._connection.read_until(b"\r", _TELNET_TIMEOUT)
-        except (ConnectionResetError, EOFError) as ex:
-            logger.error("Connection lost: %s", ex)
-            self.close()
-            raise AXAConnectionError(str(ex)) from ex
+        Returns False if no data is received within the timeout.
+        """
+        if self._socket is None:
+            raise AXAConnectionError("Connection is not open")
+
+        readable, _, _ = select.select([self._socket], [], [], max(0.0, timeout))
+        if not readable:
+            return False
 
-    def write(self, data: str) -> int:
         try:
-            self._connection.write(data)
+            size = self._socket.recv_into(self._receive_buffer)
+        except (BlockingIOError, InterruptedError):
+            return False
+        except OSError as ex:
+            raise self._connection_lost(ex) from ex
 
-            return len(data)
+        if size == 0:
+            raise self._connection_lost(EOFError("Connection closed by peer"))
+
+        if self._write_time is not None:
+            # Smoothed round trip time, like TCP does
+            round_trip_time = time.monotonic() - self._write_time
+            self._round_trip_time += (round_trip_time - self._round_trip_time) / 8
+            self._write_time = None
+
+        self._buffer.feed(self._receive_buffer[:size])
+
+        return True
+
+    def reset(self) -> bool:
+        """
+        Discards the data that is already received without waiting out the read timeout.
+
+        Drains the socket and then waits for a short quiet period, based on the measured round trip
+        time, to also discard data that was still underway.
+        """
+        self._buffer.clear()
+
+        quiet_time = min(
+            max(2 * self._round_trip_time, _RESET_MIN_QUIET_TIME), _SOCKET_TIMEOUT
+        )
+        deadline = time.monotonic() + _SOCKET_TIMEOUT
+        while time.monotonic() < deadline and self._receive(quiet_time):
+            self._buffer.clear()
+        self._buffer.clear()
+
+        return True
+
+    def readline(self) -> bytes:
+        """
+        Reads a line from the connection.
+
+        Returns as soon as a complete line is received. Returns the data received so far if no
+        complete line is received within the timeout.
+        """
+        deadline = time.monotonic() + _SOCKET_TIMEOUT
+        while True:
+            line = self._buffer.readline()
+            if line is not None:
+                return line
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._receive(remaining):
+                return self._buffer.flush()
+
+    def write(self, data: bytes) -> int:
+        if self._socket is None:
+            raise AXAConnectionError("Connection is not open")
+
+        view = memoryview(data)
+        self._write_time = time.monotonic()
+        try:
+            while view:
+                try:
+                    sent = self._socket.send(view)
+                except (BlockingIOError, InterruptedError):
+                    _, writable, _ = select.select(
+                        [], [self._socket], [], _SOCKET_TIMEOUT
+                    )
+                    if not writable:
+                        raise TimeoutError("Timeout while writing") from None
+                    continue
+                view = view[sent:]
         except OSError as ex:
-            logger.error("Connection lost: %s", ex)
-            self.close()
-            raise AXAConnectionError(str(ex)) from ex
+            raise self._connection_lost(ex) from ex
+
+        return len(data)
+
+
+class AXATelnetConnection(AXASocketConnection):
+    """
+    Class to handle the telnet connection type.
+
+    Kept for backwards compatibility, serial to network bridges like esp-link don't need the telnet
+    protocol and telnetlib is removed from Python 3.13. This is now a raw TCP connection.
+    """
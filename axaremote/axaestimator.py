@@ -0,0 +1,200 @@
+"""
+Implements the position estimator of the AXA Remote library.
+
+The window opener does not report its position, only if it is locked or not. The estimator keeps
+track of the interval in which the position of the window is known to be. While the window moves
+the interval widens, as the actual speed of the window opener is only known to within a margin.
+The interval is clipped to the fully closed and fully open end stops and collapses when the window
+opener reports it is locked or has just unlocked.
+
+None of the classes in this module perform any I/O.
+
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import logging
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# Relative margin of the actual speed of the window opener around the calibrated speed
+_SPEED_MARGIN = 0.1
+
+OPENING = 1
+IDLE = 0
+CLOSING = -1
+
+
+class AXAPositionEstimate(NamedTuple):
+    """
+    The estimated position of the window, where 0.0 is closed and 100.0 is fully open, and the
+    interval in which the position is known to be.
+    """
+
+    position: float
+    uncertainty: float
+    minimum: float
+    maximum: float
+
+
+def _clip(position: float) -> float:
+    return min(100.0, max(0.0, position))
+
+
+class AXAPositionEstimator:
+    """
+    Interval estimator of the position of the window.
+
+    All times are given in seconds by the caller, so the estimator can be advanced to any moment.
+    """
+
+    def __init__(self, speed_margin: float = _SPEED_MARGIN):
+        assert 0 <= speed_margin < 1
+
+        self.speed_margin = speed_margin
+        # Speed factors of the slowest, the nominal and the fastest window opener
+        self._factors = (1 - speed_margin, 1.0, 1 + speed_margin)
+
+        # Minimal, nominal and maximal position at the start of the current movement
+        self._positions = (0.0, 0.0, 100.0)
+        self._direction = IDLE
+        # Nominal speed in percent per second
+        self._speed = 0.0
+        self._start = None
+        # Time before the window starts moving, while unlocking, at the slowest, nominal and
+        # fastest speed
+        self._delays = (0.0, 0.0, 0.0)
+        # Time at which the window opener was last known to be locked
+        self._locked_at = None
+
+    @property
+    def direction(self) -> int:
+        """The direction the window is presumed to move in"""
+        return self._direction
+
+    def _current(self, now: float) -> tuple[float, float, float]:
+        """
+        Returns the minimal, nominal and maximal position at the given time.
+        """
+        if self._direction == IDLE:
+            return self._positions
+
+        elapsed = max(0.0, now - self._start)
+        travelled = [
+            max(0.0, elapsed - delay) * self._speed * factor
+            for factor, delay in zip(self._factors, self._delays)
+        ]
+        minimum, nominal, maximum = self._positions
+        if self._direction == OPENING:
+            return (
+                _clip(minimum + travelled[0]),
+                _clip(nominal + travelled[1]),
+                _clip(maximum + travelled[2]),
+            )
+
+        return (
+            _clip(minimum - travelled[2]),
+            _clip(nominal - travelled[1]),
+            _clip(maximum - travelled[0]),
+        )
+
+    def _commit(self, now: float) -> None:
+        """
+        Starts a new part of the current movement at the given time.
+        """
+        if self._direction != IDLE:
+            elapsed = max(0.0, now - self._start)
+            self._positions = self._current(now)
+            self._delays = tuple(max(0.0, delay - elapsed) for delay in self._delays)
+        self._start = now
+
+    def start(
+        self, direction: int, now: float, travel_time: float, delay: float = 0.0
+    ) -> None:
+        """
+        Starts moving in the given direction, the full travel takes the given time and starts
+        after the given delay.
+        """
+        assert direction in [OPENING, CLOSING]
+        assert travel_time > 0
+        assert delay >= 0
+
+        self._commit(now)
+        self._direction = direction
+        self._speed = 100.0 / travel_time
+        self._delays = tuple(delay / factor for factor in self._factors)
+
+    def stop(self, now: float, latency: float = 0.0) -> None:
+        """
+        Stops moving, the window opener stopped some time within the given latency before now.
+        """
+        if self._direction == IDLE:
+            return
+
+        self._commit(now)
+        minimum, nominal, maximum = self._positions
+        # The window might have stopped up to the latency earlier
+        margin = latency * self._speed * self._factors[2]
+        if self._direction == OPENING:
+            minimum = _clip(minimum - margin)
+        else:
+            maximum = _clip(maximum + margin)
+        self._positions = (minimum, min(maximum, max(minimum, nominal)), maximum)
+        self._direction = IDLE
+
+    def locked(self, now: float) -> None:
+        """
+        The window opener reports it is locked, so the window is closed.
+        """
+        self._commit(now)
+        self._positions = (0.0, 0.0, 0.0)
+        if self._direction == CLOSING:
+            self._direction = IDLE
+        self._locked_at = now
+
+    def unlocked(self, now: float) -> None:
+        """
+        The window opener reports it is unlocked, so it is done unlocking.
+
+        If the window opener was last seen locked while unlocking, the window started moving in
+        between. If the window was presumed to be closed, it was opened by other means.
+        """
+        if self._direction == OPENING and any(self._delays):
+            self._commit(now)
+            if self._locked_at is not None:
+                moving = now - self._locked_at
+                self._positions = (
+                    0.0,
+                    _clip(moving * self._speed / 2),
+                    _clip(moving * self._speed * self._factors[2]),
+                )
+            self._delays = (0.0, 0.0, 0.0)
+        elif self._direction != OPENING and self._positions[2] <= 0.0:
+            # The window was opened by other means, its position is unknown
+            self._positions = (0.0, 50.0, 100.0)
+        self._locked_at = None
+
+    def set(
+        self, position: float, minimum: float = None, maximum: float = None
+    ) -> None:
+        """
+        Sets the position and the interval in which the position is known to be.
+        """
+        assert 0.0 <= position <= 100.0
+
+        minimum = position if minimum is None else minimum
+        maximum = position if maximum is None else maximum
+        self._positions = (minimum, position, maximum)
+        self._direction = IDLE
+        self._delays = (0.0, 0.0, 0.0)
+        self._locked_at = None
+
+    def estimate(self, now: float) -> AXAPositionEstimate:
+        """
+        Returns the estimated position at the given time.
+        """
+        minimum, nominal, maximum = self._current(now)
+
+        return AXAPositionEstimate(nominal, (maximum - minimum) / 2, minimum, maximum)
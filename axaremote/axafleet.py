@@ -0,0 +1,185 @@
+"""
+Implements the AXA Fleet class for controlling many AXA Remote window openers concurrently.
+
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Iterator, NamedTuple
+
+from axaremote.axaremote import AXARemote
+
+logger = logging.getLogger(__name__)
+
+_MAX_WORKERS = 16
+
+
+class AXAFleetResult(NamedTuple):
+    """
+    The result of an operation on a single window opener of the fleet.
+    """
+
+    remote: AXARemote
+    result: Any
+    error: Exception | None
+
+
+class AXAFleet:
+    """
+    Manages many AXA Remote window openers and runs their I/O concurrently.
+
+    Every operation is run for all window openers, or for the window openers of a group, on a
+    bounded thread pool. The results are returned as they complete, so a single offline window
+    opener does not delay the results of the others.
+    """
+
+    def __init__(self, max_workers: int = _MAX_WORKERS):
+        assert max_workers > 0
+
+        self._lock = threading.Lock()
+        self._remotes: dict[str, AXARemote] = {}
+        self._groups: dict[str, set[str]] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="AXAFleet"
+        )
+
+    def __len__(self):
+        with self._lock:
+            return len(self._remotes)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def add(self, remote: AXARemote, groups: list[str] = None) -> None:
+        """
+        Adds a window opener to the fleet and optionally to one or more groups.
+        """
+        assert remote is not None
+        assert remote.unique_id is not None
+
+        with self._lock:
+            self._remotes[remote.unique_id] = remote
+            for group in groups or []:
+                self._groups.setdefault(group, set()).add(remote.unique_id)
+
+    def remove(self, remote: AXARemote) -> None:
+        """
+        Removes a window opener from the fleet and from all groups.
+        """
+        with self._lock:
+            self._remotes.pop(remote.unique_id, None)
+            for members in self._groups.values():
+                members.discard(remote.unique_id)
+
+    def get(self, unique_id: str) -> AXARemote | None:
+        """
+        Returns the window opener with the given unique id.
+        """
+        with self._lock:
+            return self._remotes.get(unique_id)
+
+    def groups(self) -> list[str]:
+        """
+        Returns the names of the groups.
+        """
+        with self._lock:
+            return list(self._groups)
+
+    def remotes(self, group: str = None) -> list[AXARemote]:
+        """
+        Returns the window openers of the fleet, or of the given group.
+        """
+        with self._lock:
+            if group is None:
+                return list(self._remotes.values())
+            if group not in self._groups:
+                raise KeyError(f"Unknown group {group}")
+
+            return [
+                self._remotes[unique_id]
+                for unique_id in self._groups[group]
+                if unique_id in self._remotes
+            ]
+
+    def _call(self, remote: AXARemote, method: str, *args):
+        return getattr(remote, method)(*args)
+
+    def _run(
+        self, method: str, args: tuple = (), group: str = None
+    ) -> Iterator[AXAFleetResult]:
+        """
+        Runs the given method with the given arguments on all window openers of the group and
+        returns an iterator that yields the results as they complete.
+        """
+        futures = {
+            self._executor.submit(self._call, remote, method, *args): remote
+            for remote in self.remotes(group)
+        }
+
+        return self._results(futures)
+
+    def _results(self, futures: dict[Future, AXARemote]) -> Iterator[AXAFleetResult]:
+        for future in as_completed(futures):
+            remote = futures[future]
+            try:
+                yield AXAFleetResult(remote, future.result(), None)
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                logger.error("Problem with %s, reason: %s", remote.unique_id, ex)
+                yield AXAFleetResult(remote, None, ex)
+
+    def connect_all(self, group: str = None) -> Iterator[AXAFleetResult]:
+        """
+        Connects to all window openers.
+        """
+        return self._run("connect", group=group)
+
+    def disconnect_all(self, group: str = None) -> Iterator[AXAFleetResult]:
+        """
+        Disconnects from all window openers.
+        """
+        return self._run("disconnect", group=group)
+
+    def sync_all(self, group: str = None) -> Iterator[AXAFleetResult]:
+        """
+        Synchronises the status of all window openers, the result is the status and position.
+        """
+        return self._run("sync_status", group=group)
+
+    def open_all(self, group: str = None) -> Iterator[AXAFleetResult]:
+        """
+        Opens all window openers.
+        """
+        return self._run("open", group=group)
+
+    def close_all(self, group: str = None) -> Iterator[AXAFleetResult]:
+        """
+        Closes all window openers.
+        """
+        return self._run("close", group=group)
+
+    def stop_all(self, group: str = None) -> Iterator[AXAFleetResult]:
+        """
+        Stops all window openers.
+        """
+        return self._run("stop", group=group)
+
+    def set_position_all(
+        self, target_position: float, group: str = None
+    ) -> Iterator[AXAFleetResult]:
+        """
+        Moves all window openers to the given position.
+        """
+        return self._run("set_position", (target_position,), group)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down the thread pool of the fleet.
+        """
+        self._executor.shutdown(wait=wait)
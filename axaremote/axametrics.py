@@ -0,0 +1,252 @@
+"""
+Implements the metrics registry of the AXA Remote library and a Prometheus exporter.
+
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import bisect
+import http.server
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds of the latency histogram buckets
+_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+_HELP = {
+    "axaremote_commands_total": "Commands sent to the window opener",
+    "axaremote_command_seconds": "Time between sending a command and receiving its response",
+    "axaremote_queue_wait_seconds": "Time a command waited for the connection",
+    "axaremote_empty_lines_total": "Empty lines received before the echo or response",
+    "axaremote_empty_responses_total": "Commands that did not get a response",
+    "axaremote_invalid_responses_total": "Commands of which the echo was missing",
+    "axaremote_connection_errors_total": "Commands that failed on a connection error",
+    "axaremote_connects_total": "Connections opened",
+    "axaremote_connects_failed_total": "Failed attempts to open the connection",
+    "axaremote_bytes_sent_total": "Bytes written to the connection",
+}
+
+
+class _AXAHistogram:
+    """
+    Latency histogram with fixed buckets.
+    """
+
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self):
+        self.counts = [0] * (len(_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Adds a value to the histogram.
+        """
+        self.counts[bisect.bisect_left(_BUCKETS, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def buckets(self) -> dict[str, int]:
+        """
+        Returns the cumulative counts by upper bound, like Prometheus does.
+        """
+        buckets = {}
+        cumulative = 0
+        for bound, count in zip(_BUCKETS + (float("inf"),), self.counts):
+            cumulative += count
+            buckets["+Inf" if bound == float("inf") else repr(bound)] = cumulative
+
+        return buckets
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: tuple, extra: str = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in labels]
+    if extra is not None:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+
+    return "{" + ",".join(pairs) + "}"
+
+
+class AXAMetrics:
+    """
+    Registry of the counters and latency histograms of one or more window openers.
+
+    Labels are given as tuple of name and value pairs, like (("device", "/dev/ttyUSB0"),). A single
+    registry can be shared by many window openers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, tuple], float] = {}
+        self._histograms: dict[tuple[str, tuple], _AXAHistogram] = {}
+
+    def inc(self, name: str, labels: tuple = (), value: float = 1) -> None:
+        """
+        Increments a counter.
+        """
+        key = (name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, labels: tuple = ()) -> None:
+        """
+        Adds a value to a histogram.
+        """
+        key = (name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _AXAHistogram()
+            histogram.observe(value)
+
+    def snapshot(self) -> dict:
+        """
+        Returns all counters and histograms as a dictionary.
+        """
+        snapshot = {"counters": {}, "histograms": {}}
+        with self._lock:
+            for (name, labels), value in self._counters.items():
+                snapshot["counters"].setdefault(name, []).append(
+                    {"labels": dict(labels), "value": value}
+                )
+            for (name, labels), histogram in self._histograms.items():
+                snapshot["histograms"].setdefault(name, []).append(
+                    {
+                        "labels": dict(labels),
+                        "count": histogram.count,
+                        "sum": histogram.sum,
+                        "buckets": histogram.buckets(),
+                    }
+                )
+
+        return snapshot
+
+    def prometheus(self) -> str:
+        """
+        Returns all counters and histograms in the Prometheus text exposition format.
+        """
+        lines = []
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(
+                self._histograms.items(), key=lambda histogram: histogram[0]
+            )
+
+            name = None
+            for (metric, labels), value in counters:
+                if metric != name:
+                    name = metric
+                    lines.append(f"# HELP {name} {_HELP.get(name, name)}")
+                    lines.append(f"# TYPE {name} counter")
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+
+            for (metric, labels), histogram in histograms:
+                if metric != name:
+                    name = metric
+                    lines.append(f"# HELP {name} {_HELP.get(name, name)}")
+                    lines.append(f"# TYPE {name} histogram")
+                for bound, count in histogram.buckets().items():
+                    bucket_labels = _format_labels(labels, f'le="{bound}"')
+                    lines.append(f"{name}_bucket{bucket_labels} {count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {histogram.sum}")
+                lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+class _AXAMetricsRequestHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):  # pylint: disable=invalid-name
+        """
+        Serves the metrics in the Prometheus text format.
+        """
+        if self.path.split("?", 1)[0] not in ["/", "/metrics"]:
+            self.send_error(404)
+            return
+
+        body = self.server.metrics.prometheus().encode("utf8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        logger.debug(format, *args)
+
+
+class AXAMetricsServer:
+    """
+    Serves the metrics over HTTP in the Prometheus text format.
+    """
+
+    def __init__(self, metrics: AXAMetrics, host: str = "127.0.0.1", port: int = 0):
+        assert metrics is not None
+
+        self.metrics = metrics
+        self._server = http.server.ThreadingHTTPServer(
+            (host, port), _AXAMetricsRequestHandler
+        )
+        self._server.daemon_threads = True
+        self._server.metrics = metrics
+        self._thread = None
+
+    @property
+    def host(self) -> str:
+        """The host the metrics are served on"""
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        """The port the metrics are served on"""
+        return self._server.server_address[1]
+
+    def start(self) -> None:
+        """
+        Starts serving in a background thread.
+        """
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="AXAMetricsServer", daemon=True
+        )
+        self._thread.start()
+        logger.debug("Serving metrics on %s:%s", self.host, self.port)
+
+    def stop(self) -> None:
+        """
+        Stops serving.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
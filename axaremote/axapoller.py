@@ -0,0 +1,221 @@
+"""
+Implements the pollers that synchronise the status of AXA Remote window openers at an adaptive
+rate.
+
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import asyncio
+import logging
+import threading
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from axaremote.asyncaxaremote import AsyncAXARemote
+    from axaremote.axaremote import AXARemote
+
+logger = logging.getLogger(__name__)
+
+
+class _AXAPollerBase:
+    """
+    Base class with the scheduling shared by the blocking and the asyncio pollers.
+    """
+
+    def __init__(
+        self,
+        remote,
+        callback: Callable[[list], None] = None,
+        update_interval: float = None,
+    ):
+        assert remote is not None
+
+        self.remote = remote
+        self.callback = callback
+        self.update_interval = update_interval
+        self.polls = 0
+
+        self._wakeup = None
+
+    def wake(self) -> None:
+        """
+        Synchronises the status as soon as possible.
+        """
+        self._wakeup.set()
+
+    def _timeout(self, next_sync: float) -> float:
+        """
+        Returns the time to wait for the next poll or position update.
+        """
+        timeout = next_sync - self.remote.clock.time()
+        if self.update_interval is not None and self.remote.moving:
+            timeout = min(timeout, self.update_interval)
+
+        return max(0.0, timeout)
+
+
+class AXAPoller(_AXAPollerBase):
+    """
+    Synchronises the status of a window opener in a background thread.
+
+    The interval between two polls is given by the motion model of the window opener, see
+    AXARemote.next_poll_interval(). After an open, stop or close command the poller wakes up
+    immediately so the new movement is picked up without delay.
+
+    If an update interval is given the calculated position is passed to the callback at this
+    interval while the window opener is moving, without communicating with the window opener.
+    """
+
+    def __init__(
+        self,
+        remote: "AXARemote",
+        callback: Callable[[list], None] = None,
+        update_interval: float = None,
+    ):
+        super().__init__(remote, callback, update_interval)
+
+        self._thread = None
+        self._stopping = threading.Event()
+        self._wakeup = threading.Event()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @property
+    def running(self) -> bool:
+        """If the poller is running"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """
+        Starts polling the status of the window opener.
+        """
+        if self.running:
+            return
+
+        self._stopping.clear()
+        self.remote.add_command_listener(self.wake)
+        self._thread = threading.Thread(
+            target=self._run, name=f"AXAPoller {self.remote.unique_id}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops polling the status of the window opener.
+        """
+        if self._thread is None:
+            return
+
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        self.remote.remove_command_listener(self.wake)
+
+    def _run(self) -> None:
+        next_sync = 0.0
+        while not self._stopping.is_set():
+            self._wakeup.clear()
+            try:
+                if self.remote.clock.time() >= next_sync:
+                    status = self.remote.sync_status()
+                    self.polls += 1
+                    interval = self.remote.next_poll_interval()
+                    logger.debug("Next poll in %.1f seconds", interval)
+                    next_sync = self.remote.clock.time() + interval
+                else:
+                    status = self.remote.status()
+                if self.callback is not None:
+                    self.callback(status)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Problem polling %s", self.remote.unique_id)
+
+            if self.remote.clock.wait(self._wakeup, self._timeout(next_sync)):
+                next_sync = 0.0
+
+
+class AsyncAXAPoller(_AXAPollerBase):
+    """
+    Synchronises the status of a window opener in an asyncio task.
+
+    See AXAPoller.
+    """
+
+    def __init__(
+        self,
+        remote: "AsyncAXARemote",
+        callback: Callable[[list], None] = None,
+        update_interval: float = None,
+    ):
+        super().__init__(remote, callback, update_interval)
+
+        self._task = None
+        self._wakeup = asyncio.Event()
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop()
+
+    @property
+    def running(self) -> bool:
+        """If the poller is running"""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """
+        Starts polling the status of the window opener.
+        """
+        if self.running:
+            return
+
+        self.remote.add_command_listener(self.wake)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stops polling the status of the window opener.
+        """
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self.remote.remove_command_listener(self.wake)
+
+    async def _run(self) -> None:
+        next_sync = 0.0
+        while True:
+            self._wakeup.clear()
+            try:
+                if self.remote.clock.time() >= next_sync:
+                    status = await self.remote.sync_status()
+                    self.polls += 1
+                    interval = self.remote.next_poll_interval()
+                    logger.debug("Next poll in %.1f seconds", interval)
+                    next_sync = self.remote.clock.time() + interval
+                else:
+                    status = await self.remote.status()
+                if self.callback is not None:
+                    self.callback(status)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Problem polling %s", self.remote.unique_id)
+
+            if await self.remote.clock.async_wait(
+                self._wakeup, self._timeout(next_sync)
+            ):
+                next_sync = 0.0
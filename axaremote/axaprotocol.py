@@ -0,0 +1,274 @@
+"""
+Implements the sans-I/O AXA Remote protocol codec, shared by the blocking and the asyncio AXA
+Remote classes.
+
+The codec encodes commands into the bytes to send and turns the received lines into events, it
+does not perform any I/O itself.
+
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import logging
+from collections import deque
+from enum import Enum
+from typing import Final, NamedTuple
+
+from axaremote.axaconnection import AXALineBuffer
+
+logger = logging.getLogger(__name__)
+
+# Number of empty lines after which a command is considered to have no response
+MAX_EMPTY_LINES = 5
+
+COMMANDS = ["DEVICE", "VERSION", "STATUS", "OPEN", "STOP", "CLOSE"]
+
+
+class AXARemoteError(Exception):
+    """Generic AXA Remote error."""
+
+    def __init__(self, command=None):
+        self.command = command
+
+
+class EmptyResponseError(AXARemoteError):
+    """
+    Empty response error.
+
+    If the response is empty.
+    """
+
+    def __str__(self):
+        return f"Empty response for command '{self.command}'"
+
+
+class InvallidResponseError(AXARemoteError):
+    """
+    Invalid response error.
+
+    If the response format does not match the expected format.
+    """
+
+    def __init__(self, command=None, response=None):
+        super().__init__(command)
+        self.response = response
+
+    def __str__(self):
+        return f"Invalid response for command '{self.command}'. response: {repr(self.response)}"
+
+
+class TooBusyError(AXARemoteError):
+    """
+    Too busy error.
+
+    If the connection is to busy with processing other commands.
+    """
+
+    def __str__(self):
+        return f"Too busy to send '{self.command}'"
+
+
+class AXARawStatus(Enum):
+    """
+    Status codes as returned by the AXA Remote
+    """
+
+    OK: Final = 200
+    UNLOCKED: Final = 210
+    STRONG_LOCKED: Final = 211
+    WEAK_LOCKED: Final = 212
+    DEVICE: Final = 260
+    VERSION: Final = 261
+    COMMAND_NOT_IMPLEMENTED: Final = 502
+
+    def __str__(self):
+        return {
+            self.OK: "OK",
+            self.UNLOCKED: "UnLocked",
+            self.STRONG_LOCKED: "Strong Locked",
+            self.WEAK_LOCKED: "Weak Locked",
+            self.DEVICE: "Device",
+            self.VERSION: "Firmware",
+            self.COMMAND_NOT_IMPLEMENTED: "Command not implemented",
+        }[self]
+
+
+# Pre-encoded commands and the echoes they result in
+_ENCODED_COMMANDS = {command: f"{command}\r\n".encode("ascii") for command in COMMANDS}
+_ECHOES = {command: command.encode("ascii") for command in COMMANDS}
+
+# Lookup table of the status codes as received from the AXA Remote
+_STATUS_CODES = {str(status.value).encode("ascii"): status for status in AXARawStatus}
+
+
+class AXAResponse(NamedTuple):
+    """
+    A parsed response, the status code and the payload.
+
+    The status is None if the response could not be parsed, or the status code as string if it is
+    not a known status code.
+    """
+
+    status: AXARawStatus | str | None
+    payload: str | None
+
+
+NO_RESPONSE: Final = AXAResponse(None, None)
+
+
+class AXAProtocolEvent(Enum):
+    """
+    Events for received lines that do not complete a response.
+    """
+
+    ECHO: Final = 0
+    EMPTY_LINE: Final = 1
+
+
+ECHO: Final = AXAProtocolEvent.ECHO
+EMPTY_LINE: Final = AXAProtocolEvent.EMPTY_LINE
+
+
+def encode(command: str) -> bytes:
+    """
+    Returns the bytes to send for the given command.
+    """
+    encoded = _ENCODED_COMMANDS.get(command)
+    if encoded is None:
+        encoded = f"{command}\r\n".encode("ascii")
+
+    return encoded
+
+
+def parse_response(line: bytes) -> AXAResponse:
+    """
+    Parses a response line, stripped from white space, into the status code and the payload.
+    """
+    parts = line.split(maxsplit=1)
+    if len(parts) != 2:
+        return AXAResponse(None, line.decode(errors="ignore"))
+
+    status = _STATUS_CODES.get(parts[0])
+    if status is None:
+        status = parts[0].decode(errors="ignore")
+        if status.isdigit():
+            logger.warning("%s is not a valid AXARawStatus", status)
+
+    return AXAResponse(status, parts[1].decode(errors="ignore"))
+
+
+class AXAProtocol:
+    """
+    Sans-I/O state machine of the AXA Remote protocol.
+
+    For every command written the AXA Remote first echoes the command and then sends the response,
+    optionally preceded by empty lines. send() returns the bytes to write for one or more commands,
+    the received lines are then passed to receive_line() or the received bytes to feed(), which
+    return an AXAResponse for every completed response.
+    """
+
+    def __init__(self):
+        self._expected = deque()
+        self._echo_received = False
+        self._empty_lines = 0
+        self._buffer = AXALineBuffer()
+
+    @property
+    def command(self) -> str | None:
+        """The command of which the echo or response is expected"""
+        if not self._expected:
+            return None
+        return self._expected[0][0]
+
+    @property
+    def pending(self) -> int:
+        """The number of responses still expected"""
+        return len(self._expected)
+
+    def reset(self) -> None:
+        """
+        Forgets the expected responses and any buffered data.
+        """
+        self._expected.clear()
+        self._echo_received = False
+        self._empty_lines = 0
+        self._buffer.clear()
+
+    def send(
+        self, commands: list[str], max_empty_lines: int = MAX_EMPTY_LINES
+    ) -> bytes:
+        """
+        Starts a new exchange and returns the bytes to write for the given commands.
+
+        The first command allows for MAX_EMPTY_LINES empty lines before its response, the
+        following commands for the given maximum number of empty lines.
+        """
+        self.reset()
+        for index, command in enumerate(commands):
+            echo = _ECHOES.get(command)
+            if echo is None:
+                echo = command.encode("ascii")
+            self._expected.append(
+                (command, echo, MAX_EMPTY_LINES if index == 0 else max_empty_lines)
+            )
+
+        if len(commands) == 1:
+            return encode(commands[0])
+
+        return b"".join(encode(command) for command in commands)
+
+    def receive_line(self, line: bytes) -> AXAResponse | AXAProtocolEvent:
+        """
+        Processes a received line and returns the completed response, or ECHO or EMPTY_LINE.
+
+        Raises EmptyResponseError if too many empty lines are received and InvallidResponseError
+        if the command echo is missing, the exchange is then aborted.
+        """
+        command, echo, max_empty_lines = self._expected[0]
+
+        line = line.strip(b" \n\r")
+        if not line:
+            # Sometimes we first receive an empty line
+            logger.debug("Empty line")
+            self._empty_lines += 1
+            if self._empty_lines > max_empty_lines:
+                self.reset()
+                raise EmptyResponseError(command)
+            return EMPTY_LINE
+
+        if not self._echo_received:
+            if line == echo:
+                # Command echo
+                logger.debug("Command successfully sent")
+                self._echo_received = True
+                self._empty_lines = 0
+                return ECHO
+
+            response = line.decode(errors="ignore")
+            logger.warning("No command echo received, response: %s", repr(response))
+            self.reset()
+            raise InvallidResponseError(command, response)
+
+        self._expected.popleft()
+        self._echo_received = False
+        self._empty_lines = 0
+
+        response = parse_response(line)
+        logger.debug("Response: %r", response)
+        return response
+
+    def feed(self, data: bytes) -> list[AXAResponse | AXAProtocolEvent]:
+        """
+        Processes the received bytes and returns the events for all complete lines.
+        """
+        self._buffer.feed(data)
+
+        events = []
+        while self._expected:
+            line = self._buffer.readline()
+            if line is None:
+                break
+            events.append(self.receive_line(line))
+
+        return events
@@ -7,90 +7,88 @@ Created on 12 Nov 2022
 """
 
 import logging
+import queue
+import threading
 import time
-from abc import ABC
+from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Final
-
+from typing import Callable, Final, Generator, Iterator, NamedTuple
+
+from axaremote.axabreaker import AXACircuitBreaker
+from axaremote.axacalibration import (
+    _MAX_RUNS_FACTOR,
+    LOCKED_STATES,
+    AXAEdgeDetector,
+    AXATimingProfile,
+    average_profiles,
+    open_wait,
+)
+from axaremote.axaclock import AXAClock, AXAMonotonicClock
+from axaremote.axacommandqueue import (
+    PRIORITY_HIGH,
+    PRIORITY_NORMAL,
+    AXACommandQueue,
+)
 from axaremote.axaconnection import (
     AXAConnection,
     AXAConnectionError,
     AXASerialConnection,
-    AXATelnetConnection,
+    AXASocketConnection,
+)
+from axaremote.axaestimator import (
+    CLOSING,
+    OPENING,
+    AXAPositionEstimate,
+    AXAPositionEstimator,
 )
+from axaremote.axametrics import AXAMetrics
+from axaremote.axapoller import AXAPoller
+from axaremote.axaprotocol import (
+    ECHO,
+    EMPTY_LINE,
+    MAX_EMPTY_LINES,
+    NO_RESPONSE,
+    AXAProtocol,
+    AXARawStatus,
+    AXARemoteError,
+    AXAResponse,
+    EmptyResponseError,
+    InvallidResponseError,
+    TooBusyError,
+)
+from axaremote.axastore import AXAHandshakeCache, AXAProfileStore
+from axaremote.axasubscription import AXASubscriptions
 
 logger = logging.getLogger(__name__)
 
-_BUSY_TIMEOUT = 1
-
-
-class AXARemoteError(Exception):
-    """Generic AXA Remote error."""
-
-    def __init__(self, command=None):
-        self.command = command
-
-
-class EmptyResponseError(AXARemoteError):
-    """
-    Empty response error.
-
-    If the response is empty.
-    """
-
-    def __str__(self):
-        return f"Empty response for command '{self.command}'"
-
+# Commands that jump ahead of other waiting commands
+_PRIORITY_COMMANDS = {"STOP": PRIORITY_HIGH, "CLOSE": PRIORITY_HIGH}
 
-class InvallidResponseError(AXARemoteError):
-    """
-    Invalid response error.
-
-    If the response format does not match the expected format.
-    """
-
-    def __init__(self, command=None, response=None):
-        super().__init__(command)
-        self.response = response
-
-    def __str__(self):
-        return f"Invalid response for command '{self.command}'. response: {repr(self.response)}"
-
-
-class TooBusyError(AXARemoteError):
-    """
-    Too busy error.
-
-    If the connection is to busy with processing other commands.
-    """
-
-    def __str__(self):
-        return f"Too busy to send '{self.command}'"
+# The commands of the connection handshake and the number of empty lines after which pipelined
+# commands are considered to be dropped by the firmware
+_PIPELINED_HANDSHAKE = ["DEVICE", "VERSION", "STATUS"]
+_PIPELINED_MAX_EMPTY_LINES = 1
 
+# Status poll intervals in seconds, while idle, while travelling and around predicted raw status
+# transitions
+_POLL_INTERVAL_IDLE = 30.0
+_POLL_INTERVAL_TRAVEL = 5.0
+_POLL_INTERVAL_EDGE = 0.2
+# Time in seconds before and after a predicted transition during which the status is polled densely
+_POLL_EDGE_WINDOW = 1.5
 
-class AXARawStatus(Enum):
-    """
-    Status codes as returned by the AXA Remote
-    """
+# Commands that change the status of the window opener and so invalidate the cached raw status
+_MOTION_COMMANDS = ["OPEN", "STOP", "CLOSE"]
 
-    OK: Final = 200
-    UNLOCKED: Final = 210
-    STRONG_LOCKED: Final = 211
-    WEAK_LOCKED: Final = 212
-    DEVICE: Final = 260
-    VERSION: Final = 261
-    COMMAND_NOT_IMPLEMENTED: Final = 502
+# Smoothing factor of the moving average of the command round trip time
+_COMMAND_LATENCY_ALPHA = 0.25
 
-    def __str__(self):
-        return {
-            self.OK: "OK",
-            self.UNLOCKED: "UnLocked",
-            self.STRONG_LOCKED: "Strong Locked",
-            self.WEAK_LOCKED: "Weak Locked",
-            self.DEVICE: "Device",
-            self.VERSION: "Firmware",
-            self.COMMAND_NOT_IMPLEMENTED: "Command not implemented",
-        }[self]
+# Smoothing factor of the moving averages of the motion timings learned from raw status changes
+_LEARNING_ALPHA = 0.2
+# Maximal time in seconds between the polls around a raw status change to learn from it
+_LEARNING_MAX_GAP = 1.0
+# Learned times that differ more than this factor from the current time are ignored
+_LEARNING_MAX_FACTOR = 2.0
 
 
 class AXAStatus(Enum):
@@ -118,19 +116,48 @@ class AXAStatus(Enum):
         }[self]
 
 
-class AXARemote(ABC):
+class _AXAStep(NamedTuple):
     """
-    AXARemote basse class for interfacing with AXA Remote window openers.
+    The I/O call requested by a procedure, or the result of the procedure once it is done.
     """
 
-    connection: AXAConnection = None
+    function: Callable = None
+    args: tuple = ()
+    result: object = None
+
+    @property
+    def done(self) -> bool:
+        """If the procedure is done"""
+        return self.function is None
+
+
+# A procedure yields tuples of an I/O function and its arguments, is sent the results of these
+# calls and returns its result
+_AXAProcedure = Generator[tuple, object, object]
+
+
+class AXARemoteBase(ABC):
+    """
+    Base class with the state machine and position calculation shared by the blocking and the
+    asyncio AXA Remote classes.
+
+    None of the methods of this class perform any I/O. The communication with the window opener
+    is implemented as procedures, generators that yield the I/O calls they need. The blocking and
+    the asyncio classes run these procedures and perform the I/O calls with their own transport.
+    """
+
+    connection = None
     connected: bool = False
-    busy: bool = False
 
     device: str = None
     version: str = None
     unique_id: str = None
 
+    # Send the handshake commands back to back, disabled when the firmware drops pipelined input
+    pipeline_handshake: bool = True
+    # Refine the motion timings from the raw status changes observed while synchronising
+    learn_timings: bool = True
+
     # Time in seconds to close, lock, unlock and open the AXA Remote
     _time_unlock: float = 5
     _time_open: float = 42
@@ -142,17 +169,127 @@ class AXARemote(ABC):
     _position: float = 0.0  # 0.0 is closed, 100.0 is fully open
     _target_position: float = None
     _timestamp: float = None
+    # Moving average of the round trip time in seconds of the OPEN, STOP and CLOSE commands
+    _command_latency: float = None
+
+    # The full movement, OPEN from locked or CLOSE from open, of which the raw status changes are
+    # timed, when it started and when the raw status was last seen not to have changed
+    _edge_motion: str = None
+    _edge_start: float = None
+    _edge_sampled: float = None
+    # Time at which the window opener was closed and started locking
+    _edge_closed: float = None
+
+    # The command queue, raw status lock and poller classes of the transport
+    _queue_class: type
+    _lock_class: type
+    _poller_class: type
+    # Sleeps the given number of seconds on the clock, a coroutine function for asyncio
+    _sleep: Callable[[float], object]
+    # Pauses the I/O the given number of seconds of real time, a coroutine function for asyncio
+    _pause: Callable[[float], object]
 
     def __init__(
         self,
-        connection: AXAConnection,
+        connection,
+        handshake_cache: AXAHandshakeCache = None,
+        circuit_breaker: AXACircuitBreaker = None,
+        raw_status_ttl: float = None,
+        metrics: AXAMetrics = None,
+        profile_store: AXAProfileStore = None,
+        clock: AXAClock = None,
     ):
         """
         Initialises the AXARemote object.
+
+        All timing of the motion model uses the given clock, by default the monotonic clock of the
+        system, so it is not affected by changes of the wall clock.
+
+        If a raw status time to live in seconds is given the response on the STATUS command is
+        cached for this time and shared by all callers of raw_status() and sync_status().
+
+        If a profile store is given the timing profile of the window opener is loaded from the
+        store and stored again when calibrated or when the close time is set.
         """
         assert connection is not None
+        assert raw_status_ttl is None or raw_status_ttl >= 0
 
         self.connection = connection
+        self.clock = clock or AXAMonotonicClock()
+        self.handshake_cache = handshake_cache
+        self.circuit_breaker = circuit_breaker or AXACircuitBreaker(clock=self.clock)
+        self.profile_store = profile_store
+
+        self._protocol = AXAProtocol()
+
+        # A metrics registry can be shared by many window openers
+        self.metrics = metrics or AXAMetrics()
+        self._metric_labels = (("device", str(self.unique_id or connection)),)
+        self._metric_command_labels = {}
+
+        self.raw_status_ttl = raw_status_ttl
+        self._raw_status_cache = None
+        self._raw_status_generation = 0
+
+        # Callbacks that are called when a command changed the presumed status
+        self._command_listeners = []
+        self._subscriptions = AXASubscriptions(self.clock)
+
+        self._estimator = AXAPositionEstimator()
+        # Guards the presumed status and position, they are updated by the poller and the timed
+        # STOP command from other threads
+        self._state_lock = threading.RLock()
+
+        self._queue = self._queue_class()
+        self._raw_status_lock = self._lock_class()
+        self._stop_timer = None
+        self._poller = None
+
+        self._load_timing_profile()
+
+    @property
+    def moving(self) -> bool:
+        """If the window opener is presumed to be moving"""
+        return self._status in [
+            AXAStatus.UNLOCKING,
+            AXAStatus.OPENING,
+            AXAStatus.CLOSING,
+            AXAStatus.LOCKING,
+        ]
+
+    def circuit_breaker_statistics(self) -> dict:
+        """
+        Returns the state and counters of the circuit breaker that guards the communication with
+        an offline window opener.
+        """
+        return self.circuit_breaker.statistics()
+
+    def _command_labels(self, command: str) -> tuple:
+        labels = self._metric_command_labels.get(command)
+        if labels is None:
+            labels = self._metric_labels + (("command", command),)
+            self._metric_command_labels[command] = labels
+
+        return labels
+
+    def _count(self, name: str, command: str = None, value: float = 1) -> None:
+        """
+        Increments the given counter for this window opener and optionally the given command.
+        """
+        labels = (
+            self._metric_labels if command is None else self._command_labels(command)
+        )
+        self.metrics.inc(name, labels, value)
+
+    def _observe(self, name: str, seconds: float, command: str = None) -> None:
+        """
+        Adds a latency to the given histogram for this window opener and optionally the given
+        command.
+        """
+        labels = (
+            self._metric_labels if command is None else self._command_labels(command)
+        )
+        self.metrics.observe(name, seconds, labels)
 
     def _is_initialised(self) -> bool:
         if self.version is None:
@@ -168,233 +305,208 @@ class AXARemote(ABC):
         """
         assert 0.0 <= position <= 100.0
 
-        self._position = position
-
-        if self._position == 0.0:
-            self._status = AXAStatus.LOCKED
-        elif self._position == 100.0:
-            self._status = AXAStatus.OPEN
-        else:
-            self._status = AXAStatus.STOPPED
-
-    def _connect(self) -> bool:
-        if self.connection and not self.connection.is_open:
-            logger.info("Connecting to %s", self.connection)
-            try:
-                self.connection.open()
-                self.connection.write(b"\r\n")
-                self.connection.reset()
-            except AXAConnectionError as ex:
-                logger.error(
-                    "Problem communicating with %s, reason: %s", self.connection, ex
-                )
-                return False
-
-        if self.connection and self.connection.is_open:
-            return True
+        with self._state_lock:
+            self._position = position
+            self._estimator.set(position)
 
-        return False
+            if self._position == 0.0:
+                self._status = AXAStatus.LOCKED
+            elif self._position == 100.0:
+                self._status = AXAStatus.OPEN
+            else:
+                self._status = AXAStatus.STOPPED
 
-    def connect(self) -> bool:
-        # pylint: disable=too-many-return-statements
+    def _set_device(self, response: AXAResponse) -> bool:
         """
-        Connect to the window opener.
+        Handles the response on the DEVICE command.
         """
-        if not self._connect():
+        if response.status != AXARawStatus.DEVICE:
             return False
+        self.device = response.payload
 
-        if self._is_initialised():
-            return True
+        return True
 
-        try:
-            response = self._send_command("DEVICE")
-            response = self._split_response(response)
-            if response[0] != AXARawStatus.DEVICE:
-                return False
-            self.device = response[1]
+    def _set_version(self, response: AXAResponse) -> bool:
+        """
+        Handles the response on the VERSION command.
+        """
+        if response.status != AXARawStatus.VERSION:
+            return False
+        self.version = response.payload.split(maxsplit=1)[1]
 
-            response = self._send_command("VERSION")
-            response = self._split_response(response)
-            if response[0] != AXARawStatus.VERSION:
-                return False
-            self.version = response[1].split(maxsplit=1)[1]
+        return True
 
-            raw_status = self.raw_status()[0]
+    def _set_initial_status(self, raw_status: AXARawStatus) -> bool:
+        """
+        Sets the presumed status based on the raw status when connecting to the window opener.
+        """
+        with self._state_lock:
             if raw_status == AXARawStatus.STRONG_LOCKED:
                 self._status = AXAStatus.LOCKED
                 self._position = 0.0
+                self._estimator.locked(self.clock.time())
             elif raw_status == AXARawStatus.WEAK_LOCKED:
                 # Currently handling this state as if it's Strong Locked
                 self._status = AXAStatus.LOCKED
                 self._position = 0.0
+                self._estimator.locked(self.clock.time())
             elif raw_status == AXARawStatus.UNLOCKED:
+                # Presumed to be open, but the window could be anywhere
                 self._status = AXAStatus.OPEN
                 self._position = 100.0
+                self._estimator.set(100.0, 0.0, 100.0)
             else:
                 return False
 
             return True
-        except AXAConnectionError as ex:
-            logger.error(
-                "Problem communicating with %s, reason: %s", self.connection, ex
-            )
-        except AXARemoteError as ex:
-            logger.error(ex)
-
-        return False
 
-    def disconnect(self) -> bool:
+    def _handshake(
+        self, device: AXAResponse, version: AXAResponse, status: AXAResponse
+    ) -> bool:
         """
-        Disconnect from the window opener.
+        Handles the responses on the DEVICE, VERSION and STATUS commands.
         """
-        if self.connection is not None:
-            self.connection.close()
-            self.connection = None
+        if not self._set_device(device):
+            return False
 
-        return True
+        if not self._set_version(version):
+            return False
 
-    def _send_command(self, command: str) -> str | None:
+        return self._set_initial_status(status.status)
+
+    def _cached_handshake(self) -> tuple[str, str] | None:
         """
-        Send a command to the AXA Remote.
+        Returns the cached device and version of the window opener, if available.
         """
-        if not self._connect():
-            logger.error("Device is offline")
-            self.connected = False
+        if self.handshake_cache is None or self.unique_id is None:
             return None
 
-        start_time = time.time()
-        while self.busy is True:
-            if time.time() - start_time > _BUSY_TIMEOUT:
-                raise TooBusyError(command)
-            logger.debug("Busy")
-            time.sleep(0.05)
-        self.busy = True
+        return self.handshake_cache.get(self.unique_id)
 
-        try:
-            command = command.upper()
-            logger.debug("Command: '%s'", command)
-            self.connection.write(f"{command}\r\n".encode("ascii"))
-            self.connection.flush()
+    def _set_cached_handshake(
+        self, cached: tuple[str, str], raw_status: AXARawStatus
+    ) -> bool:
+        """
+        Uses the cached device and version if the window opener responds to the STATUS command
+        as expected. The cache entry is invalidated if the window opener gives an unexpected
+        response, a full handshake then updates the cache.
+        """
+        if raw_status is None:
+            return False
 
-            empty_line_count = 0
-            echo_received = None
-            while True:
-                if empty_line_count > 5:
-                    if not self._is_initialised():
-                        logger.error(
-                            "More than 5 empty responses, is your cable right?"
-                        )
-                    self.connection.write(b"\r\n")
-                    self.connection.reset()
-                    raise EmptyResponseError(command)
-
-                response = self.connection.readline()
-                response = response.decode(errors="ignore").strip(" \n\r")
-                if response == "":
-                    # Sometimes we first receive an empty line
-                    logger.debug("Empty line")
-                    empty_line_count += 1
-                    time.sleep(0.05)
-                    continue
+        if raw_status not in [
+            AXARawStatus.UNLOCKED,
+            AXARawStatus.STRONG_LOCKED,
+            AXARawStatus.WEAK_LOCKED,
+        ]:
+            logger.info("Cached handshake of %s does not match", self.unique_id)
+            self.handshake_cache.invalidate(self.unique_id)
+            return False
 
-                if not echo_received and response == command:
-                    # Command echo
-                    logger.debug("Command successfully sent")
-                    echo_received = True
-                    empty_line_count = 0
-                    continue
+        self.device, self.version = cached
 
-                if not echo_received:
-                    logger.warning(
-                        "No command echo received, response: %s", repr(response)
-                    )
-                    raise InvallidResponseError(command, response)
-
-                logger.debug("Response: %s", repr(response))
-                return response
-        except UnicodeDecodeError as ex:
-            logger.warning(
-                "Error during response decode, invalid response: %s, reason: %s",
-                repr(response),
-                ex,
-            )
-            raise InvallidResponseError(command, response) from ex
-        except AXAConnectionError as ex:
-            logger.error(
-                "Problem communicating with %s, reason: %s", self.connection, ex
-            )
+        return self._set_initial_status(raw_status)
+
+    def _save_handshake(self) -> None:
+        """
+        Stores the device and version of the window opener in the handshake cache.
+        """
+        if self.handshake_cache is not None and self.unique_id is not None:
+            self.handshake_cache.set(self.unique_id, self.device, self.version)
+
+    def _cached_raw_status(self) -> tuple[float, AXAResponse] | None:
+        """
+        Returns the time the cached response on the STATUS command was received and the response,
+        if not expired.
+        """
+        if self._raw_status_cache is None:
             return None
-        finally:
-            self.busy = False
 
-    def _split_response(self, response: str):
-        if response is not None:
-            result = response.split(maxsplit=1)
-            if len(result) == 2:
-                try:
-                    if result[0].isdigit():
-                        result[0] = AXARawStatus(int(result[0]))
-                except ValueError as ex:
-                    logger.warning(ex)
-                return result
+        sampled, _ = self._raw_status_cache
+        if self.clock.time() - sampled > self.raw_status_ttl:
+            return None
+
+        return self._raw_status_cache
+
+    def _cache_raw_status(
+        self, sampled: float, response: AXAResponse, generation: int
+    ) -> None:
+        """
+        Caches the response on the STATUS command, unless a command changed the status of the
+        window opener while the STATUS command was in flight.
+        """
+        if generation != self._raw_status_generation:
+            return
+        if not isinstance(response.status, AXARawStatus):
+            return
 
-        return (None, response)
+        self._raw_status_cache = (sampled, response)
 
-    def _update(self) -> None:
+    def _invalidate_raw_status(self, commands: list[str]) -> None:
+        """
+        Invalidates the cached raw status if one of the given commands changes the status of the
+        window opener.
+        """
+        if any(command in _MOTION_COMMANDS for command in commands):
+            self._raw_status_generation += 1
+            self._raw_status_cache = None
+
+    def _update_position(self) -> str | None:
         """
         Calculates the position of the window opener based on the direction the window opener is
         moving.
+
+        Returns the command that needs to be send to reach the target position, if any.
         """
-        if self._status in [
-            AXAStatus.LOCKED,
-            AXAStatus.STOPPED,
-            AXAStatus.OPEN,
-        ]:
-            # Nothing to calculate here.
-            if self._target_position is not None:
-                try:
+        with self._state_lock:
+            if self._status is None:
+                # The window opener has not been synchronised yet.
+                return None
+
+            if self._status in [
+                AXAStatus.LOCKED,
+                AXAStatus.STOPPED,
+                AXAStatus.OPEN,
+            ]:
+                # Nothing to calculate here.
+                if self._target_position is not None:
                     if self._position < self._target_position:
-                        self._open()
-                    elif self._position > self._target_position:
-                        self._close()
-                except AXARemoteError as ex:
-                    logger.error(
-                        "Problem communicating with %s, reason: %s", self.connection, ex
-                    )
-            return
-
-        time_passed = time.time() - self._timestamp
-        if self._status == AXAStatus.UNLOCKING:
-            if time_passed < self._time_unlock:
-                self._position = (time_passed / self._time_unlock) * 100.0
-            else:
-                self._status = AXAStatus.OPENING
-        if self._status == AXAStatus.OPENING:
-            self._position = (
-                (time_passed - self._time_unlock) / self._time_open
-            ) * 100.0
-            if time_passed > (self._time_unlock + self._time_open):
-                self._status = AXAStatus.OPEN
-                self._position = 100.0
+                        return "OPEN"
+                    if self._position > self._target_position:
+                        return "CLOSE"
+                return None
+
+            time_passed = self.clock.time() - self._timestamp
+            if self._status == AXAStatus.UNLOCKING:
+                if time_passed < self._time_unlock:
+                    self._position = (time_passed / self._time_unlock) * 100.0
+                else:
+                    self._status = AXAStatus.OPENING
+            if self._status == AXAStatus.OPENING:
+                self._position = (
+                    (time_passed - self._time_unlock) / self._time_open
+                ) * 100.0
+                if time_passed > (self._time_unlock + self._time_open):
+                    self._status = AXAStatus.OPEN
+                    self._position = 100.0
 
-        if self._status == AXAStatus.CLOSING:
-            if time_passed < self._time_close:
-                self._position = 100 - ((time_passed / self._time_close) * 100.0)
-            else:
-                self._status = AXAStatus.LOCKING
-                self._target_position = None
-        if self._status == AXAStatus.LOCKING:
-            self._position = 100 - (
-                ((time_passed - self._time_close) / self._time_lock) * 100.0
-            )
-            if time_passed > (self._time_close + self._time_lock):
-                self._status = AXAStatus.LOCKED
-                self._position = 0.0
+            if self._status == AXAStatus.CLOSING:
+                if time_passed < self._time_close:
+                    self._position = 100 - ((time_passed / self._time_close) * 100.0)
+                else:
+                    self._status = AXAStatus.LOCKING
+                    self._target_position = None
+            if self._status == AXAStatus.LOCKING:
+                self._position = 100 - (
+                    ((time_passed - self._time_close) / self._time_lock) * 100.0
+                )
+                if time_passed > (self._time_close + self._time_lock):
+                    self._status = AXAStatus.LOCKED
+                    self._position = 0.0
 
-        logger.debug("%s: %5.1f %%", self._status, self._position)
+            logger.debug("%s: %5.1f %%", self._status, self._position)
 
-        if self._target_position is not None:
-            try:
+            if self._target_position is not None:
                 if (
                     self._status == AXAStatus.OPENING
                     and self._position > self._target_position
@@ -402,160 +514,383 @@ class AXARemote(ABC):
                     self._status == AXAStatus.CLOSING
                     and self._position < self._target_position
                 ):
-                    self._stop()
-            except AXARemoteError as ex:
-                logger.error(
-                    "Problem communicating with %s, reason: %s", self.connection, ex
-                )
+                    return "STOP"
 
-    def _open(self) -> bool:
+            return None
+
+    def _opened(self) -> None:
         """
-        Open the window.
+        Updates the presumed status after the window opener accepted the OPEN command.
         """
-        response = self._send_command("OPEN")
-        response = self._split_response(response)
-
-        if response[0] == AXARawStatus.OK:
+        with self._state_lock:
             if self._status == AXAStatus.LOCKED:
-                self._timestamp = time.time()
+                self._timestamp = self.clock.time()
                 self._status = AXAStatus.UNLOCKING
+                self._start_edge_timing("OPEN")
+                self._estimator.start(
+                    OPENING, self._timestamp, self._time_open, self._time_unlock
+                )
             elif self._status == AXAStatus.STOPPED:
-                self._timestamp = time.time() - (
+                self._timestamp = self.clock.time() - (
                     self._time_unlock + (self._time_open * (self._position / 100))
                 )
                 self._status = AXAStatus.OPENING
-            return True
+                self._start_edge_timing(None)
+                self._estimator.start(OPENING, self.clock.time(), self._time_open)
 
-        return False
+        self._notify_command_listeners()
 
-    def open(self) -> bool:
+    def _stopped(self) -> None:
         """
-        Opens the window opener.
+        Updates the presumed status after the window opener accepted the STOP command.
         """
-        self._target_position = 100.0
-        return self._open()
+        with self._state_lock:
+            if self._status in [AXAStatus.OPENING, AXAStatus.CLOSING]:
+                self._status = AXAStatus.STOPPED
+                self._start_edge_timing(None)
+                self._estimator.stop(self.clock.time(), self._command_latency or 0.0)
+
+            self._target_position = None
 
-    def _stop(self) -> bool:
+        self._notify_command_listeners()
+
+    def _closed(self) -> None:
         """
-        Stop the window.
+        Updates the presumed status after the window opener accepted the CLOSE command.
         """
-        if self._status == AXAStatus.LOCKING:
-            return True
+        with self._state_lock:
+            if self._status == AXAStatus.OPEN:
+                self._timestamp = self.clock.time()
+                self._status = AXAStatus.CLOSING
+                self._start_edge_timing("CLOSE")
+                self._estimator.start(CLOSING, self._timestamp, self._time_close)
+            elif self._status == AXAStatus.STOPPED:
+                self._timestamp = self.clock.time() - (
+                    self._time_close * ((100 - self._position) / 100)
+                )
+                self._status = AXAStatus.CLOSING
+                self._start_edge_timing(None)
+                self._estimator.start(CLOSING, self.clock.time(), self._time_close)
 
-        response = self._send_command("STOP")
-        response = self._split_response(response)
+        self._notify_command_listeners()
 
-        if response[0] == AXARawStatus.OK:
-            if self._status in [AXAStatus.OPENING, AXAStatus.CLOSING]:
-                self._status = AXAStatus.STOPPED
+    def _stop_delay(self) -> float | None:
+        """
+        Returns the number of seconds after which the STOP command has to be send for the window
+        opener to stop at the target position, or None if the window opener does not need to be
+        stopped.
+
+        The presumed movement starts when the window opener acknowledged the command, about half a
+        round trip after the actual movement started, and the STOP command takes another half a
+        round trip to reach the window opener. One round trip is subtracted so the window opener
+        stops at the target position.
+        """
+        with self._state_lock:
+            if self._target_position is None or not 0.0 < self._target_position < 100.0:
+                return None
 
-            self._target_position = None
+            if self._status in [AXAStatus.UNLOCKING, AXAStatus.OPENING]:
+                stop_time = (
+                    self._time_unlock + self._time_open * self._target_position / 100
+                )
+            elif self._status == AXAStatus.CLOSING:
+                stop_time = self._time_close * (100 - self._target_position) / 100
+            else:
+                return None
 
-            return True
+            time_passed = self.clock.time() - self._timestamp
+            return max(0.0, stop_time - time_passed - (self._command_latency or 0.0))
 
-        return False
+    def _update_command_latency(self, round_trip_time: float) -> None:
+        """
+        Updates the moving average of the OPEN, STOP and CLOSE command round trip time.
+        """
+        if self._command_latency is None:
+            self._command_latency = round_trip_time
+        else:
+            self._command_latency += _COMMAND_LATENCY_ALPHA * (
+                round_trip_time - self._command_latency
+            )
 
-    def stop(self) -> bool:
+    def add_command_listener(self, listener: Callable[[], None]) -> None:
         """
-        Stops the window opening.
+        Adds a callback that is called when an OPEN, STOP or CLOSE command changed the presumed
+        status of the window opener.
         """
-        self._target_position = self._position
-        return self._stop()
+        self._command_listeners.append(listener)
 
-    def _close(self) -> bool:
+    def remove_command_listener(self, listener: Callable[[], None]) -> None:
         """
-        Close the window.
+        Removes a callback added by add_command_listener(), if added.
         """
-        response = self._send_command("CLOSE")
-        response = self._split_response(response)
+        if listener in self._command_listeners:
+            self._command_listeners.remove(listener)
 
-        if response[0] == AXARawStatus.OK:
-            if self._status == AXAStatus.OPEN:
-                self._timestamp = time.time()
-                self._status = AXAStatus.CLOSING
-            elif self._status == AXAStatus.STOPPED:
-                self._timestamp = time.time() - (
-                    self._time_close * ((100 - self._position) / 100)
+    def _notify_command_listeners(self) -> None:
+        for listener in list(self._command_listeners):
+            listener()
+
+    def _predicted_transitions(self) -> list[float]:
+        """
+        Returns the times, relative to the start of the current movement, at which the raw status
+        or the presumed status is predicted to change.
+        """
+        transitions = []
+        if self._status == AXAStatus.UNLOCKING:
+            # Raw status changes to unlocked
+            transitions.append(self._time_unlock)
+        elif self._status == AXAStatus.OPENING:
+            # Raw status changes to unlocked, when the prediction was early
+            transitions.append(self._time_unlock)
+            # Window opener is fully open
+            transitions.append(self._time_unlock + self._time_open)
+            if self._target_position is not None:
+                transitions.append(
+                    self._time_unlock + self._time_open * self._target_position / 100
                 )
-                self._status = AXAStatus.CLOSING
+        elif self._status == AXAStatus.CLOSING:
+            # Raw status changes to locked
+            transitions.append(self._time_close)
+            if self._target_position is not None:
+                transitions.append(
+                    self._time_close * (100 - self._target_position) / 100
+                )
+        elif self._status == AXAStatus.LOCKING:
+            # Raw status changes to locked, when the prediction was early
+            transitions.append(self._time_close)
+            # Raw status changes from weak locked to strong locked
+            transitions.append(self._time_close + self._time_lock)
 
-            return True
+        return transitions
 
-        return False
+    def next_poll_interval(self) -> float:
+        """
+        Returns the number of seconds after which the status of the window opener should be
+        synchronised again.
 
-    def close(self) -> bool:
+        The status is polled rarely while the window opener is idle or half way a movement and
+        densely around the predicted status transitions, like the end of unlocking, the end of
+        closing and reaching the target position.
         """
-        Closes the window opener.
+        with self._state_lock:
+            if self._status is None:
+                # The window opener has not been synchronised yet.
+                return _POLL_INTERVAL_EDGE
+
+            self._update_position()
+
+            transitions = self._predicted_transitions()
+            if not transitions:
+                return _POLL_INTERVAL_IDLE
+
+            time_passed = self.clock.time() - self._timestamp
+            interval = _POLL_INTERVAL_TRAVEL
+            for transition in transitions:
+                time_to_transition = transition - time_passed
+                if abs(time_to_transition) <= _POLL_EDGE_WINDOW:
+                    return _POLL_INTERVAL_EDGE
+                if time_to_transition > 0:
+                    interval = min(interval, time_to_transition - _POLL_EDGE_WINDOW)
+
+            return max(_POLL_INTERVAL_EDGE, interval)
+
+    def _set_target_position(self, target_position: float) -> str | None:
+        """
+        Sets the target position and returns the command needed to start moving towards it.
         """
-        self._target_position = 0.0
-        return self._close()
+        with self._state_lock:
+            assert 0.0 <= target_position <= 100.0
+
+            if int(target_position) == 0:
+                self._target_position = 0.0
+                return "CLOSE"
+            if int(target_position) == 100:
+                self._target_position = 100.0
+                return "OPEN"
+            if int(self._position) == int(target_position):
+                return None
+            if self._position < target_position:
+                self._target_position = target_position
+                return "OPEN"
+            if self._position > target_position:
+                self._target_position = target_position
+                return "CLOSE"
 
-    def set_position(self, target_position: float) -> None:
+            return None
+
+    @property
+    def timing_profile(self) -> AXATimingProfile:
+        """The time in seconds to unlock, open, close and lock the window opener"""
+        return AXATimingProfile(
+            self._time_unlock, self._time_open, self._time_close, self._time_lock
+        )
+
+    def _set_timing_profile(self, profile: AXATimingProfile) -> None:
+        assert profile is not None
+        assert profile.time_open > 0
+        assert profile.time_close > 0
+
+        self._time_unlock = profile.time_unlock
+        self._time_open = profile.time_open
+        self._time_close = profile.time_close
+        self._time_lock = profile.time_lock
+
+    def set_timing_profile(self, profile: AXATimingProfile) -> None:
         """
-        Initiates the window opener to move to a given position.
+        Sets the time in seconds to unlock, open, close and lock the window opener, as measured by
+        calibrate(), and stores it in the profile store.
+        """
+        self._set_timing_profile(profile)
+        self._store_timing_profile()
+
+    def _store_timing_profile(self, profile: AXATimingProfile = None) -> None:
+        """
+        Stores the given timing profile, or the current one, in the profile store.
 
-        sync_status() needs to be called regularly to calculate the current position and stop the
-        move once the given position is reaced.
+        Storing writes a file, do not call this while holding the state lock.
         """
-        assert 0.0 <= target_position <= 100.0
+        if self.profile_store is not None and self.unique_id is not None:
+            self.profile_store.set(
+                self.unique_id, self.timing_profile if profile is None else profile
+            )
 
-        if int(target_position) == 0:
-            self.close()
-        elif int(target_position) == 100:
-            self.open()
-        elif int(self._position) == int(target_position):
+    def _load_timing_profile(self) -> None:
+        """
+        Loads the timing profile of the window opener from the profile store, if stored.
+        """
+        if self.profile_store is None or self.unique_id is None:
             return
-        elif self._position < target_position:
-            self._target_position = target_position
-            self._open()
-        elif self._position > target_position:
-            self._target_position = target_position
-            self._close()
+
+        profile = self.profile_store.get(self.unique_id)
+        if profile is not None:
+            logger.debug("Loaded timing profile of %s: %s", self.unique_id, profile)
+            self._set_timing_profile(profile)
 
     def set_close_time(self, close_time: float):
         """
         Sets the time needed to close the window from fully open to locked.
 
-        This time is used to calculate the unlock, open and lock times.
+        This time is split into the close and lock times and used to calculate the unlock and open
+        times, proportional to the current timing profile.
         """
         assert close_time is not None
         assert close_time > 0
 
-        self._time_unlock = 0
-        self._time_open = 0
-        self._time_close = close_time
-        self._time_lock = 0
+        self.set_timing_profile(self.timing_profile.scaled(close_time))
 
-    def raw_status(self) -> AXARawStatus:
+    def _calibrated(self, profiles: list[AXATimingProfile]) -> AXATimingProfile:
         """
-        Returns the status as given by the AXA Remote.
+        Sets the average of the timing profiles measured by the calibration runs, after which the
+        window opener is locked.
         """
-        response = self._send_command("STATUS")
-        response = self._split_response(response)
+        profile = average_profiles(profiles)
+        logger.info("Calibrated timing profile: %s", profile)
+        with self._state_lock:
+            self._set_timing_profile(profile)
 
-        return response
+            self._start_edge_timing(None)
+            self._estimator.locked(self.clock.time())
+            self._status = AXAStatus.LOCKED
+            self._position = 0.0
+            self._target_position = None
 
-    def sync_status(self) -> None:
+        # Stored outside of the state lock, storing locks and writes a file
+        self._store_timing_profile(profile)
+
+        return profile
+
+    def _start_edge_timing(self, motion: str | None) -> None:
         """
-        Synchronises the raw state with the presumed state.
+        Starts timing the raw status changes of the given full movement, or stops timing if None.
         """
-        if not self.connect():
-            # Device is offline
-            if self.connected:
-                logger.debug("Device is offline")
-            else:
-                logger.debug("Device is still offline")
-            self.connected = False
-            return self.status()
+        self._edge_motion = motion if self.learn_timings else None
+        self._edge_start = self.clock.time()
+        self._edge_sampled = self._edge_start
+        self._edge_closed = None
 
-        self.connected = True
+    def _learn_time(self, name: str, measured: float) -> bool:
+        """
+        Updates the moving average of the given motion time with the measured time.
+        """
+        current = getattr(self, name)
+        if (
+            not current / _LEARNING_MAX_FACTOR
+            <= measured
+            <= current * _LEARNING_MAX_FACTOR
+        ):
+            logger.debug("Ignoring %s of %.2f seconds", name, measured)
+            return False
 
-        try:
-            raw_state = self.raw_status()[0]
+        setattr(self, name, current + _LEARNING_ALPHA * (measured - current))
+        logger.debug("Learned %s of %.2f seconds", name, getattr(self, name))
+
+        return True
+
+    def _learn_timings(self, raw_state: AXARawStatus, sampled: float) -> bool:
+        """
+        Refines the unlock, close and lock times from the moment the raw status changed, taken as
+        the midpoint between the last poll before and the first poll after the change.
+
+        The given raw state is the one received at the given time, which is earlier than now if
+        the raw state was cached.
+
+        The end of opening can not be observed, the open time follows the close time like it does
+        when calibrating.
+
+        Returns whether a time was learned, the caller stores the timing profile.
+        """
+        if self._edge_motion is None or sampled <= self._edge_sampled:
+            # Not timing a movement, or a cached raw state that has been learned from already
+            return False
+
+        edge = (self._edge_sampled + sampled) / 2
+        accurate = sampled - self._edge_sampled <= _LEARNING_MAX_GAP
+        self._edge_sampled = sampled
+
+        learned = False
+        if self._edge_motion == "OPEN":
+            if raw_state == AXARawStatus.UNLOCKED:
+                if accurate:
+                    learned = self._learn_time("_time_unlock", edge - self._edge_start)
+                self._edge_motion = None
+        elif self._edge_closed is None:
+            if raw_state == AXARawStatus.WEAK_LOCKED and not accurate:
+                self._edge_motion = None
+            elif raw_state == AXARawStatus.WEAK_LOCKED:
+                time_close = edge - self._edge_start
+                if self._learn_time("_time_close", time_close):
+                    self._learn_time("_time_open", time_close)
+                    learned = True
+                self._edge_closed = edge
+            elif raw_state == AXARawStatus.STRONG_LOCKED:
+                # Closing and locking both ended since the last poll
+                self._edge_motion = None
+        elif raw_state == AXARawStatus.STRONG_LOCKED:
+            if accurate:
+                learned = self._learn_time("_time_lock", edge - self._edge_closed)
+            self._edge_motion = None
+
+        return learned
+
+    def _synchronise(self, raw_state: AXARawStatus, sampled: float = None) -> None:
+        """
+        Synchronises the presumed state with the given raw state, received at the given time or
+        just now.
+        """
+        with self._state_lock:
             logger.debug("Raw state: %s", raw_state)
             logger.debug("Presumed state: %s", self._status)
             if raw_state is None:
-                return self.status()
+                return
+
+            learned = self._learn_timings(
+                raw_state, self.clock.time() if sampled is None else sampled
+            )
+            profile = self.timing_profile if learned else None
+            if raw_state in [AXARawStatus.STRONG_LOCKED, AXARawStatus.WEAK_LOCKED]:
+                self._estimator.locked(self.clock.time())
+            elif raw_state == AXARawStatus.UNLOCKED:
+                self._estimator.unlocked(self.clock.time())
 
             if self._target_position is None:
                 if (
@@ -565,7 +900,7 @@ class AXARemote(ABC):
                     logger.info(
                         "Raw state and presumed state not in sync, synchronising"
                     )
-                    self._timestamp = time.time() - self._time_unlock
+                    self._timestamp = self.clock.time() - self._time_unlock
                     self._status = AXAStatus.OPENING
                     self._position = 0.0
                 elif self._status == AXAStatus.OPEN and raw_state in [
@@ -575,7 +910,7 @@ class AXARemote(ABC):
                     logger.info(
                         "Raw state and presumed state not in sync, synchronising"
                     )
-                    self._timestamp = time.time() - self._time_close
+                    self._timestamp = self.clock.time() - self._time_close
                     self._status = AXAStatus.LOCKING
                     self._position = 0.0
                 self._target_position = None
@@ -590,7 +925,7 @@ class AXARemote(ABC):
                     raw_state in [AXARawStatus.STRONG_LOCKED, AXARawStatus.WEAK_LOCKED]
                     and self._status == AXAStatus.CLOSING
                 ):
-                    self._timestamp = time.time() - self._time_close
+                    self._timestamp = self.clock.time() - self._time_close
                     self._status = AXAStatus.LOCKING
                     self._position = 0.0
                     self._target_position = None
@@ -622,66 +957,815 @@ class AXARemote(ABC):
                     )
                     self._status = AXAStatus.OPEN
                     self._position = 100.0
+
+        if profile is not None:
+            # Stored outside of the state lock, storing locks and writes a file
+            self._store_timing_profile(profile)
+
+    def position(self) -> float:
+        """
+        Returns the current position of the window opener where 0.0 is totally closed and 100.0 is
+        fully open.
+
+        This is the presumed position of the state machine, the progress of the current movement
+        calculated from the moment the window opener accepted the command. It is used to reach
+        the target position and is the position to restore with restore_position().
+
+        Where the window actually is, is given by position_estimate(), which is authoritative. The
+        two can differ. For example, if the window opener was unlocked by other means, this
+        position presumes the window is opening from closed. The estimate only knows the window is
+        somewhere between closed and fully open.
+        """
+        return self._position
+
+    def position_estimate(self) -> AXAPositionEstimate:
+        """
+        Returns the estimated position of the window and the interval in which the position is
+        known to be.
+
+        The interval widens while the window moves and collapses when the window opener reports
+        it is locked or has just unlocked. This is the authoritative position of the window, see
+        position().
+        """
+        return self._estimator.estimate(self.clock.time())
+
+    def needs_resync(self, max_uncertainty: float = 10.0) -> bool:
+        """
+        Returns if the uncertainty of the estimated position, in percent, exceeds the given maximum.
+        The position is known exactly again after closing the window opener.
+        """
+        return self.position_estimate().uncertainty > max_uncertainty
+
+    @property
+    def busy(self) -> bool:
+        """If a command is being processed"""
+        return self._queue.locked
+
+    def queue_statistics(self) -> dict:
+        """
+        Returns the statistics of the command queue, like the queue depth and the time commands
+        had to wait before they could be send.
+        """
+        return self._queue.statistics()
+
+    @staticmethod
+    def _resume(
+        procedure: _AXAProcedure, result=None, error: BaseException = None
+    ) -> _AXAStep:
+        """
+        Resumes the given procedure with the result or the error of its last I/O call and returns
+        the next I/O call it requests, or its result once it is done.
+        """
+        try:
+            if error is not None:
+                function, *args = procedure.throw(error)
+            else:
+                function, *args = procedure.send(result)
+        except StopIteration as ex:
+            return _AXAStep(result=ex.value)
+
+        return _AXAStep(function, tuple(args))
+
+    @abstractmethod
+    def _start_stop_timer(self, delay: float):
+        """
+        Starts a timer that runs the timed STOP procedure after the given delay and returns it.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _stop_poller(self, poller) -> None:
+        """
+        Stops the given background poller.
+        """
+        raise NotImplementedError
+
+    def _open_connection_procedure(self) -> _AXAProcedure:
+        """
+        Opens the connection to the window opener, if not open yet.
+        """
+        if self.connection and not self.connection.is_open:
+            logger.info("Connecting to %s", self.connection)
+            try:
+                yield (self.connection.open,)
+                yield (self.connection.write, b"\r\n")
+                yield (self.connection.reset,)
+            except AXAConnectionError as ex:
+                logger.error(
+                    "Problem communicating with %s, reason: %s", self.connection, ex
+                )
+                self._count("axaremote_connects_failed_total")
+                return False
+            self._count("axaremote_connects_total")
+
+        if self.connection and self.connection.is_open:
+            return True
+
+        return False
+
+    def _connect_procedure(self) -> _AXAProcedure:
+        """
+        Connects to the window opener and performs the handshake, if not done yet.
+        """
+        if not (yield from self._open_connection_procedure()):
+            return False
+
+        if self._is_initialised():
+            return True
+
+        try:
+            if (yield from self._cached_handshake_procedure()):
+                return True
+
+            result = None
+            if self.pipeline_handshake:
+                result = yield from self._pipelined_handshake_procedure()
+            if result is None:
+                result = yield from self._sequential_handshake_procedure()
+            if result:
+                self._save_handshake()
+
+            return result
+        except AXAConnectionError as ex:
+            logger.error(
+                "Problem communicating with %s, reason: %s", self.connection, ex
+            )
+        except AXARemoteError as ex:
+            logger.error(ex)
+
+        return False
+
+    def _cached_handshake_procedure(self) -> _AXAProcedure:
+        """
+        Only requests the status of the window opener if the device and version are cached.
+        """
+        cached = self._cached_handshake()
+        if cached is None:
+            return False
+
+        try:
+            raw_status = (yield from self._raw_status_procedure())[0]
+        except InvallidResponseError as ex:
+            logger.info(ex)
+            yield (self.connection.reset,)
+            raw_status = None
+        except EmptyResponseError as ex:
+            logger.info(ex)
+            raw_status = None
+
+        return self._set_cached_handshake(cached, raw_status)
+
+    def _sequential_handshake_procedure(self) -> _AXAProcedure:
+        """
+        Sends the DEVICE, VERSION and STATUS commands one after another.
+        """
+        if not self._set_device((yield from self._send_command_procedure("DEVICE"))):
+            return False
+
+        if not self._set_version((yield from self._send_command_procedure("VERSION"))):
+            return False
+
+        return self._set_initial_status((yield from self._raw_status_procedure())[0])
+
+    def _pipelined_handshake_procedure(self) -> _AXAProcedure:
+        """
+        Writes the DEVICE, VERSION and STATUS commands back to back and then reads the echoes and
+        responses in order.
+
+        Returns None if the firmware does not handle pipelined commands, in which case the
+        sequential handshake is used from then on.
+        """
+        try:
+            responses = yield from self._send_commands_procedure(
+                _PIPELINED_HANDSHAKE, _PIPELINED_MAX_EMPTY_LINES
+            )
         except (InvallidResponseError, EmptyResponseError) as ex:
+            logger.info(
+                "Pipelined handshake failed, falling back to sequential handshake: %s",
+                ex,
+            )
+            self.pipeline_handshake = False
+            if self.connection is not None and self.connection.is_open:
+                yield (self.connection.reset,)
+            return None
+
+        return self._handshake(*responses)
+
+    def _disconnect_procedure(self) -> _AXAProcedure:
+        """
+        Stops the poller and closes the connection to the window opener.
+        """
+        self._cancel_stop()
+        if self._poller is not None:
+            poller, self._poller = self._poller, None
+            yield (poller.stop,)
+        if self.connection is not None:
+            yield (self.connection.close,)
+            self.connection = None
+
+        return True
+
+    def _send_command_procedure(self, command: str) -> _AXAProcedure:
+        """
+        Send a command to the AXA Remote.
+        """
+        return (yield from self._send_commands_procedure([command]))[0]
+
+    def _send_commands_procedure(
+        self, commands: list[str], max_empty_lines: int = MAX_EMPTY_LINES
+    ) -> _AXAProcedure:
+        """
+        Send one or more commands to the AXA Remote.
+
+        All commands are written back to back, after which the echoes and responses are read in
+        order.
+        """
+        if not (yield from self._open_connection_procedure()):
+            logger.error("Device is offline")
+            self.connected = False
+            return [NO_RESPONSE] * len(commands)
+
+        commands = [command.upper() for command in commands]
+        self._invalidate_raw_status(commands)
+        priority = min(
+            _PRIORITY_COMMANDS.get(command, PRIORITY_NORMAL) for command in commands
+        )
+        start = self.clock.time()
+        if not (yield (self._queue.acquire, priority)):
+            raise TooBusyError(commands[0])
+
+        try:
+            self._observe("axaremote_queue_wait_seconds", self.clock.time() - start)
+            logger.debug("Command: '%s'", "', '".join(commands))
+            data = self._protocol.send(commands, max_empty_lines)
+            yield (self.connection.write, data)
+            yield (self.connection.flush,)
+            self._queue.sent()
+            self._count("axaremote_bytes_sent_total", value=len(data))
+            for command in commands:
+                self._count("axaremote_commands_total", command)
+
+            return (yield from self._read_responses_procedure())
+        except AXAConnectionError as ex:
+            logger.error(
+                "Problem communicating with %s, reason: %s", self.connection, ex
+            )
+            self._count("axaremote_connection_errors_total")
+            return [NO_RESPONSE] * len(commands)
+        finally:
+            self._queue.release()
+
+    def _read_responses_procedure(self) -> _AXAProcedure:
+        """
+        Reads the echoes and the responses of the sent commands.
+        """
+        responses = []
+        start = self.clock.time()
+        try:
+            while self._protocol.pending:
+                command = self._protocol.command
+                event = self._protocol.receive_line((yield (self.connection.readline,)))
+                if event is EMPTY_LINE:
+                    self._count("axaremote_empty_lines_total", command)
+                    # Not on the clock, a virtual clock would run the due timers on this thread
+                    # while it holds the command queue
+                    yield (self._pause, 0.05)
+                elif event is not ECHO:
+                    self._observe(
+                        "axaremote_command_seconds", self.clock.time() - start, command
+                    )
+                    responses.append(event)
+        except InvallidResponseError as ex:
+            self._count("axaremote_invalid_responses_total", ex.command)
+            raise
+        except EmptyResponseError as ex:
+            self._count("axaremote_empty_responses_total", ex.command)
+            if not self._is_initialised() and not responses:
+                logger.error("More than 5 empty responses, is your cable right?")
+            yield (self.connection.write, b"\r\n")
+            yield (self.connection.reset,)
+            raise
+
+        return responses
+
+    def _command_procedure(self, command: str) -> _AXAProcedure:
+        """
+        Sends the OPEN, STOP or CLOSE command and updates the presumed status if the window opener
+        accepted it.
+        """
+        if command == "STOP" and self._status == AXAStatus.LOCKING:
+            return True
+
+        start = self.clock.time()
+        response = yield from self._send_command_procedure(command)
+
+        if response.status != AXARawStatus.OK:
+            return False
+
+        self._update_command_latency(self.clock.time() - start)
+        if command == "OPEN":
+            self._opened()
+        elif command == "STOP":
+            self._stopped()
+        else:
+            self._closed()
+
+        return True
+
+    def _move_procedure(self, command: str, target_position: float) -> _AXAProcedure:
+        """
+        Cancels the timed STOP command and sends the OPEN, STOP or CLOSE command to move to the
+        given target position.
+        """
+        self._cancel_stop()
+        self._target_position = target_position
+        return (yield from self._command_procedure(command))
+
+    def _set_position_procedure(self, target_position: float) -> _AXAProcedure:
+        """
+        Starts moving to the given position and schedules the STOP command.
+        """
+        self._cancel_stop()
+        command = self._set_target_position(target_position)
+        if command is not None and (yield from self._command_procedure(command)):
+            self._schedule_stop()
+
+    def _update_procedure(self) -> _AXAProcedure:
+        """
+        Calculates the position of the window opener based on the direction the window opener is
+        moving and sends the command needed to reach the target position, if any.
+        """
+        command = self._update_position()
+        if command is None:
+            return
+
+        try:
+            if command == "STOP":
+                yield from self._command_procedure(command)
+            elif (yield from self._command_procedure(command)):
+                self._schedule_stop()
+        except AXARemoteError as ex:
+            logger.error(
+                "Problem communicating with %s, reason: %s", self.connection, ex
+            )
+
+    def _schedule_stop(self) -> None:
+        """
+        Schedules the STOP command at the moment the target position is reached.
+        """
+        self._cancel_stop()
+
+        delay = self._stop_delay()
+        if delay is None:
+            return
+
+        logger.debug("Stopping in %.2f seconds", delay)
+        self._stop_timer = self._start_stop_timer(delay)
+
+    def _cancel_stop(self) -> None:
+        if self._stop_timer is not None:
+            self._stop_timer.cancel()
+            self._stop_timer = None
+
+    def _timed_stop_procedure(self) -> _AXAProcedure:
+        """
+        Sends the STOP command once the target position is reached.
+        """
+        # From here on the STOP command should no longer be cancelled
+        self._stop_timer = None
+        with self._state_lock:
+            self._update_position()
+            if self._status not in [AXAStatus.OPENING, AXAStatus.CLOSING]:
+                return
+            target_position = self._target_position
+
+        try:
+            if (
+                yield from self._command_procedure("STOP")
+            ) and target_position is not None:
+                with self._state_lock:
+                    self._position = target_position
+        except AXARemoteError as ex:
+            logger.error(
+                "Problem communicating with %s, reason: %s", self.connection, ex
+            )
+
+    def _raw_status_procedure(self) -> _AXAProcedure:
+        """
+        Returns the status as given by the AXA Remote.
+
+        If the raw status is cached concurrent callers share a single STATUS command.
+        """
+        return (yield from self._sampled_raw_status_procedure())[1]
+
+    def _sampled_raw_status_procedure(self) -> _AXAProcedure:
+        """
+        Returns the time the status was received and the status as given by the AXA Remote.
+        """
+        if self.raw_status_ttl is None:
+            response = yield from self._send_command_procedure("STATUS")
+            return self.clock.time(), response
+
+        yield (self._raw_status_lock.acquire,)
+        try:
+            cached = self._cached_raw_status()
+            if cached is not None:
+                return cached
+
+            generation = self._raw_status_generation
+            response = yield from self._send_command_procedure("STATUS")
+            sampled = self.clock.time()
+            self._cache_raw_status(sampled, response, generation)
+        finally:
+            self._raw_status_lock.release()
+
+        return sampled, response
+
+    def _sync_status_procedure(self) -> _AXAProcedure:
+        """
+        Synchronises the raw state with the presumed state.
+        """
+        if not self.circuit_breaker.allow():
+            # Device is offline and the backoff time has not passed yet
+            return (yield from self._status_procedure())
+
+        if not (yield from self._connect_procedure()):
+            # Device is offline
+            if self.connected:
+                logger.debug("Device is offline")
+            else:
+                logger.debug("Device is still offline")
+            self.connected = False
+            self.circuit_breaker.failure()
+            return (yield from self._status_procedure())
+
+        self.connected = True
+
+        # Every outcome of the attempt is reported to the circuit breaker, otherwise a probe
+        # would leave it half open
+        online = False
+        try:
+            sampled, response = yield from self._sampled_raw_status_procedure()
+            raw_state = response.status
+            # No raw status means the connection failed
+            online = raw_state is not None
+            self._synchronise(raw_state, sampled)
+        except InvallidResponseError as ex:
+            # The window opener responded, so the link is up
+            logger.warning(ex)
+            online = True
+        except EmptyResponseError as ex:
             logger.warning(ex)
         except AXARemoteError as ex:
+            # Like when too busy, the window opener has not been reached
             logger.error(ex)
         except AXAConnectionError as ex:
             logger.error(
                 "Problem communicating with %s, reason: %s", self.connection, ex
             )
 
-        return self.status()
+        if online:
+            self.circuit_breaker.success()
+        else:
+            self.circuit_breaker.failure()
 
-    def status(self) -> [int, float]:
+        return (yield from self._status_procedure())
+
+    def _status_procedure(self) -> _AXAProcedure:
         """
         Returns the current status of the window opener.
         """
-        self._update()
+        yield from self._update_procedure()
 
-        return [self._status, self._position]
+        with self._state_lock:
+            return [self._status, self._position]
 
-    def position(self) -> float:
+    def subscribe(
+        self,
+        callback: Callable[[list], None],
+        position_step: float = 1.0,
+        min_interval: float = 0.2,
+    ) -> Callable[[], None]:
         """
-        Returns the current position of the window opener where 0.0 is totally closed and 100.0 is
-        fully open.
+        Calls the given callback with the status and position of the window opener on every status
+        transition and on position changes of at least the given position step, at most once per
+        given minimal interval.
+
+        A single background poller per window opener serves all subscribers, it is started on the
+        first subscription and stopped when the last subscriber unsubscribes. The asyncio poller
+        needs to be subscribed to from within the event loop.
+
+        Returns the function to unsubscribe.
         """
-        return self._position
+        remove = self._subscriptions.add(callback, position_step, min_interval)
+
+        if self._poller is None:
+            self._poller = self._poller_class(self, self._subscriptions.publish)
+        self._poller.update_interval = self._subscriptions.update_interval
+        self._poller.start()
+
+        def unsubscribe():
+            remove()
+            if self._poller is None:
+                return
+            if len(self._subscriptions) == 0:
+                # A new subscription starts a new poller, even if this one did not stop yet
+                poller, self._poller = self._poller, None
+                self._stop_poller(poller)
+            else:
+                self._poller.update_interval = self._subscriptions.update_interval
 
-    def calibrate(self):
+        return unsubscribe
+
+    def _wait_for_edge_procedure(self, edge: AXAEdgeDetector) -> _AXAProcedure:
         """
-        Calibrates the AXA Remote window opener open time
+        Polls the raw status until the given edge is detected.
+
+        Returns the number of seconds since the start of the edge detector until the edge, or None
+        if the edge was not detected in time.
         """
-        # if self.open() and time.sleep(60) and self.close():
-        if self.close():
-            start = time.time()
-            while True:
-                try:
-                    raw_state = self.raw_status()[0]
-                    if raw_state in [
-                        AXARawStatus.STRONG_LOCKED,
-                        AXARawStatus.WEAK_LOCKED,
-                    ]:
-                        self._time_open = time.time() - start
-                        logger.info("Open time is %.1f seconds", self._time_open)
-                        return self._time_open
-                    logger.debug("%.1f", time.time() - start)
-                    if time.time() - start > 120:
-                        logger.error("%.1f", time.time() - start)
-                        break
-                except AXARemoteError as ex:
-                    logger.warning(ex)
-
-        logger.error("Failed to calibrate")
+        while not edge.timed_out(self.clock.time()):
+            sent = self.clock.time()
+            try:
+                # Bypass the raw status cache, it would blur the edge
+                raw_state = (yield from self._send_command_procedure("STATUS")).status
+                if raw_state is not None:
+                    result = edge.offer(raw_state, (sent + self.clock.time()) / 2)
+                    if result is not None:
+                        return result
+            except AXARemoteError as ex:
+                logger.warning(ex)
+            yield (self._sleep, edge.poll_interval(self.clock.time()))
+
+        logger.error("Raw status did not change in %.0f seconds", edge.timeout)
         return None
 
+    def _calibration_run_procedure(
+        self, expected: AXATimingProfile, min_interval: float, max_interval: float
+    ) -> _AXAProcedure:
+        """
+        Opens and closes the window opener once and measures the unlock, close and lock times.
+
+        Returns the measured timing profile and if all edges were timed accurately.
+        """
+        raw_state = (yield from self._send_command_procedure("STATUS")).status
+        if raw_state != AXARawStatus.STRONG_LOCKED:
+            logger.info("Closing the window opener before calibrating")
+            if not (yield from self._move_procedure("CLOSE", 0.0)):
+                return None
+            edge = AXAEdgeDetector(
+                [AXARawStatus.STRONG_LOCKED],
+                self.clock.time(),
+                expected.time_close + expected.time_lock,
+                min_interval,
+                max_interval,
+            )
+            if (yield from self._wait_for_edge_procedure(edge)) is None:
+                return None
+
+        if not (yield from self._move_procedure("OPEN", 100.0)):
+            return None
+        start = self.clock.time()
+        unlock_edge = AXAEdgeDetector(
+            [AXARawStatus.UNLOCKED],
+            start,
+            expected.time_unlock,
+            min_interval,
+            max_interval,
+        )
+        time_unlock = yield from self._wait_for_edge_procedure(unlock_edge)
+        if time_unlock is None:
+            return None
+
+        # The end of opening can not be observed, wait till the window opener is surely open
+        yield (self._sleep, max(0.0, start + open_wait(expected) - self.clock.time()))
+
+        if not (yield from self._move_procedure("CLOSE", 0.0)):
+            return None
+        start = self.clock.time()
+        close_edge = AXAEdgeDetector(
+            LOCKED_STATES, start, expected.time_close, min_interval, max_interval
+        )
+        time_close = yield from self._wait_for_edge_procedure(close_edge)
+        if time_close is None:
+            return None
+        lock_edge = AXAEdgeDetector(
+            [AXARawStatus.STRONG_LOCKED],
+            start,
+            time_close + expected.time_lock,
+            min_interval,
+            max_interval,
+            before=close_edge.sampled,
+        )
+        time_locked = yield from self._wait_for_edge_procedure(lock_edge)
+        if time_locked is None:
+            return None
+
+        profile = AXATimingProfile(
+            time_unlock, time_close, time_close, time_locked - time_close
+        )
+        accurate = unlock_edge.accurate and close_edge.accurate and lock_edge.accurate
+        # The window opener might not have been fully open if closing took longer than opening was
+        # expected to take
+        accurate = accurate and time_close <= expected.time_open
+
+        return profile, accurate
+
+    def _calibrate_procedure(
+        self, runs: int, min_interval: float, max_interval: float
+    ) -> _AXAProcedure:
+        """
+        Calibrates the AXA Remote window opener unlock, open, close and lock times, see
+        calibrate().
+        """
+        assert runs > 0
+
+        expected = self.timing_profile
+        profiles = []
+        self._cancel_stop()
+        try:
+            for run in range(runs * _MAX_RUNS_FACTOR):
+                result = yield from self._calibration_run_procedure(
+                    expected, min_interval, max_interval
+                )
+                if result is None:
+                    break
+                profile, accurate = result
+                # Time the edges of the next run around the measured times, but never shorten the
+                # wait for the window opener to be fully open
+                expected = profile._replace(
+                    time_open=max(expected.time_open, profile.time_open)
+                )
+                if not accurate:
+                    logger.info(
+                        "Calibration run %d was not accurate, retrying", run + 1
+                    )
+                    continue
+                profiles.append(profile)
+                logger.info(
+                    "Calibration run %d of %d: %s", len(profiles), runs, profile
+                )
+                if len(profiles) == runs:
+                    break
+        except AXARemoteError as ex:
+            logger.error(
+                "Problem communicating with %s, reason: %s", self.connection, ex
+            )
+
+        if len(profiles) < runs:
+            logger.error("Failed to calibrate")
+            return None
+
+        return self._calibrated(profiles)
+
+
+class AXARemote(AXARemoteBase):
+    """
+    AXARemote basse class for interfacing with AXA Remote window openers.
+    """
+
+    connection: AXAConnection = None
+
+    _queue_class = AXACommandQueue
+    _lock_class = threading.Lock
+    _poller_class = AXAPoller
+
+    def _run(self, procedure: _AXAProcedure):
+        """
+        Runs the given procedure, performing the I/O calls it requests one after another.
+        """
+        step = self._resume(procedure)
+        while not step.done:
+            try:
+                result = step.function(*step.args)
+            except BaseException as ex:  # pylint: disable=broad-exception-caught
+                step = self._resume(procedure, error=ex)
+            else:
+                step = self._resume(procedure, result)
+
+        return step.result
+
+    def _sleep(self, seconds: float) -> None:
+        self.clock.sleep(seconds)
+
+    def _pause(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+    def _start_stop_timer(self, delay: float):
+        return self.clock.call_later(delay, self._timed_stop)
+
+    def _timed_stop(self) -> None:
+        self._run(self._timed_stop_procedure())
+
+    def _stop_poller(self, poller) -> None:
+        poller.stop()
+
+    def connect(self) -> bool:
+        """
+        Connect to the window opener.
+        """
+        return self._run(self._connect_procedure())
+
+    def disconnect(self) -> bool:
+        """
+        Disconnect from the window opener.
+        """
+        return self._run(self._disconnect_procedure())
+
+    def _send_command(self, command: str) -> AXAResponse:
+        """
+        Send a command to the AXA Remote.
+        """
+        return self._run(self._send_command_procedure(command))
+
+    def _update(self) -> None:
+        """
+        Calculates the position of the window opener based on the direction the window opener is
+        moving.
+        """
+        self._run(self._update_procedure())
+
+    def open(self) -> bool:
+        """
+        Opens the window opener.
+        """
+        return self._run(self._move_procedure("OPEN", 100.0))
+
+    def stop(self) -> bool:
+        """
+        Stops the window opening.
+        """
+        return self._run(self._move_procedure("STOP", self._position))
+
+    def close(self) -> bool:
+        """
+        Closes the window opener.
+        """
+        return self._run(self._move_procedure("CLOSE", 0.0))
+
+    def set_position(self, target_position: float) -> None:
+        """
+        Initiates the window opener to move to a given position.
+
+        The window opener is stopped by a timer once the given position is reached.
+        """
+        self._run(self._set_position_procedure(target_position))
+
+    def raw_status(self) -> AXAResponse:
+        """
+        Returns the status as given by the AXA Remote.
+
+        If the raw status is cached concurrent callers share a single STATUS command.
+        """
+        return self._run(self._raw_status_procedure())
+
+    def sync_status(self) -> None:
+        """
+        Synchronises the raw state with the presumed state.
+        """
+        return self._run(self._sync_status_procedure())
+
+    def status(self) -> [int, float]:
+        """
+        Returns the current status of the window opener.
+        """
+        return self._run(self._status_procedure())
+
+    def changes(
+        self, position_step: float = 1.0, min_interval: float = 0.2
+    ) -> Iterator[list]:
+        """
+        Returns an iterator over the status changes of the window opener, see subscribe().
+        """
+        changes = queue.SimpleQueue()
+        unsubscribe = self.subscribe(changes.put, position_step, min_interval)
+        try:
+            while True:
+                yield changes.get()
+        finally:
+            unsubscribe()
+
+    def calibrate(
+        self, runs: int = 3, min_interval: float = 0.1, max_interval: float = 2.0
+    ) -> AXATimingProfile | None:
+        """
+        Calibrates the AXA Remote window opener unlock, open, close and lock times.
+
+        The window opener is opened and closed the given number of times while the raw status is
+        polled, at most once per given minimal interval. Runs in which a status change came much
+        earlier than expected, or in which the window opener might not have been fully open, are
+        repeated. The average of the measured times is used to calculate
+        the position of the window opener and returned as timing profile.
+        """
+        return self._run(self._calibrate_procedure(runs, min_interval, max_interval))
+
 
 class AXARemoteSerial(AXARemote):
     """
     AXA Remote class for controlling AXA Remote window openers over a serial connection.
     """
 
-    def __init__(self, serial_port: str) -> None:
+    def __init__(self, serial_port: str, **kwargs) -> None:
         """
         Initializes the AXARemote object.
         """
@@ -691,7 +1775,7 @@ class AXARemoteSerial(AXARemote):
 
         connection = AXASerialConnection(serial_port)
 
-        super().__init__(connection)
+        super().__init__(connection, **kwargs)
 
 
 class AXARemoteTelnet(AXARemote):
@@ -699,7 +1783,7 @@ class AXARemoteTelnet(AXARemote):
     AXA Remote class for controlling AXA Remote window openers over a Telnet connection.
     """
 
-    def __init__(self, host: str, port: int) -> None:
+    def __init__(self, host: str, port: int, **kwargs) -> None:
         """
         Initializes the AXARemote object.
         """
@@ -708,6 +1792,6 @@ class AXARemoteTelnet(AXARemote):
 
         self.unique_id = f"{host}:{port}"
 
-        connection = AXATelnetConnection(host, port)
+        connection = AXASocketConnection(host, port)
 
-        super().__init__(connection)
+        super().__init__(connection, **kwargs)
@@ -0,0 +1,415 @@
+"""
+Implements a simulator of an AXA Remote window opener, for testing and benchmarking the library
+without the actual hardware.
+
+The simulator can be reached as a TCP server, like a serial to network bridge, or as a pseudo
+terminal serial device.
+
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import logging
+import os
+import random
+import select
+import socket
+import socketserver
+import threading
+import time
+
+from axaremote.axaclock import AXAClock, AXAMonotonicClock
+
+logger = logging.getLogger(__name__)
+
+_DEVICE = "AXA RV2900"
+_VERSION = "Firmware V1.20"
+
+# Motion phases of the simulated window opener
+LOCKED = "locked"
+UNLOCKING = "unlocking"
+OPENING = "opening"
+OPEN = "open"
+STOPPED = "stopped"
+CLOSING = "closing"
+LOCKING = "locking"
+
+
+class AXARemoteSimulator:
+    """
+    Simulates the behaviour of an AXA Remote window opener.
+
+    The window opener unlocks, opens, closes and locks in the given times. While unlocking and
+    locking the simulator reports Weak Locked, when fully locked Strong Locked and otherwise
+    UnLocked. Every response is delayed by the given latency plus a random jitter.
+
+    With pipelining disabled the simulator behaves like firmware that drops any input received
+    while it is processing a command.
+
+    The motion of the window opener follows the given clock, share a virtual clock with the
+    library to simulate full open and close cycles faster than real time.
+    """
+
+    def __init__(
+        self,
+        time_unlock: float = 5,
+        time_open: float = 42,
+        time_close: float = 42,
+        time_lock: float = 16,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        position: float = 0.0,
+        pipelining: bool = True,
+        clock: AXAClock = None,
+    ):
+        assert time_unlock >= 0
+        assert time_open > 0
+        assert time_close > 0
+        assert time_lock >= 0
+        assert latency >= 0
+        assert jitter >= 0
+        assert 0.0 <= position <= 100.0
+
+        self.time_unlock = time_unlock
+        self.time_open = time_open
+        self.time_close = time_close
+        self.time_lock = time_lock
+        self.latency = latency
+        self.jitter = jitter
+        self.pipelining = pipelining
+        self.clock = clock or AXAMonotonicClock()
+
+        self.device = _DEVICE
+        self.version = _VERSION
+
+        self._lock = threading.Lock()
+        self._position = position
+        if position == 0.0:
+            self._phase = LOCKED
+        elif position == 100.0:
+            self._phase = OPEN
+        else:
+            self._phase = STOPPED
+        self._phase_start = self.clock.time()
+        self._phase_position = position
+
+        self.commands = 0
+
+    def _advance(self) -> None:
+        """
+        Moves the simulated window opener to the state it should be in at this moment.
+        """
+        now = self.clock.time()
+
+        while True:
+            elapsed = now - self._phase_start
+            if self._phase == UNLOCKING:
+                if elapsed < self.time_unlock:
+                    return
+                self._set_phase(OPENING, self._phase_start + self.time_unlock)
+            elif self._phase == OPENING:
+                self._position = min(
+                    100.0, self._phase_position + (elapsed / self.time_open) * 100.0
+                )
+                if self._position < 100.0:
+                    return
+                self._set_phase(
+                    OPEN,
+                    self._phase_start
+                    + ((100.0 - self._phase_position) / 100.0) * self.time_open,
+                )
+            elif self._phase == CLOSING:
+                self._position = max(
+                    0.0, self._phase_position - (elapsed / self.time_close) * 100.0
+                )
+                if self._position > 0.0:
+                    return
+                self._set_phase(
+                    LOCKING,
+                    self._phase_start
+                    + (self._phase_position / 100.0) * self.time_close,
+                )
+            elif self._phase == LOCKING:
+                if elapsed < self.time_lock:
+                    return
+                self._set_phase(LOCKED, self._phase_start + self.time_lock)
+            else:
+                return
+
+    def _set_phase(self, phase: str, timestamp: float = None) -> None:
+        logger.debug("Simulator %s at %5.1f %%", phase, self._position)
+        self._phase = phase
+        self._phase_start = self.clock.time() if timestamp is None else timestamp
+        self._phase_position = self._position
+
+    @property
+    def phase(self) -> str:
+        """The motion phase of the simulated window opener"""
+        with self._lock:
+            self._advance()
+            return self._phase
+
+    def position(self) -> float:
+        """
+        Returns the position of the simulated window opener where 0.0 is closed and 100.0 is fully
+        open.
+        """
+        with self._lock:
+            self._advance()
+            return self._position
+
+    def _open(self) -> None:
+        if self._phase in [LOCKED, LOCKING]:
+            self._set_phase(UNLOCKING)
+        elif self._phase in [STOPPED, CLOSING]:
+            self._set_phase(OPENING)
+
+    def _stop(self) -> None:
+        if self._phase in [OPENING, CLOSING]:
+            self._set_phase(STOPPED)
+
+    def _close(self) -> None:
+        if self._phase in [OPEN, OPENING, STOPPED]:
+            self._set_phase(CLOSING)
+        elif self._phase == UNLOCKING:
+            self._set_phase(LOCKING)
+
+    def _status(self) -> str:
+        if self._phase == LOCKED:
+            return "211 Strong Locked"
+        if self._phase in [UNLOCKING, LOCKING]:
+            return "212 Weak Locked"
+        return "210 UnLocked"
+
+    def handle(self, command: str) -> str:
+        """
+        Handles a command and returns the response.
+        """
+        command = command.strip().upper()
+
+        with self._lock:
+            self.commands += 1
+            self._advance()
+
+            if command == "OPEN":
+                self._open()
+                return "200 OK"
+            if command == "STOP":
+                self._stop()
+                return "200 OK"
+            if command == "CLOSE":
+                self._close()
+                return "200 OK"
+            if command == "STATUS":
+                return self._status()
+            if command == "DEVICE":
+                return f"260 {self.device}"
+            if command == "VERSION":
+                return f"261 {self.version}"
+
+        return "502 Command not implemented"
+
+    def delay(self) -> float:
+        """
+        Returns the time it takes the simulator to respond.
+        """
+        if self.jitter:
+            return self.latency + random.uniform(0, self.jitter)
+        return self.latency
+
+
+class _AXASimulatorSession:
+    """
+    Handles the protocol for a single connection to the simulator.
+    """
+
+    def __init__(self, simulator: AXARemoteSimulator, write):
+        self._simulator = simulator
+        self._write = write
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> None:
+        """
+        Processes the received data and writes the echo and response of every complete command.
+        """
+        self._buffer.extend(data)
+
+        while True:
+            cr = self._buffer.find(b"\r")
+            lf = self._buffer.find(b"\n")
+            if cr == -1 and lf == -1:
+                return
+            end = lf if cr == -1 else cr if lf == -1 else min(cr, lf)
+            line = bytes(self._buffer[:end])
+            del self._buffer[: end + 1]
+
+            command = line.decode(errors="ignore").strip()
+            if not command:
+                continue
+
+            # Echo the command
+            self._write(f"{command}\r\n".encode("ascii", errors="ignore"))
+
+            response = self._simulator.handle(command)
+            delay = self._simulator.delay()
+            if delay:
+                time.sleep(delay)
+            self._write(f"{response}\r\n".encode("ascii"))
+
+            if not self._simulator.pipelining:
+                # Drop the input received while processing the command
+                self._buffer.clear()
+                return
+
+
+class _AXASimulatorRequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        session = _AXASimulatorSession(self.server.simulator, self.request.sendall)
+        while True:
+            try:
+                data = self.request.recv(1024)
+            except OSError:
+                return
+            if not data:
+                return
+            try:
+                session.feed(data)
+            except OSError:
+                return
+
+
+class _AXASimulatorTCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+    simulator: AXARemoteSimulator = None
+
+
+class AXASimulatorServer:
+    """
+    Makes the simulator reachable as a TCP server, like a serial to network bridge.
+    """
+
+    def __init__(
+        self, simulator: AXARemoteSimulator, host: str = "127.0.0.1", port: int = 0
+    ):
+        assert simulator is not None
+
+        self.simulator = simulator
+        self._server = _AXASimulatorTCPServer((host, port), _AXASimulatorRequestHandler)
+        self._server.simulator = simulator
+        self._thread = None
+
+    @property
+    def host(self) -> str:
+        """The host the simulator listens on"""
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        """The port the simulator listens on"""
+        return self._server.server_address[1]
+
+    def start(self) -> None:
+        """
+        Starts serving in a background thread.
+        """
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="AXASimulatorServer", daemon=True
+        )
+        self._thread.start()
+        logger.debug("Simulator listening on %s:%s", self.host, self.port)
+
+    def stop(self) -> None:
+        """
+        Stops serving.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+class AXASimulatorSerial:
+    """
+    Makes the simulator reachable as a pseudo terminal serial device.
+    """
+
+    def __init__(self, simulator: AXARemoteSimulator):
+        assert simulator is not None
+
+        self.simulator = simulator
+        self._master = None
+        self._slave = None
+        self._thread = None
+        self._running = False
+
+    @property
+    def serial_port(self) -> str:
+        """The path of the serial device"""
+        return os.ttyname(self._slave)
+
+    def start(self) -> None:
+        """
+        Creates the pseudo terminal and starts serving in a background thread.
+        """
+        # tty needs termios, which is not available on Windows
+        import tty  # pylint: disable=import-outside-toplevel
+
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._slave)
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._serve, name="AXASimulatorSerial", daemon=True
+        )
+        self._thread.start()
+        logger.debug("Simulator available on %s", self.serial_port)
+
+    def _write(self, data: bytes) -> None:
+        while data:
+            written = os.write(self._master, data)
+            data = data[written:]
+
+    def _serve(self) -> None:
+        session = _AXASimulatorSession(self.simulator, self._write)
+        while self._running:
+            readable, _, _ = select.select([self._master], [], [], 0.1)
+            if not readable:
+                continue
+            try:
+                data = os.read(self._master, 1024)
+            except OSError:
+                # No process has the serial device open
+                time.sleep(0.01)
+                continue
+            session.feed(data)
+
+    def stop(self) -> None:
+        """
+        Stops serving and removes the pseudo terminal.
+        """
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for fd in [self._master, self._slave]:
+            if fd is not None:
+                os.close(fd)
+        self._master = None
+        self._slave = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
@@ -0,0 +1,266 @@
+"""
+Implements the persistent stores of the AXA Remote library.
+
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import contextlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from axaremote.axacalibration import AXATimingProfile
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows, the profile store is then only safe within a single process
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Version of the profile store file format
+_PROFILE_STORE_VERSION = 1
+
+
+def _read_json(path: str) -> dict:
+    """
+    Reads the JSON file at the given path, returns an empty dictionary if the file does not exist
+    or can not be parsed.
+    """
+    try:
+        with open(path, encoding="utf8") as file:
+            data = json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as ex:
+        logger.warning("Failed to read %s, reason: %s", path, ex)
+        return {}
+
+    if not isinstance(data, dict):
+        logger.warning("Ignoring %s, unexpected content", path)
+        return {}
+
+    return data
+
+
+def _write_json(path: str, data: dict) -> None:
+    """
+    Atomically writes the given data as compact JSON to the given path.
+
+    The data is written to a temporary file in the same directory which then replaces the
+    original file, so readers never see a partially written file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, temporary_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf8") as file:
+            json.dump(data, file, separators=(",", ":"), sort_keys=True)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        try:
+            os.unlink(temporary_path)
+        except OSError:
+            pass
+        raise
+
+
+class AXAHandshakeCache:
+    """
+    Persistent cache of the DEVICE and VERSION responses of window openers, keyed by the unique id
+    of the window opener.
+
+    These responses never change for a given window opener, with the cache connect() only has to
+    request the status of the window opener.
+    """
+
+    def __init__(self, path: str):
+        assert path is not None
+
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._entries = None
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            self._entries = {
+                unique_id: entry
+                for unique_id, entry in _read_json(self.path).items()
+                if isinstance(entry, list) and len(entry) == 2
+            }
+
+        return self._entries
+
+    def _save(self) -> None:
+        try:
+            _write_json(self.path, self._entries)
+        except OSError as ex:
+            logger.warning("Failed to write %s, reason: %s", self.path, ex)
+
+    def get(self, unique_id: str) -> tuple[str, str] | None:
+        """
+        Returns the device and version of the given window opener, if cached.
+        """
+        with self._lock:
+            entry = self._load().get(unique_id)
+
+        if entry is None:
+            return None
+
+        return (entry[0], entry[1])
+
+    def set(self, unique_id: str, device: str, version: str) -> None:
+        """
+        Stores the device and version of the given window opener.
+        """
+        assert unique_id is not None
+
+        with self._lock:
+            entries = self._load()
+            if entries.get(unique_id) == [device, version]:
+                return
+            entries[unique_id] = [device, version]
+            self._save()
+
+    def invalidate(self, unique_id: str) -> None:
+        """
+        Removes the given window opener from the cache.
+        """
+        with self._lock:
+            entries = self._load()
+            if entries.pop(unique_id, None) is not None:
+                self._save()
+
+
+class AXAProfileStore:
+    """
+    Persistent store of the timing profiles of window openers, keyed by the unique id of the
+    window opener.
+
+    Every update re-reads the store, changes the profile of a single window opener and atomically
+    replaces the file, under an exclusive lock where the platform supports it, so window openers
+    sharing a store in different processes do not overwrite each others profiles. Stores written
+    by a newer version of the library are never overwritten.
+    """
+
+    def __init__(self, path: str):
+        assert path is not None
+
+        self.path = path
+
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def _locked(self):
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+
+            with open(f"{self.path}.lock", "a", encoding="utf8") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self) -> dict | None:
+        """
+        Returns the profiles by unique id, or None if the store was written by a newer version.
+        """
+        data = _read_json(self.path)
+        version = data.get("version", _PROFILE_STORE_VERSION)
+        if not isinstance(version, int) or version > _PROFILE_STORE_VERSION:
+            logger.warning("Ignoring %s, unsupported version %s", self.path, version)
+            return None
+
+        profiles = data.get("profiles", {})
+        if not isinstance(profiles, dict):
+            return {}
+
+        return profiles
+
+    @staticmethod
+    def _parse(entry) -> AXATimingProfile | None:
+        try:
+            profile = AXATimingProfile(
+                *(float(entry[field]) for field in AXATimingProfile._fields)
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        if profile.time_open <= 0 or profile.time_close <= 0:
+            return None
+
+        return profile
+
+    def _update(self, unique_id: str, entry: dict | None) -> bool:
+        """
+        Atomically replaces or, if the given entry is None, removes the entry of the given window
+        opener.
+        """
+        with self._locked():
+            profiles = self._read()
+            if profiles is None:
+                return False
+            if entry is None:
+                if profiles.pop(unique_id, None) is None:
+                    return True
+            else:
+                profiles[unique_id] = entry
+            try:
+                _write_json(
+                    self.path,
+                    {"version": _PROFILE_STORE_VERSION, "profiles": profiles},
+                )
+            except OSError as ex:
+                logger.warning("Failed to write %s, reason: %s", self.path, ex)
+                return False
+
+        return True
+
+    def get(self, unique_id: str) -> AXATimingProfile | None:
+        """
+        Returns the timing profile of the given window opener, if stored.
+        """
+        with self._lock:
+            profiles = self._read()
+
+        if profiles is None or unique_id not in profiles:
+            return None
+
+        profile = self._parse(profiles[unique_id])
+        if profile is None:
+            logger.warning("Ignoring invalid timing profile of %s", unique_id)
+
+        return profile
+
+    def set(self, unique_id: str, profile: AXATimingProfile) -> bool:
+        """
+        Stores the timing profile of the given window opener.
+        """
+        assert unique_id is not None
+        assert profile is not None
+
+        entry = profile._asdict()
+        entry["updated"] = round(time.time())
+
+        return self._update(unique_id, entry)
+
+    def remove(self, unique_id: str) -> bool:
+        """
+        Removes the timing profile of the given window opener from the store.
+        """
+        return self._update(unique_id, None)
@@ -0,0 +1,138 @@
+"""
+Implements the state change subscriptions of AXA Remote window openers.
+
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import logging
+import threading
+from typing import Callable
+
+from axaremote.axaclock import AXAClock, AXAMonotonicClock
+
+logger = logging.getLogger(__name__)
+
+# Minimal change of the position in percent and minimal time in seconds between two position
+# changes before a subscriber is notified
+_POSITION_STEP = 1.0
+_MIN_INTERVAL = 0.2
+
+_UNSET = object()
+
+
+class _AXASubscription:
+    """
+    A single subscriber and the last status it has been notified of.
+    """
+
+    __slots__ = (
+        "callback",
+        "position_step",
+        "min_interval",
+        "status",
+        "position",
+        "timestamp",
+    )
+
+    def __init__(
+        self,
+        callback: Callable[[list], None],
+        position_step: float,
+        min_interval: float,
+    ):
+        self.callback = callback
+        self.position_step = position_step
+        self.min_interval = min_interval
+        self.status = _UNSET
+        self.position = None
+        self.timestamp = None
+
+    def offer(self, status, position: float, now: float) -> bool:
+        """
+        Returns if the subscriber needs to be notified of the given status and position.
+
+        Status transitions are always notified, position changes only if the position changed more
+        than the position step and the minimal interval since the last notification has passed.
+        Position changes in between are coalesced.
+        """
+        if status == self.status:
+            if abs(position - self.position) < self.position_step:
+                return False
+            if now - self.timestamp < self.min_interval:
+                return False
+
+        self.status = status
+        self.position = position
+        self.timestamp = now
+        return True
+
+
+class AXASubscriptions:
+    """
+    The subscribers to the state changes of a window opener.
+    """
+
+    def __init__(self, clock: AXAClock = None):
+        self.clock = clock or AXAMonotonicClock()
+
+        self._lock = threading.Lock()
+        self._subscriptions: list[_AXASubscription] = []
+
+    def __len__(self):
+        return len(self._subscriptions)
+
+    @property
+    def update_interval(self) -> float | None:
+        """
+        The interval at which the position needs to be calculated to serve all subscribers.
+        """
+        with self._lock:
+            if not self._subscriptions:
+                return None
+            return min(
+                subscription.min_interval for subscription in self._subscriptions
+            )
+
+    def add(
+        self,
+        callback: Callable[[list], None],
+        position_step: float = _POSITION_STEP,
+        min_interval: float = _MIN_INTERVAL,
+    ) -> Callable[[], None]:
+        """
+        Adds a subscriber and returns the function that removes it again.
+        """
+        assert callback is not None
+        assert position_step >= 0
+        assert min_interval > 0
+
+        subscription = _AXASubscription(callback, position_step, min_interval)
+        with self._lock:
+            self._subscriptions.append(subscription)
+
+        def remove():
+            with self._lock:
+                if subscription in self._subscriptions:
+                    self._subscriptions.remove(subscription)
+
+        return remove
+
+    def publish(self, status: list) -> None:
+        """
+        Notifies the subscribers of the given status and position, if needed.
+        """
+        now = self.clock.time()
+        with self._lock:
+            subscriptions = [
+                subscription
+                for subscription in self._subscriptions
+                if subscription.offer(status[0], status[1], now)
+            ]
+
+        for subscription in subscriptions:
+            try:
+                subscription.callback(status)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Problem notifying subscriber")
@@ -0,0 +1,262 @@
+"""
+Implements the wire level trace recorder and the replay connection of the AXA Remote library.
+
+A trace file starts with the magic bytes AXATRACE and a version byte, followed by records. Every
+record consists of the time since the previous record in microseconds, the record type and the
+length of the data, followed by the data itself.
+
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import logging
+import struct
+import threading
+import time
+from typing import Final, Iterator, NamedTuple
+
+from axaremote.axaconnection import AXAConnection, AXAConnectionError
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"AXATRACE"
+_VERSION = 1
+_HEADER = struct.Struct("<8sB")
+_RECORD = struct.Struct("<IBH")
+_MAX_DELTA = 0xFFFFFFFF
+
+OPEN: Final = 1
+CLOSE: Final = 2
+RESET: Final = 3
+WRITE: Final = 4
+READ: Final = 5
+
+_CONTROL_RECORDS = [OPEN, CLOSE, RESET]
+
+
+class AXATraceRecord(NamedTuple):
+    """
+    A single trace record, the timestamp is in seconds since the start of the trace.
+    """
+
+    timestamp: float
+    type: int
+    data: bytes
+
+
+def read_trace(path: str) -> Iterator[AXATraceRecord]:
+    """
+    Reads the records of the given trace file.
+    """
+    with open(path, "rb") as file:
+        header = file.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            raise ValueError(f"{path} is not an AXA Remote trace")
+        magic, version = _HEADER.unpack(header)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not an AXA Remote trace")
+        if version != _VERSION:
+            raise ValueError(f"Unsupported trace version {version}")
+
+        timestamp = 0
+        while True:
+            header = file.read(_RECORD.size)
+            if len(header) < _RECORD.size:
+                return
+            delta, record_type, length = _RECORD.unpack(header)
+            data = file.read(length)
+            timestamp += delta
+            yield AXATraceRecord(timestamp / 1000000, record_type, data)
+
+
+class AXATraceConnection(AXAConnection):
+    """
+    Wraps a connection and records all data written and read, with timestamps, to a trace file.
+    """
+
+    def __init__(self, connection: AXAConnection, path: str):
+        assert connection is not None
+        assert path is not None
+
+        self.connection = connection
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._file = open(path, "wb")  # pylint: disable=consider-using-with
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION))
+        self._timestamp = time.monotonic_ns() // 1000
+
+    def __str__(self):
+        return str(self.connection)
+
+    def _record(self, record_type: int, data: bytes = b"") -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            now = time.monotonic_ns() // 1000
+            delta = min(_MAX_DELTA, now - self._timestamp)
+            self._timestamp = now
+            data = data[:0xFFFF]
+            self._file.write(_RECORD.pack(delta, record_type, len(data)) + data)
+
+    def close_trace(self) -> None:
+        """
+        Stops recording and closes the trace file.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    @property
+    def is_open(self):
+        """If the connection is open"""
+        return self.connection.is_open
+
+    def open(self) -> bool:
+        self._record(OPEN, str(self.connection).encode(errors="ignore"))
+        return self.connection.open()
+
+    def close(self) -> bool:
+        self._record(CLOSE)
+        result = self.connection.close()
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+        return result
+
+    def reset(self) -> bool:
+        self._record(RESET)
+        return self.connection.reset()
+
+    def readline(self) -> bytes:
+        line = self.connection.readline()
+        self._record(READ, line)
+        return line
+
+    def write(self, data: bytes) -> int:
+        self._record(WRITE, data)
+        return self.connection.write(data)
+
+    def flush(self) -> None:
+        self.connection.flush()
+
+
+class AXAReplayConnection(AXAConnection):
+    """
+    Plays a recorded trace back as connection.
+
+    The recorded reads are returned in order with the recorded timing, divided by the given speed.
+    A speed of 0 replays the trace as fast as possible. Written data that differs from the recorded
+    data is counted as mismatch.
+    """
+
+    def __init__(self, path: str, speed: float = 1.0):
+        assert path is not None
+        assert speed >= 0
+
+        self.path = path
+        self.speed = speed
+        self.mismatches = 0
+
+        self._records = list(read_trace(path))
+        self._index = 0
+        self._is_open = False
+        self._replay_time = None
+
+    def __str__(self):
+        return f"replay of {self.path}"
+
+    @property
+    def is_open(self):
+        """If the connection is open"""
+        return self._is_open
+
+    @property
+    def finished(self) -> bool:
+        """If all records have been replayed"""
+        return self._index >= len(self._records)
+
+    def _peek(self) -> AXATraceRecord | None:
+        if self._index < len(self._records):
+            return self._records[self._index]
+
+        return None
+
+    def _take(self) -> AXATraceRecord:
+        """
+        Consumes the next record, after waiting the recorded time since the previous record.
+        """
+        record = self._records[self._index]
+        if self.speed and self._index > 0 and self._replay_time is not None:
+            delay = (record.timestamp - self._records[self._index - 1].timestamp) / (
+                self.speed
+            )
+            remaining = self._replay_time + delay - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+        self._replay_time = time.monotonic()
+        self._index += 1
+
+        return record
+
+    def _skip_control_records(self) -> None:
+        while (record := self._peek()) is not None and record.type in _CONTROL_RECORDS:
+            self._take()
+
+    def open(self) -> bool:
+        record = self._peek()
+        if record is None:
+            raise AXAConnectionError("End of trace")
+        if record.type == OPEN:
+            self._take()
+        self._is_open = True
+
+        return True
+
+    def close(self) -> bool:
+        record = self._peek()
+        if record is not None and record.type == CLOSE:
+            self._take()
+        self._is_open = False
+
+        return True
+
+    def reset(self) -> bool:
+        record = self._peek()
+        if record is not None and record.type == RESET:
+            self._take()
+
+        return True
+
+    def readline(self) -> bytes:
+        self._skip_control_records()
+        record = self._peek()
+        if record is None:
+            self._is_open = False
+            raise AXAConnectionError("End of trace")
+        if record.type != READ:
+            # More reads than recorded
+            self.mismatches += 1
+            return b""
+
+        return self._take().data
+
+    def write(self, data: bytes) -> int:
+        self._skip_control_records()
+        record = self._peek()
+        if record is None or record.type != WRITE:
+            logger.warning("Unexpected write of %s", repr(data))
+            self.mismatches += 1
+            return len(data)
+
+        record = self._take()
+        if record.data != data:
+            logger.warning(
+                "Written %s differs from recorded %s", repr(data), repr(record.data)
+            )
+            self.mismatches += 1
+
+        return len(data)
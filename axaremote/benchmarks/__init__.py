@@ -0,0 +1,10 @@
+"""
+Benchmarks for measuring the performance of the AXA Remote library against the AXA Remote
+simulator.
+
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+from axaremote.benchmarks.roundtrip import run_benchmarks
@@ -0,0 +1,43 @@
+"""
+Benchmarks the sans-I/O AXA Remote protocol codec in isolation.
+
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import time
+
+from axaremote.axaprotocol import AXAProtocol, AXAResponse
+
+_STATUS_EXCHANGE = b"STATUS\r\n211 Strong Locked\r\n"
+
+
+def bench_codec(exchanges: int) -> dict:
+    """
+    Measures the CPU time of encoding the STATUS command and parsing its echo and response, both
+    line by line and from raw bytes.
+    """
+    protocol = AXAProtocol()
+    lines = _STATUS_EXCHANGE.splitlines(keepends=True)
+
+    start = time.process_time()
+    for _ in range(exchanges):
+        protocol.send(["STATUS"])
+        for line in lines:
+            response = protocol.receive_line(line)
+    receive_line_time = time.process_time() - start
+    assert isinstance(response, AXAResponse)
+
+    start = time.process_time()
+    for _ in range(exchanges):
+        protocol.send(["STATUS"])
+        events = protocol.feed(_STATUS_EXCHANGE)
+    feed_time = time.process_time() - start
+    assert isinstance(events[-1], AXAResponse)
+
+    return {
+        "exchanges": exchanges,
+        "receive_line_us_per_exchange": receive_line_time / exchanges * 1000000,
+        "feed_us_per_exchange": feed_time / exchanges * 1000000,
+    }
@@ -0,0 +1,49 @@
+"""
+Benchmarks full open and close cycles of the AXA Remote library against the AXA Remote simulator
+on a virtual clock.
+
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import time
+
+from axaremote.axaclock import AXAVirtualClock
+from axaremote.axaremote import AXARemoteTelnet, AXAStatus
+from axaremote.axasimulator import AXARemoteSimulator, AXASimulatorServer
+
+# Interval in seconds of virtual time at which the status is synchronised, like the poller would
+_SYNC_INTERVAL = 1.0
+
+
+def bench_cycles(cycles: int) -> dict:
+    """
+    Measures the wall clock time of opening and closing the simulated window opener, while the
+    motion itself takes no time on the virtual clock.
+    """
+    clock = AXAVirtualClock()
+    simulator = AXARemoteSimulator(clock=clock)
+    with AXASimulatorServer(simulator) as server:
+        axa = AXARemoteTelnet(server.host, server.port, clock=clock)
+        if not axa.connect():
+            raise RuntimeError("Failed to connect to the simulator")
+        try:
+            start = time.perf_counter()
+            for _ in range(cycles):
+                axa.open()
+                while axa.sync_status()[0] != AXAStatus.OPEN:
+                    clock.advance(_SYNC_INTERVAL)
+                axa.close()
+                while axa.sync_status()[0] != AXAStatus.LOCKED:
+                    clock.advance(_SYNC_INTERVAL)
+            elapsed = time.perf_counter() - start
+        finally:
+            axa.disconnect()
+
+    return {
+        "cycles": cycles,
+        "simulated_seconds": clock.time(),
+        "cycles_per_second": cycles / elapsed,
+        "speedup": clock.time() / elapsed,
+    }
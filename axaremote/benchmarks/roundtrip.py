@@ -0,0 +1,212 @@
+"""
+Benchmarks the command round trip latency, the command throughput and the connection handshake
+of the AXA Remote library against the AXA Remote simulator.
+
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import logging
+import math
+import platform
+import time
+
+from axaremote import __version__
+from axaremote.axaremote import AXARemote, AXARemoteSerial, AXARemoteTelnet
+from axaremote.axasimulator import (
+    AXARemoteSimulator,
+    AXASimulatorSerial,
+    AXASimulatorServer,
+)
+from axaremote.benchmarks.codec import bench_codec
+from axaremote.benchmarks.cycles import bench_cycles
+
+logger = logging.getLogger(__name__)
+
+TRANSPORTS = ["serial", "telnet"]
+
+
+def percentile(samples: list[float], percentage: float) -> float:
+    """
+    Returns the given percentile of the samples using the nearest rank method.
+    """
+    if not samples:
+        return 0.0
+
+    samples = sorted(samples)
+    # Multiply before dividing, so a whole rank is not rounded up to the next one
+    rank = max(1, math.ceil(percentage * len(samples) / 100.0))
+
+    return samples[min(rank, len(samples)) - 1]
+
+
+def _summary(samples: list[float]) -> dict:
+    """
+    Returns the summary of the given latency samples in milliseconds.
+    """
+    if not samples:
+        return {}
+
+    return {
+        "count": len(samples),
+        "min_ms": min(samples) * 1000,
+        "mean_ms": sum(samples) / len(samples) * 1000,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "max_ms": max(samples) * 1000,
+    }
+
+
+def bench_handshake(create_remote, handshakes: int) -> dict:
+    """
+    Measures the time connect() takes on a fresh AXARemote object.
+    """
+    samples = []
+    for _ in range(handshakes):
+        axa = create_remote()
+        start = time.perf_counter()
+        connected = axa.connect()
+        samples.append(time.perf_counter() - start)
+        axa.disconnect()
+        if not connected:
+            raise RuntimeError("Failed to connect to the simulator")
+
+    return _summary(samples)
+
+
+def bench_roundtrip(axa: AXARemote, commands: int, command: str = "STATUS") -> dict:
+    """
+    Measures the round trip latency, throughput and CPU time of the given command.
+    """
+    # Warm up
+    axa._send_command(command)  # pylint: disable=protected-access
+
+    samples = []
+    # Only the CPU time of this thread, the simulator runs in other threads of the same process
+    cpu_start = time.thread_time()
+    start = time.perf_counter()
+    for _ in range(commands):
+        command_start = time.perf_counter()
+        # pylint: disable-next=protected-access
+        if axa._send_command(command).status is None:
+            raise RuntimeError(f"No response on {command}")
+        samples.append(time.perf_counter() - command_start)
+    duration = time.perf_counter() - start
+    cpu_time = time.thread_time() - cpu_start
+
+    result = _summary(samples)
+    result["commands_per_second"] = commands / duration
+    result["cpu_us_per_command"] = cpu_time / commands * 1000000
+
+    return result
+
+
+def run_benchmarks(
+    transports: list[str] = None,
+    commands: int = 500,
+    handshakes: int = 5,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    cycles: int = 10,
+) -> dict:
+    """
+    Runs the benchmarks for the given transports and returns the results.
+    """
+    if transports is None:
+        transports = TRANSPORTS
+
+    results = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "commands": commands,
+        "handshakes": handshakes,
+        "latency": latency,
+        "jitter": jitter,
+        "transports": {},
+        "codec": bench_codec(commands * 100),
+        "cycles": bench_cycles(cycles),
+    }
+
+    simulator = AXARemoteSimulator(latency=latency, jitter=jitter)
+
+    for transport in transports:
+        logger.debug("Benchmarking %s transport", transport)
+        if transport == "serial":
+            simulator_transport = AXASimulatorSerial(simulator)
+        elif transport == "telnet":
+            simulator_transport = AXASimulatorServer(simulator)
+        else:
+            raise ValueError(f"Unknown transport {transport}")
+
+        with simulator_transport:
+            if transport == "serial":
+
+                def create_remote(serial_port=simulator_transport.serial_port):
+                    return AXARemoteSerial(serial_port)
+
+            else:
+
+                def create_remote(
+                    host=simulator_transport.host, port=simulator_transport.port
+                ):
+                    return AXARemoteTelnet(host, port)
+
+            result = {"handshake": bench_handshake(create_remote, handshakes)}
+
+            axa = create_remote()
+            if not axa.connect():
+                raise RuntimeError("Failed to connect to the simulator")
+            try:
+                result["status"] = bench_roundtrip(axa, commands)
+            finally:
+                axa.disconnect()
+
+        results["transports"][transport] = result
+
+    return results
+
+
+def format_results(results: dict) -> str:
+    """
+    Formats the benchmark results as a human readable table.
+    """
+    lines = [
+        f"axaremote {results['version']}, Python {results['python']}, {results['platform']}",
+        f"{results['commands']} commands, {results['handshakes']} handshakes,"
+        f" simulator latency {results['latency'] * 1000:.1f} ms"
+        f" jitter {results['jitter'] * 1000:.1f} ms",
+        "",
+        f"{'transport':9} {'benchmark':9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+        f" {'cmd/s':>9} {'CPU us/cmd':>10}",
+    ]
+
+    for transport, result in results["transports"].items():
+        for benchmark, summary in result.items():
+            commands_per_second = summary.get("commands_per_second")
+            cpu = summary.get("cpu_us_per_command")
+            lines.append(
+                f"{transport:9} {benchmark:9} {summary['p50_ms']:9.3f}"
+                f" {summary['p95_ms']:9.3f} {summary['p99_ms']:9.3f}"
+                f" {'' if commands_per_second is None else f'{commands_per_second:9.1f}':>9}"
+                f" {'' if cpu is None else f'{cpu:10.1f}':>10}"
+            )
+
+    codec = results.get("codec")
+    if codec:
+        lines.append("")
+        lines.append(
+            f"codec: {codec['receive_line_us_per_exchange']:.2f} us per STATUS exchange"
+            f" line by line, {codec['feed_us_per_exchange']:.2f} us from raw bytes"
+        )
+
+    cycles = results.get("cycles")
+    if cycles:
+        lines.append(
+            f"cycles: {cycles['cycles_per_second']:.1f} open and close cycles per second on a"
+            f" virtual clock, {cycles['speedup']:.0f} times faster than real time"
+        )
+
+    return "\n".join(lines)
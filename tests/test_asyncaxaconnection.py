@@ -0,0 +1,131 @@
+"""
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import asyncio
+import socket
+import time
+import unittest
+
+from axaremote.asyncaxaconnection import AsyncAXATCPConnection
+from axaremote.axaconnection import AXAConnectionError
+from axaremote.axasimulator import AXARemoteSimulator, AXASimulatorServer
+
+
+class Test(unittest.TestCase):
+    """
+    Unit Test for testing the asyncio AXA Remote connections
+    """
+
+    def test_tcp_connection(self):
+        """
+        Test sending a command and reading the echo and response over a TCP connection.
+        """
+
+        async def run(server):
+            connection = AsyncAXATCPConnection(server.host, server.port)
+            self.assertTrue(await connection.open())
+            try:
+                self.assertEqual(6, await connection.write(b"OPEN\r\n"))
+                await connection.flush()
+                self.assertEqual(b"OPEN\r\n", await connection.readline())
+                self.assertEqual(b"200 OK\r\n", await connection.readline())
+            finally:
+                await connection.close()
+            self.assertFalse(connection.is_open)
+
+        with AXASimulatorServer(AXARemoteSimulator()) as server:
+            asyncio.run(run(server))
+
+    def test_tcp_readline_timeout(self):
+        """
+        Test if reading a line returns empty handed when nothing is received within the timeout.
+        """
+
+        async def run(server):
+            connection = AsyncAXATCPConnection(server.host, server.port)
+            await connection.open()
+            try:
+                start = time.monotonic()
+                self.assertEqual(b"", await connection.readline())
+                self.assertLess(time.monotonic() - start, 2)
+            finally:
+                await connection.close()
+
+        with AXASimulatorServer(AXARemoteSimulator()) as server:
+            asyncio.run(run(server))
+
+    def test_tcp_partial_line(self):
+        """
+        Test if reading a line returns the data received so far when the line is not completed
+        within the timeout, and if a line received in parts is returned in one piece.
+        """
+
+        async def run(server):
+            connection = AsyncAXATCPConnection(*server.getsockname())
+            await connection.open()
+            peer, _ = await asyncio.get_running_loop().sock_accept(server)
+            try:
+                peer.sendall(b"211 Strong")
+                self.assertEqual(b"211 Strong", await connection.readline())
+
+                peer.sendall(b"211 Strong")
+                line = asyncio.create_task(connection.readline())
+                await asyncio.sleep(0.1)
+                peer.sendall(b" Locked\r\n")
+                self.assertEqual(b"211 Strong Locked\r\n", await line)
+            finally:
+                peer.close()
+                await connection.close()
+
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            server.setblocking(False)
+            asyncio.run(run(server))
+
+    def test_tcp_reconnect(self):
+        """
+        Test if a closed connection can be opened again.
+        """
+
+        async def run(server):
+            connection = AsyncAXATCPConnection(server.host, server.port)
+            for _ in range(2):
+                self.assertTrue(await connection.open())
+                self.assertTrue(connection.is_open)
+                await connection.write(b"STATUS\r\n")
+                self.assertEqual(
+                    [b"STATUS\r\n", b"211 Strong Locked\r\n"],
+                    await connection.readlines(),
+                )
+                await connection.close()
+                self.assertFalse(connection.is_open)
+
+            with self.assertRaises(AXAConnectionError):
+                await connection.readline()
+
+        with AXASimulatorServer(AXARemoteSimulator()) as server:
+            asyncio.run(run(server))
+
+    def test_tcp_connection_lost(self):
+        """
+        Test if a connection closed by the peer results in a connection error.
+        """
+
+        async def run(server):
+            connection = AsyncAXATCPConnection(*server.getsockname())
+            await connection.open()
+            peer, _ = await asyncio.get_running_loop().sock_accept(server)
+            peer.close()
+            with self.assertRaises(AXAConnectionError):
+                await connection.readline()
+            self.assertFalse(connection.is_open)
+
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            server.setblocking(False)
+            asyncio.run(run(server))
+
+
+if __name__ == "__main__":
+    unittest.main()
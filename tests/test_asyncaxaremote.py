@@ -0,0 +1,198 @@
+"""
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import asyncio
+import time
+import unittest
+
+from axaremote import AXAStatus, AXATimingProfile
+from axaremote.asyncaxaremote import AsyncAXARemoteTelnet
+from axaremote.axaclock import AXAVirtualClock
+from axaremote.axasimulator import AXARemoteSimulator, AXASimulatorServer
+
+_TIME_UNLOCK = 0.2
+_TIME_OPEN = 1.0
+_TIME_CLOSE = 1.0
+_TIME_LOCK = 0.3
+_PROFILE = AXATimingProfile(_TIME_UNLOCK, _TIME_OPEN, _TIME_CLOSE, _TIME_LOCK)
+
+
+class Test(unittest.TestCase):
+    """
+    Unit Test for testing the asyncio AXA Remote library against the AXA Remote simulator
+    """
+
+    _simulator = None
+    _server = None
+
+    def setUp(self):
+        """
+        Set up the Unit Test.
+        """
+        self._simulator = AXARemoteSimulator(
+            _TIME_UNLOCK, _TIME_OPEN, _TIME_CLOSE, _TIME_LOCK
+        )
+        self._server = AXASimulatorServer(self._simulator)
+        self._server.start()
+
+    def tearDown(self):
+        """
+        Tear down the Unit Test.
+        """
+        self._server.stop()
+
+    def _run(self, test, profile: AXATimingProfile = _PROFILE, **kwargs):
+        """
+        Runs the given test coroutine with a connected window opener.
+        """
+
+        async def run():
+            axa = AsyncAXARemoteTelnet(self._server.host, self._server.port, **kwargs)
+            axa.set_timing_profile(profile)
+            try:
+                self.assertTrue(await axa.connect())
+                await test(axa)
+            finally:
+                await axa.disconnect()
+
+        asyncio.run(run())
+
+    async def _wait_for(self, axa, status: AXAStatus, timeout: float = 5.0):
+        start = time.time()
+        while time.time() - start < timeout:
+            if (await axa.sync_status())[0] == status:
+                return
+            await asyncio.sleep(0.05)
+        self.fail(f"Status {status} not reached")
+
+    def test_connect(self):
+        """
+        Test the pipelined connection handshake with the simulator.
+        """
+
+        async def test(axa):
+            self.assertEqual("AXA RV2900", axa.device)
+            self.assertEqual("V1.20", axa.version)
+            self.assertTrue(axa.pipeline_handshake)
+            self.assertEqual(3, self._simulator.commands)
+            self.assertIs(AXAStatus.LOCKED, (await axa.status())[0])
+
+        self._run(test)
+
+    def test_pipelined_handshake_fallback(self):
+        """
+        Test if the sequential handshake is used when the firmware drops pipelined commands.
+        """
+        self._simulator.pipelining = False
+
+        async def test(axa):
+            self.assertFalse(axa.pipeline_handshake)
+            self.assertEqual("V1.20", axa.version)
+            self.assertIs(AXAStatus.LOCKED, (await axa.status())[0])
+
+        self._run(test)
+
+    def test_raw_status_cache(self):
+        """
+        Test if concurrent callers share a single STATUS command.
+        """
+        self._simulator.latency = 0.05
+
+        async def test(axa):
+            commands = self._simulator.commands
+            responses = await asyncio.gather(*[axa.raw_status() for _ in range(10)])
+            self.assertEqual(commands + 1, self._simulator.commands)
+            self.assertEqual(["Strong Locked"] * 10, [r[1] for r in responses])
+
+        self._run(test, raw_status_ttl=1.0)
+
+    def test_open_close(self):
+        """
+        Test a full open and close cycle.
+        """
+
+        async def test(axa):
+            self.assertTrue(await axa.open())
+            self.assertIs(AXAStatus.UNLOCKING, (await axa.status())[0])
+            await self._wait_for(axa, AXAStatus.OPEN)
+            self.assertEqual(100.0, self._simulator.position())
+
+            self.assertTrue(await axa.close())
+            self.assertIs(AXAStatus.CLOSING, (await axa.status())[0])
+            await self._wait_for(axa, AXAStatus.LOCKED)
+            self.assertEqual("locked", self._simulator.phase)
+
+        self._run(test)
+
+    def test_set_position_without_polling(self):
+        """
+        Test if the timer task stops the window opener at the given position.
+        """
+
+        async def test(axa):
+            await axa.set_position(30.0)
+            await asyncio.sleep(_TIME_UNLOCK + _TIME_OPEN * 0.3 + 0.2)
+            self.assertEqual("stopped", self._simulator.phase)
+            self.assertAlmostEqual(30.0, self._simulator.position(), delta=3)
+            self.assertEqual(30.0, axa.position())
+
+        self._run(test)
+
+    def test_timed_stop_cancelled(self):
+        """
+        Test if a new command cancels the scheduled STOP command.
+        """
+
+        async def test(axa):
+            await axa.set_position(30.0)
+            self.assertTrue(await axa.open())
+            await asyncio.sleep(_TIME_UNLOCK + _TIME_OPEN * 0.3 + 0.2)
+            self.assertEqual("opening", self._simulator.phase)
+
+        self._run(test)
+
+    def test_calibrate(self):
+        """
+        Test calibrating a simulated window opener on a virtual clock.
+        """
+        clock = AXAVirtualClock()
+        self._simulator = AXARemoteSimulator(5, 42, 42, 16, clock=clock)
+        self._server.stop()
+        self._server = AXASimulatorServer(self._simulator)
+        self._server.start()
+
+        async def test(axa):
+            profile = await axa.calibrate(runs=1)
+            self.assertAlmostEqual(5, profile.time_unlock, delta=0.1)
+            self.assertAlmostEqual(42, profile.time_close, delta=0.1)
+            self.assertAlmostEqual(16, profile.time_lock, delta=0.1)
+            self.assertIs(AXAStatus.LOCKED, (await axa.status())[0])
+
+        self._run(test, AXATimingProfile(5, 42, 42, 16), clock=clock)
+
+    def test_offline(self):
+        """
+        Test if an unreachable window opener is reported offline to the circuit breaker.
+        """
+        self._server.stop()
+
+        async def run():
+            axa = AsyncAXARemoteTelnet(self._server.host, self._server.port)
+            try:
+                self.assertFalse(await axa.connect())
+                await axa.sync_status()
+                self.assertFalse(axa.connected)
+                self.assertEqual(
+                    1, axa.circuit_breaker_statistics()["consecutive_failures"]
+                )
+            finally:
+                await axa.disconnect()
+
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    unittest.main()
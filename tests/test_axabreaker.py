@@ -0,0 +1,125 @@
+# pylint: disable=protected-access
+"""
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import socket
+import time
+import unittest
+
+from axaremote import AXARemoteTelnet
+from axaremote.axabreaker import AXACircuitBreaker, AXACircuitBreakerState
+from axaremote.axacommandqueue import AXACommandQueue
+from axaremote.axasimulator import AXARemoteSimulator, AXASimulatorServer
+
+
+class Test(unittest.TestCase):
+    """
+    Unit Test for testing the AXA Remote circuit breaker
+    """
+
+    def test_trip(self):
+        """
+        Test if the circuit breaker opens after consecutive failures and probes after the backoff
+        time.
+        """
+        breaker = AXACircuitBreaker(failure_threshold=2, backoff=0.1, jitter=0)
+        self.assertTrue(breaker.allow())
+        breaker.failure()
+        self.assertEqual(AXACircuitBreakerState.CLOSED, breaker.state)
+        breaker.failure()
+        self.assertEqual(AXACircuitBreakerState.OPEN, breaker.state)
+        self.assertFalse(breaker.allow())
+
+        time.sleep(0.1)
+        self.assertTrue(breaker.allow())
+        self.assertEqual(AXACircuitBreakerState.HALF_OPEN, breaker.state)
+        # Only a single probe at the time
+        self.assertFalse(breaker.allow())
+
+        breaker.success()
+        self.assertEqual(AXACircuitBreakerState.CLOSED, breaker.state)
+
+        statistics = breaker.statistics()
+        self.assertEqual(1, statistics["probes"])
+        self.assertEqual(2, statistics["rejected"])
+        self.assertEqual(1, statistics["trips"])
+
+    def test_backoff(self):
+        """
+        Test if the backoff time doubles after a failed probe.
+        """
+        breaker = AXACircuitBreaker(failure_threshold=1, backoff=0.1, jitter=0)
+        breaker.failure()
+        self.assertAlmostEqual(0.1, breaker.statistics()["retry_in"], delta=0.02)
+        time.sleep(0.1)
+        self.assertTrue(breaker.allow())
+        breaker.failure()
+        self.assertEqual(AXACircuitBreakerState.OPEN, breaker.state)
+        self.assertAlmostEqual(0.2, breaker.statistics()["retry_in"], delta=0.02)
+
+    def test_offline_device(self):
+        """
+        Test if polling an offline window opener returns the cached status without connecting.
+        """
+        with socket.socket() as unused:
+            unused.bind(("127.0.0.1", 0))
+            host, port = unused.getsockname()
+
+        breaker = AXACircuitBreaker(failure_threshold=1, backoff=60)
+        axa = AXARemoteTelnet(host, port, circuit_breaker=breaker)
+        self.assertEqual([None, 0.0], axa.sync_status())
+        self.assertEqual(AXACircuitBreakerState.OPEN, breaker.state)
+        for _ in range(10):
+            self.assertEqual([None, 0.0], axa.sync_status())
+        statistics = axa.circuit_breaker_statistics()
+        self.assertEqual(1, statistics["failures"])
+        self.assertEqual(10, statistics["rejected"])
+
+    def test_online_device(self):
+        """
+        Test if the circuit breaker stays closed for an online window opener.
+        """
+        with AXASimulatorServer(AXARemoteSimulator()) as server:
+            axa = AXARemoteTelnet(server.host, server.port)
+            try:
+                axa.sync_status()
+                axa.sync_status()
+                statistics = axa.circuit_breaker_statistics()
+                self.assertEqual("Closed", statistics["state"])
+                self.assertEqual(2, statistics["successes"])
+            finally:
+                axa.disconnect()
+
+    def test_busy_probe(self):
+        """
+        Test if a probe that fails because the command queue is too busy opens the circuit
+        breaker again.
+        """
+        breaker = AXACircuitBreaker(failure_threshold=1, backoff=0.05, jitter=0)
+        with AXASimulatorServer(AXARemoteSimulator()) as server:
+            axa = AXARemoteTelnet(server.host, server.port, circuit_breaker=breaker)
+            try:
+                self.assertTrue(axa.connect())
+                breaker.failure()
+                time.sleep(0.05)
+
+                # Hold the connection so the STATUS command times out waiting for it
+                axa._queue = AXACommandQueue(timeout=0.05)
+                self.assertTrue(axa._queue.acquire())
+                axa.sync_status()
+                self.assertEqual(AXACircuitBreakerState.OPEN, breaker.state)
+                self.assertEqual(2, breaker.statistics()["failures"])
+                axa._queue.release()
+
+                time.sleep(0.1)
+                axa.sync_status()
+                self.assertEqual(AXACircuitBreakerState.CLOSED, breaker.state)
+            finally:
+                axa.disconnect()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import unittest
+
+from axaremote import AXARemote, AXATimingProfile
+from axaremote.axacalibration import AXAEdgeDetector, average_profiles
+from axaremote.axaconnection import AXASocketConnection
+from axaremote.axaprotocol import AXARawStatus
+
+
+class Test(unittest.TestCase):
+    """
+    Unit Test for testing the calibration of the motion timings
+    """
+
+    def test_scaled(self):
+        """
+        Test scaling a timing profile to a close time.
+        """
+        profile = AXATimingProfile(5, 42, 42, 16).scaled(29)
+        self.assertEqual(AXATimingProfile(2.5, 21, 21, 8), profile)
+
+    def test_set_close_time(self):
+        """
+        Test if setting the close time keeps the unlock, open and lock times proportional.
+        """
+        axa = AXARemote(AXASocketConnection("127.0.0.1", 1))
+        axa.set_close_time(116)
+        self.assertEqual(AXATimingProfile(10, 84, 84, 32), axa.timing_profile)
+        self.assertEqual(
+            116, axa.timing_profile.time_close + axa.timing_profile.time_lock
+        )
+
+    def test_average_profiles(self):
+        """
+        Test averaging timing profiles.
+        """
+        profile = average_profiles(
+            [AXATimingProfile(4, 40, 40, 15), AXATimingProfile(6, 44, 44, 17)]
+        )
+        self.assertEqual(AXATimingProfile(5, 42, 42, 16), profile)
+
+    def test_burst_polling(self):
+        """
+        Test if the status is polled rarely before and densely around the expected edge.
+        """
+        edge = AXAEdgeDetector(
+            [AXARawStatus.UNLOCKED], 100.0, 40.0, min_interval=0.1, max_interval=2.0
+        )
+        self.assertEqual(2.0, edge.poll_interval(100.0))
+        self.assertAlmostEqual(1.0, edge.poll_interval(136.0))
+        # Not more often than the minimal interval just before the burst window
+        self.assertEqual(0.1, edge.poll_interval(136.95))
+        self.assertEqual(0.1, edge.poll_interval(138.0))
+        self.assertEqual(0.1, edge.poll_interval(150.0))
+
+    def test_early_edge(self):
+        """
+        Test if an edge that comes much earlier than expected is not accurate.
+        """
+        edge = AXAEdgeDetector([AXARawStatus.WEAK_LOCKED], 100.0, 40.0)
+        self.assertIsNone(edge.offer(AXARawStatus.UNLOCKED, 128.0))
+        self.assertAlmostEqual(29.0, edge.offer(AXARawStatus.WEAK_LOCKED, 130.0))
+        self.assertFalse(edge.accurate)
+
+    def test_edge_midpoint(self):
+        """
+        Test if the edge is timed at the midpoint between the polls before and after the edge.
+        """
+        edge = AXAEdgeDetector([AXARawStatus.UNLOCKED], 100.0, 5.0)
+        self.assertIsNone(edge.offer(AXARawStatus.WEAK_LOCKED, 104.8))
+        self.assertAlmostEqual(4.9, edge.offer(AXARawStatus.UNLOCKED, 105.0))
+        self.assertEqual(105.0, edge.sampled)
+        self.assertTrue(edge.accurate)
+        self.assertEqual(2, edge.polls)
+        self.assertFalse(edge.timed_out(200.0))
+        self.assertTrue(edge.timed_out(221.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
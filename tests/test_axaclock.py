@@ -0,0 +1,204 @@
+# pylint: disable=protected-access
+"""
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from axaremote import AXARemoteTelnet, AXAStatus, AXATimingProfile
+from axaremote.axaclock import AXAVirtualClock
+from axaremote.axaconnection import AXASocketConnection
+from axaremote.axasimulator import AXARemoteSimulator, AXASimulatorServer
+
+
+class _EmptyLineConnection(AXASocketConnection):
+    """
+    Socket connection that reads the given number of empty lines before the actual lines.
+    """
+
+    empty_lines = 0
+
+    def readline(self) -> bytes:
+        if self.empty_lines > 0:
+            self.empty_lines -= 1
+            return b""
+
+        return super().readline()
+
+
+class Test(unittest.TestCase):
+    """
+    Unit Test for testing the clocks and simulating window openers on a virtual clock
+    """
+
+    def test_virtual_timers(self):
+        """
+        Test if the timers of the virtual clock are called in order when it is advanced.
+        """
+        clock = AXAVirtualClock(10.0)
+        called = []
+        clock.call_later(2.0, lambda: called.append(("b", clock.time())))
+        clock.call_later(1.0, lambda: called.append(("a", clock.time())))
+        clock.call_later(3.0, lambda: called.append(("c", clock.time()))).cancel()
+
+        clock.advance(1.5)
+        self.assertEqual([("a", 11.0)], called)
+        self.assertEqual(11.5, clock.time())
+
+        clock.sleep(5.0)
+        self.assertEqual([("a", 11.0), ("b", 12.0)], called)
+        self.assertEqual(16.5, clock.time())
+
+    def test_virtual_wait(self):
+        """
+        Test if waiting on the virtual clock only advances it when the event is not set.
+        """
+        clock = AXAVirtualClock()
+        event = threading.Event()
+        clock.call_later(3.0, event.set)
+
+        self.assertFalse(clock.wait(event, 2.0))
+        self.assertEqual(2.0, clock.time())
+        self.assertTrue(clock.wait(event, 2.0))
+        self.assertEqual(4.0, clock.time())
+        self.assertTrue(clock.wait(event, 2.0))
+        self.assertEqual(4.0, clock.time())
+
+    def test_virtual_async_wait(self):
+        """
+        Test waiting on the virtual clock without blocking the event loop.
+        """
+        clock = AXAVirtualClock()
+
+        async def run():
+            event = asyncio.Event()
+            self.assertFalse(await clock.async_wait(event, 2.0))
+            self.assertEqual(2.0, clock.time())
+            event.set()
+            self.assertTrue(await clock.async_wait(event, 2.0))
+            self.assertEqual(2.0, clock.time())
+
+        asyncio.run(run())
+
+    def test_command_timing(self):
+        """
+        Test if the command latencies are measured on the clock of the window opener.
+        """
+        clock = AXAVirtualClock()
+        with AXASimulatorServer(AXARemoteSimulator(latency=0.05)) as server:
+            axa = AXARemoteTelnet(server.host, server.port, clock=clock)
+            try:
+                self.assertTrue(axa.connect())
+                axa.raw_status()
+            finally:
+                axa.disconnect()
+
+        histograms = axa.metrics.snapshot()["histograms"]
+        for histogram in histograms["axaremote_command_seconds"]:
+            self.assertGreater(histogram["count"], 0)
+            # No time passes on the virtual clock while waiting for the responses
+            self.assertEqual(0.0, histogram["sum"])
+
+    def _advance(self, axa, clock, seconds: float):
+        # Synchronise every second, like the poller would
+        for _ in range(int(seconds)):
+            clock.advance(1.0)
+            axa.sync_status()
+
+    def test_simulated_cycles(self):
+        """
+        Test full open and close cycles of a simulated window opener on a virtual clock.
+        """
+        clock = AXAVirtualClock()
+        simulator = AXARemoteSimulator(5, 42, 42, 16, clock=clock)
+        server = AXASimulatorServer(simulator)
+        server.start()
+        axa = AXARemoteTelnet(server.host, server.port, clock=clock)
+        try:
+            start = time.monotonic()
+            self.assertTrue(axa.connect())
+            for _ in range(3):
+                self.assertTrue(axa.open())
+                self._advance(axa, clock, 5 + 42 + 1)
+                self.assertIs(AXAStatus.OPEN, axa.sync_status()[0])
+                self.assertEqual(100.0, simulator.position())
+
+                self.assertTrue(axa.close())
+                self._advance(axa, clock, 42 + 16 + 1)
+                self.assertIs(AXAStatus.LOCKED, axa.sync_status()[0])
+                self.assertEqual("locked", simulator.phase)
+
+            # The scheduled STOP command is sent when the clock passes the target position
+            axa.set_position(30.0)
+            clock.advance(5 + 42 * 0.3)
+            self.assertEqual("stopped", simulator.phase)
+            self.assertAlmostEqual(30.0, simulator.position(), delta=1)
+
+            self.assertTrue(axa.close())
+            profile = axa.calibrate(runs=1)
+            self.assertAlmostEqual(5, profile.time_unlock, delta=0.1)
+            self.assertAlmostEqual(42, profile.time_close, delta=0.1)
+            self.assertAlmostEqual(16, profile.time_lock, delta=0.1)
+            self.assertLess(time.monotonic() - start, 10)
+        finally:
+            axa.disconnect()
+            server.stop()
+
+    def test_learn_cached_timings(self):
+        """
+        Test if the motion timings are learned at the time the cached raw status was received.
+        """
+        clock = AXAVirtualClock()
+        profile = AXATimingProfile(5.5, 42, 42, 16)
+        with AXASimulatorServer(AXARemoteSimulator(*profile, clock=clock)) as server:
+            axa = AXARemoteTelnet(
+                server.host, server.port, raw_status_ttl=1.5, clock=clock
+            )
+            axa.set_timing_profile(profile)
+            try:
+                self.assertTrue(axa.connect())
+                self.assertTrue(axa.open())
+                # Fresh raw states at 1, 3, 5 and 7 seconds, cached ones in between. The unlock
+                # is seen between 5 and 7 seconds, too far apart to learn from.
+                self._advance(axa, clock, 7)
+                self.assertIs(AXAStatus.OPENING, axa.status()[0])
+            finally:
+                axa.disconnect()
+
+        self.assertEqual(profile, axa.timing_profile)
+
+    def test_empty_line_during_timed_stop(self):
+        """
+        Test if the scheduled STOP command is sent when it becomes due while an empty line is
+        read.
+        """
+        clock = AXAVirtualClock()
+        simulator = AXARemoteSimulator(clock=clock)
+        with AXASimulatorServer(simulator) as server:
+            axa = AXARemoteTelnet(server.host, server.port, clock=clock)
+            connection = _EmptyLineConnection(server.host, server.port)
+            axa.connection = connection
+            try:
+                self.assertTrue(axa.connect())
+                axa.set_position(30.0)
+                # The STOP command becomes due while pausing after the empty line
+                clock.advance(axa._stop_delay() - 0.01)
+                connection.empty_lines = 1
+                start = time.monotonic()
+                self.assertEqual("UnLocked", axa.raw_status()[1])
+                self.assertLess(time.monotonic() - start, 1)
+
+                clock.advance(0.02)
+                self.assertEqual("stopped", simulator.phase)
+                self.assertIs(AXAStatus.STOPPED, axa.status()[0])
+            finally:
+                axa.disconnect()
+
+
+if __name__ == "__main__":
+    unittest.main()
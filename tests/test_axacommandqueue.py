@@ -0,0 +1,128 @@
+"""
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from axaremote.axacommandqueue import (
+    PRIORITY_HIGH,
+    PRIORITY_NORMAL,
+    AsyncAXACommandQueue,
+    AXACommandQueue,
+)
+
+
+class Test(unittest.TestCase):
+    """
+    Unit Test for testing the AXA Remote command queues
+    """
+
+    def test_fifo(self):
+        """
+        Test if waiting commands are served in the order they arrived.
+        """
+        queue = AXACommandQueue()
+        served = []
+
+        def command(i):
+            self.assertTrue(queue.acquire())
+            served.append(i)
+            queue.release()
+
+        self.assertTrue(queue.acquire())
+        threads = []
+        for i in range(10):
+            thread = threading.Thread(target=command, args=(i,))
+            thread.start()
+            threads.append(thread)
+            # Make sure the threads enqueue in order
+            while queue.depth < i + 2:
+                time.sleep(0.001)
+        queue.release()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(list(range(10)), served)
+        statistics = queue.statistics()
+        self.assertEqual(11, statistics["commands"])
+        self.assertEqual(10, statistics["contended"])
+        self.assertEqual(0, statistics["depth"])
+
+    def test_timeout(self):
+        """
+        Test if a waiting command gives up if the queue does not make progress.
+        """
+        queue = AXACommandQueue(timeout=0.1)
+        self.assertTrue(queue.acquire())
+
+        result = []
+        thread = threading.Thread(target=lambda: result.append(queue.acquire()))
+        thread.start()
+        thread.join()
+
+        self.assertEqual([False], result)
+        self.assertEqual(1, queue.statistics()["timeouts"])
+        self.assertEqual(1, queue.depth)
+
+    def test_priority(self):
+        """
+        Test if high priority commands jump ahead of waiting normal priority commands.
+        """
+        queue = AXACommandQueue()
+        served = []
+
+        def command(name, priority):
+            self.assertTrue(queue.acquire(priority))
+            served.append(name)
+            queue.sent()
+            queue.release()
+
+        self.assertTrue(queue.acquire())
+        threads = []
+        for name, priority in [
+            ("STATUS1", PRIORITY_NORMAL),
+            ("STATUS2", PRIORITY_NORMAL),
+            ("STOP", PRIORITY_HIGH),
+        ]:
+            thread = threading.Thread(target=command, args=(name, priority))
+            thread.start()
+            threads.append(thread)
+            while queue.depth < len(threads) + 1:
+                time.sleep(0.001)
+        queue.release()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(["STOP", "STATUS1", "STATUS2"], served)
+        self.assertEqual(1, queue.statistics()["lanes"]["high"]["commands"])
+        self.assertGreater(queue.statistics()["lanes"]["high"]["max_latency"], 0.0)
+
+    def test_async_fifo(self):
+        """
+        Test if waiting commands are served in the order they arrived using asyncio.
+        """
+
+        async def run():
+            queue = AsyncAXACommandQueue()
+            served = []
+
+            async def command(i):
+                self.assertTrue(await queue.acquire())
+                served.append(i)
+                await asyncio.sleep(0)
+                queue.release()
+
+            await asyncio.gather(*(command(i) for i in range(10)))
+
+            return served
+
+        self.assertEqual(list(range(10)), asyncio.run(run()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import os
+import socket
+import threading
+import time
+import unittest
+
+from axaremote.axaconnection import (
+    AXAConnectionError,
+    AXALineBuffer,
+    AXASerialConnection,
+    AXASocketConnection,
+)
+from axaremote.axasimulator import AXARemoteSimulator, AXASimulatorServer
+
+
+class Test(unittest.TestCase):
+    """
+    Unit Test for testing the AXA Remote connection helpers
+    """
+
+    def test_line_buffer(self):
+        """
+        Test splitting received data into lines.
+        """
+        buffer = AXALineBuffer()
+        buffer.feed(b"STATUS\r\n211 Strong")
+        self.assertEqual(b"STATUS\r\n", buffer.readline())
+        self.assertIsNone(buffer.readline())
+        buffer.feed(b" Locked\r")
+        self.assertEqual(b"211 Strong Locked\r", buffer.readline())
+        self.assertIsNone(buffer.readline())
+        self.assertEqual(0, len(buffer))
+
+    def test_line_buffer_split_crlf(self):
+        """
+        Test if a carriage return line feed pair split over two reads does not result in an empty
+        line.
+        """
+        buffer = AXALineBuffer()
+        buffer.feed(b"OPEN\r")
+        self.assertEqual(b"OPEN\r", buffer.readline())
+        buffer.feed(b"\n200 OK\n")
+        self.assertEqual(b"200 OK\n", buffer.readline())
+        self.assertIsNone(buffer.readline())
+
+    def test_line_buffer_flush(self):
+        """
+        Test returning an incomplete line.
+        """
+        buffer = AXALineBuffer()
+        buffer.feed(b"21")
+        self.assertIsNone(buffer.readline())
+        self.assertEqual(b"21", buffer.flush())
+        self.assertEqual(0, len(buffer))
+
+    def test_socket_connection(self):
+        """
+        Test sending a command and reading the echo and response over a socket connection.
+        """
+        with AXASimulatorServer(AXARemoteSimulator()) as server:
+            connection = AXASocketConnection(server.host, server.port)
+            self.assertTrue(connection.open())
+            try:
+                self.assertEqual(6, connection.write(b"OPEN\r\n"))
+                self.assertEqual(b"OPEN\r\n", connection.readline())
+                self.assertEqual(b"200 OK\r\n", connection.readline())
+            finally:
+                connection.close()
+            self.assertFalse(connection.is_open)
+
+    def test_socket_reset(self):
+        """
+        Test if a reset discards the received data without waiting out the read timeout.
+        """
+        with AXASimulatorServer(AXARemoteSimulator()) as server:
+            connection = AXASocketConnection(server.host, server.port)
+            connection.open()
+            try:
+                connection.write(b"STATUS\r\nDEVICE\r\n")
+                time.sleep(0.1)
+                start = time.monotonic()
+                self.assertTrue(connection.reset())
+                self.assertLess(time.monotonic() - start, 0.5)
+                self.assertEqual(b"", connection.readline())
+            finally:
+                connection.close()
+
+    def test_socket_connection_lost(self):
+        """
+        Test if a connection closed by the peer results in a connection error.
+        """
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            connection = AXASocketConnection(*server.getsockname())
+            connection.open()
+            peer, _ = server.accept()
+            peer.close()
+            with self.assertRaises(AXAConnectionError):
+                connection.readline()
+            self.assertFalse(connection.is_open)
+
+    def test_serial_readline_timeout(self):
+        """
+        Test if a line trickling in slowly is returned when the read timeout expires.
+        """
+        master, slave = os.openpty()
+        connection = AXASerialConnection(os.ttyname(slave))
+        connection.open()
+        try:
+            os.write(master, b"2")
+            threading.Timer(0.6, os.write, (master, b"0")).start()
+            start = time.monotonic()
+            self.assertEqual(b"20", connection.readline())
+            self.assertLess(time.monotonic() - start, 1.3)
+        finally:
+            connection.close()
+            os.close(master)
+            os.close(slave)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import unittest
+
+from axaremote.axaestimator import CLOSING, OPENING, AXAPositionEstimator
+
+
+class Test(unittest.TestCase):
+    """
+    Unit Test for testing the position estimator
+    """
+
+    def _assert_estimate(self, estimate, position, minimum, maximum):
+        self.assertAlmostEqual(position, estimate.position)
+        self.assertAlmostEqual(minimum, estimate.minimum)
+        self.assertAlmostEqual(maximum, estimate.maximum)
+        self.assertAlmostEqual((maximum - minimum) / 2, estimate.uncertainty)
+
+    def test_opening(self):
+        """
+        Test if the interval widens while opening and collapses at the end stop.
+        """
+        estimator = AXAPositionEstimator(0.1)
+        estimator.locked(0.0)
+        estimator.start(OPENING, 0.0, 10.0, delay=2.0)
+        self._assert_estimate(estimator.estimate(1.0), 0.0, 0.0, 0.0)
+        self._assert_estimate(
+            estimator.estimate(7.0), 50.0, (7.0 - 2.0 / 0.9) * 9, (7.0 - 2.0 / 1.1) * 11
+        )
+        self._assert_estimate(estimator.estimate(20.0), 100.0, 100.0, 100.0)
+
+    def test_unlocked(self):
+        """
+        Test if the interval tightens when the window opener is seen to unlock.
+        """
+        estimator = AXAPositionEstimator(0.1)
+        estimator.start(OPENING, 0.0, 10.0, delay=2.0)
+        estimator.locked(1.9)
+        estimator.unlocked(2.1)
+        self._assert_estimate(estimator.estimate(2.1), 1.0, 0.0, 2.2)
+        self._assert_estimate(estimator.estimate(7.1), 51.0, 45.0, 57.2)
+
+    def test_stop(self):
+        """
+        Test if the command latency widens the interval when stopping.
+        """
+        estimator = AXAPositionEstimator(0.1)
+        estimator.set(100.0)
+        estimator.start(CLOSING, 0.0, 10.0)
+        estimator.stop(5.0, latency=0.2)
+        self._assert_estimate(estimator.estimate(10.0), 50.0, 45.0, 57.2)
+
+        estimator.start(CLOSING, 10.0, 10.0)
+        estimator.locked(12.0)
+        self._assert_estimate(estimator.estimate(12.0), 0.0, 0.0, 0.0)
+        self.assertEqual(0, estimator.direction)
+
+    def test_opened_by_other_means(self):
+        """
+        Test if the position is unknown when the closed window opener is unlocked.
+        """
+        estimator = AXAPositionEstimator()
+        estimator.locked(0.0)
+        estimator.unlocked(1.0)
+        self._assert_estimate(estimator.estimate(1.0), 50.0, 0.0, 100.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
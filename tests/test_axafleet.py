@@ -0,0 +1,87 @@
+"""
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import socket
+import time
+import unittest
+
+from axaremote import AXARemoteTelnet, AXAStatus
+from axaremote.axafleet import AXAFleet
+from axaremote.axasimulator import AXARemoteSimulator, AXASimulatorServer
+
+
+class Test(unittest.TestCase):
+    """
+    Unit Test for testing the AXA Fleet against AXA Remote simulators
+    """
+
+    _servers = None
+    _fleet = None
+
+    def setUp(self):
+        """
+        Set up the Unit Test.
+        """
+        self._servers = []
+        self._fleet = AXAFleet(max_workers=4)
+        for index in range(4):
+            server = AXASimulatorServer(AXARemoteSimulator(latency=0.01))
+            server.start()
+            self._servers.append(server)
+            self._fleet.add(
+                AXARemoteTelnet(server.host, server.port),
+                ["even" if index % 2 == 0 else "odd"],
+            )
+
+    def tearDown(self):
+        """
+        Tear down the Unit Test.
+        """
+        for _ in self._fleet.disconnect_all():
+            pass
+        self._fleet.shutdown()
+        for server in self._servers:
+            server.stop()
+
+    def test_sync_all(self):
+        """
+        Test synchronising the status of all window openers.
+        """
+        results = list(self._fleet.sync_all())
+        self.assertEqual(4, len(results))
+        for result in results:
+            self.assertIsNone(result.error)
+            self.assertEqual([AXAStatus.LOCKED, 0.0], result.result)
+
+    def test_group(self):
+        """
+        Test opening the window openers of a group.
+        """
+        results = list(self._fleet.open_all("odd"))
+        self.assertEqual(2, len(results))
+        self.assertTrue(all(result.result for result in results))
+        phases = sorted(server.simulator.phase for server in self._servers)
+        self.assertEqual(["locked", "locked", "unlocking", "unlocking"], phases)
+
+    def test_offline(self):
+        """
+        Test if an offline window opener does not block the others.
+        """
+        with socket.socket() as unused:
+            unused.bind(("127.0.0.1", 0))
+            port = unused.getsockname()[1]
+        offline = AXARemoteTelnet("127.0.0.1", port)
+        self._fleet.add(offline)
+
+        start = time.monotonic()
+        results = {result.remote: result for result in self._fleet.sync_all()}
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(5, len(results))
+        self.assertFalse(offline.connected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import unittest
+import urllib.request
+
+from axaremote import AXARemoteTelnet
+from axaremote.axametrics import AXAMetrics, AXAMetricsServer
+from axaremote.axasimulator import AXARemoteSimulator, AXASimulatorServer
+
+
+class Test(unittest.TestCase):
+    """
+    Unit Test for testing the AXA Remote metrics
+    """
+
+    def test_snapshot(self):
+        """
+        Test counting and observing values.
+        """
+        metrics = AXAMetrics()
+        labels = (("device", "test"),)
+        metrics.inc("axaremote_commands_total", labels)
+        metrics.inc("axaremote_commands_total", labels)
+        metrics.observe("axaremote_command_seconds", 0.003, labels)
+        metrics.observe("axaremote_command_seconds", 10, labels)
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(
+            [{"labels": {"device": "test"}, "value": 2}],
+            snapshot["counters"]["axaremote_commands_total"],
+        )
+        histogram = snapshot["histograms"]["axaremote_command_seconds"][0]
+        self.assertEqual(2, histogram["count"])
+        self.assertEqual(0, histogram["buckets"]["0.0025"])
+        self.assertEqual(1, histogram["buckets"]["0.005"])
+        self.assertEqual(1, histogram["buckets"]["5.0"])
+        self.assertEqual(2, histogram["buckets"]["+Inf"])
+
+    def test_prometheus(self):
+        """
+        Test the Prometheus text format.
+        """
+        metrics = AXAMetrics()
+        metrics.inc("axaremote_commands_total", (("device", 'a"b'),))
+        metrics.observe("axaremote_command_seconds", 0.001)
+        text = metrics.prometheus()
+        self.assertIn("# TYPE axaremote_commands_total counter\n", text)
+        self.assertIn('axaremote_commands_total{device="a\\"b"} 1\n', text)
+        self.assertIn("# TYPE axaremote_command_seconds histogram\n", text)
+        self.assertIn('axaremote_command_seconds_bucket{le="0.001"} 1\n', text)
+        self.assertIn("axaremote_command_seconds_count 1\n", text)
+
+    def test_remote(self):
+        """
+        Test the metrics recorded while communicating with the simulator and serving them over
+        HTTP.
+        """
+        metrics = AXAMetrics()
+        with AXASimulatorServer(AXARemoteSimulator()) as server:
+            axa = AXARemoteTelnet(server.host, server.port, metrics=metrics)
+            try:
+                self.assertTrue(axa.connect())
+                axa.raw_status()
+                axa._send_command("RESET")
+            finally:
+                axa.disconnect()
+
+        counters = {
+            (counter["labels"].get("command"), name): counter["value"]
+            for name, values in metrics.snapshot()["counters"].items()
+            for counter in values
+        }
+        self.assertEqual(2, counters[("STATUS", "axaremote_commands_total")])
+        self.assertEqual(1, counters[("RESET", "axaremote_commands_total")])
+        self.assertEqual(1, counters[(None, "axaremote_connects_total")])
+
+        with AXAMetricsServer(metrics) as metrics_server:
+            url = f"http://{metrics_server.host}:{metrics_server.port}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                text = response.read().decode()
+        self.assertIn(
+            f'axaremote_commands_total{{device="{axa.unique_id}",command="STATUS"}} 2',
+            text,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import time
+import unittest
+
+from axaremote import AXARemoteTelnet, AXAStatus
+from axaremote.axapoller import AXAPoller
+from axaremote.axasimulator import AXARemoteSimulator, AXASimulatorServer
+
+
+class Test(unittest.TestCase):
+    """
+    Unit Test for testing the adaptive status polling
+    """
+
+    def _remote(self, status: AXAStatus, time_passed: float) -> AXARemoteTelnet:
+        axa = AXARemoteTelnet("127.0.0.1", 23)
+        axa._status = status
+        axa._timestamp = axa.clock.time() - time_passed
+        return axa
+
+    def test_idle(self):
+        """
+        Test if an idle window opener is polled rarely.
+        """
+        self.assertEqual(30, self._remote(AXAStatus.LOCKED, 0).next_poll_interval())
+        self.assertEqual(30, self._remote(AXAStatus.OPEN, 0).next_poll_interval())
+
+    def test_travel(self):
+        """
+        Test if a window opener half way a movement is polled rarely and densely around the
+        predicted transitions.
+        """
+        # Just started unlocking, the raw status changes after 5 seconds
+        interval = self._remote(AXAStatus.UNLOCKING, 0).next_poll_interval()
+        self.assertAlmostEqual(3.5, interval, delta=0.1)
+        # Just before and after the end of unlocking
+        self.assertEqual(0.2, self._remote(AXAStatus.UNLOCKING, 4).next_poll_interval())
+        self.assertEqual(0.2, self._remote(AXAStatus.UNLOCKING, 6).next_poll_interval())
+        # Half way opening
+        self.assertEqual(5, self._remote(AXAStatus.OPENING, 20).next_poll_interval())
+        # Close to the target position
+        axa = self._remote(AXAStatus.CLOSING, 20)
+        axa._target_position = 50.0
+        self.assertEqual(0.2, axa.next_poll_interval())
+        # Close to the end of closing
+        self.assertEqual(0.2, self._remote(AXAStatus.CLOSING, 41).next_poll_interval())
+
+    def test_poller(self):
+        """
+        Test if the poller is woken up by a command.
+        """
+        simulator = AXARemoteSimulator(time_unlock=0.2, time_open=1.0)
+        with AXASimulatorServer(simulator) as server:
+            axa = AXARemoteTelnet(server.host, server.port)
+            statuses = []
+            try:
+                with AXAPoller(axa, statuses.append) as poller:
+                    time.sleep(0.3)
+                    # Idle, polled only once
+                    self.assertEqual(1, poller.polls)
+                    self.assertTrue(axa.open())
+                    time.sleep(0.3)
+                    self.assertGreater(poller.polls, 1)
+                    self.assertIn(
+                        statuses[-1][0], [AXAStatus.UNLOCKING, AXAStatus.OPENING]
+                    )
+                self.assertFalse(poller.running)
+                # The poller no longer listens to commands once stopped
+                self.assertEqual([], axa._command_listeners)
+            finally:
+                axa.disconnect()
+
+
+if __name__ == "__main__":
+    unittest.main()
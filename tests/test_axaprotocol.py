@@ -0,0 +1,89 @@
+"""
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import unittest
+
+from axaremote.axaprotocol import (
+    ECHO,
+    EMPTY_LINE,
+    AXAProtocol,
+    AXARawStatus,
+    AXAResponse,
+    EmptyResponseError,
+    InvallidResponseError,
+    parse_response,
+)
+
+
+class Test(unittest.TestCase):
+    """
+    Unit Test for testing the sans-I/O AXA Remote protocol codec
+    """
+
+    def test_parse_response(self):
+        """
+        Test parsing response lines.
+        """
+        self.assertEqual(
+            AXAResponse(AXARawStatus.STRONG_LOCKED, "Strong Locked"),
+            parse_response(b"211 Strong Locked"),
+        )
+        self.assertEqual(AXAResponse("299", "Unknown"), parse_response(b"299 Unknown"))
+        self.assertEqual(AXAResponse(None, "garbage"), parse_response(b"garbage"))
+
+    def test_exchange(self):
+        """
+        Test a single command exchange line by line.
+        """
+        protocol = AXAProtocol()
+        self.assertEqual(b"OPEN\r\n", protocol.send(["OPEN"]))
+        self.assertEqual(1, protocol.pending)
+        self.assertIs(EMPTY_LINE, protocol.receive_line(b"\r\n"))
+        self.assertIs(ECHO, protocol.receive_line(b"OPEN\r\n"))
+        self.assertEqual(
+            AXAResponse(AXARawStatus.OK, "OK"), protocol.receive_line(b"200 OK\r\n")
+        )
+        self.assertEqual(0, protocol.pending)
+
+    def test_pipelined_feed(self):
+        """
+        Test feeding the raw bytes of pipelined commands.
+        """
+        protocol = AXAProtocol()
+        self.assertEqual(b"DEVICE\r\nVERSION\r\n", protocol.send(["DEVICE", "VERSION"]))
+        events = protocol.feed(b"DEVICE\r\n260 AXA RV2900\r\nVERS")
+        self.assertEqual([ECHO, AXAResponse(AXARawStatus.DEVICE, "AXA RV2900")], events)
+        events = protocol.feed(b"ION\r\n261 Firmware V1.20\r\n")
+        self.assertEqual(
+            [ECHO, AXAResponse(AXARawStatus.VERSION, "Firmware V1.20")], events
+        )
+
+    def test_empty_response(self):
+        """
+        Test if too many empty lines abort the exchange.
+        """
+        protocol = AXAProtocol()
+        protocol.send(["STATUS"])
+        for _ in range(5):
+            self.assertIs(EMPTY_LINE, protocol.receive_line(b""))
+        with self.assertRaises(EmptyResponseError):
+            protocol.receive_line(b"")
+        self.assertEqual(0, protocol.pending)
+
+    def test_missing_echo(self):
+        """
+        Test if a missing command echo results in an invalid response.
+        """
+        protocol = AXAProtocol()
+        protocol.send(["STATUS"])
+        with self.assertRaises(InvallidResponseError) as context:
+            protocol.receive_line(b"211 Strong Locked\r\n")
+        self.assertEqual("211 Strong Locked", context.exception.response)
+        self.assertEqual(0, protocol.pending)
+
+
+if __name__ == "__main__":
+    unittest.main()
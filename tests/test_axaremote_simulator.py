@@ -0,0 +1,329 @@
+# pylint: disable=protected-access
+"""
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import logging
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from axaremote import AXARemoteSerial, AXARemoteTelnet, AXAStatus, AXATimingProfile
+from axaremote.axasimulator import (
+    AXARemoteSimulator,
+    AXASimulatorSerial,
+    AXASimulatorServer,
+)
+from axaremote.axastore import AXAHandshakeCache, AXAProfileStore
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(
+    format="%(asctime)s %(levelname)-8s %(message)s", level=logging.DEBUG
+)
+
+_TIME_UNLOCK = 0.2
+_TIME_OPEN = 1.0
+_TIME_CLOSE = 1.0
+_TIME_LOCK = 0.3
+
+
+class _LockCheckingStore(AXAProfileStore):
+    """
+    Profile store recording whether the state lock of the window opener was held when storing.
+    """
+
+    state_lock = None
+    locked = []
+
+    def set(self, unique_id, profile):
+        self.locked.append(self.state_lock._is_owned())
+        return super().set(unique_id, profile)
+
+
+class Test(unittest.TestCase):
+    """
+    Unit Test for testing the AXA Remote library against the AXA Remote simulator
+    """
+
+    _simulator = None
+    _server = None
+    _axa = None
+
+    def setUp(self):
+        """
+        Set up the Unit Test.
+        """
+        self._simulator = AXARemoteSimulator(
+            _TIME_UNLOCK, _TIME_OPEN, _TIME_CLOSE, _TIME_LOCK
+        )
+        self._server = AXASimulatorServer(self._simulator)
+        self._server.start()
+
+        self._axa = AXARemoteTelnet(self._server.host, self._server.port)
+        self._set_times(self._axa)
+
+    def tearDown(self):
+        """
+        Tear down the Unit Test.
+        """
+        if self._axa is not None:
+            self._axa.disconnect()
+            self._axa = None
+        self._server.stop()
+
+    def _set_times(self, axa):
+        axa._time_unlock = _TIME_UNLOCK
+        axa._time_open = _TIME_OPEN
+        axa._time_close = _TIME_CLOSE
+        axa._time_lock = _TIME_LOCK
+
+    def _wait_for(self, status: AXAStatus, timeout: float = 5.0):
+        start = time.time()
+        while time.time() - start < timeout:
+            if self._axa.sync_status()[0] == status:
+                return
+            time.sleep(0.05)
+        self.fail(f"Status {status} not reached")
+
+    def test_connect(self):
+        """
+        Test connection to the simulator.
+        """
+        self.assertTrue(self._axa.connect())
+        self.assertEqual("AXA RV2900", self._axa.device)
+        self.assertEqual("V1.20", self._axa.version)
+        self.assertIs(AXAStatus.LOCKED, self._axa.status()[0])
+
+    def test_pipelined_handshake(self):
+        """
+        Test if the connection handshake is pipelined.
+        """
+        self.assertTrue(self._axa.connect())
+        self.assertTrue(self._axa.pipeline_handshake)
+        self.assertEqual(1, self._axa.queue_statistics()["commands"])
+        self.assertEqual(3, self._simulator.commands)
+
+    def test_pipelined_handshake_fallback(self):
+        """
+        Test if the sequential handshake is used when the firmware drops pipelined commands.
+        """
+        self._simulator.pipelining = False
+        self.assertTrue(self._axa.connect())
+        self.assertFalse(self._axa.pipeline_handshake)
+        self.assertEqual("V1.20", self._axa.version)
+        self.assertIs(AXAStatus.LOCKED, self._axa.status()[0])
+
+    def test_handshake_cache(self):
+        """
+        Test if connect() only requests the status when the handshake is cached.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "handshake.json")
+            cache = AXAHandshakeCache(path)
+
+            self._axa.handshake_cache = cache
+            self.assertTrue(self._axa.connect())
+            self.assertEqual(("AXA RV2900", "V1.20"), cache.get(self._axa.unique_id))
+
+            commands = self._simulator.commands
+            axa = AXARemoteTelnet(
+                self._server.host,
+                self._server.port,
+                handshake_cache=AXAHandshakeCache(path),
+            )
+            try:
+                self.assertTrue(axa.connect())
+                self.assertEqual("V1.20", axa.version)
+                self.assertEqual(commands + 1, self._simulator.commands)
+            finally:
+                axa.disconnect()
+
+    def test_raw_status_cache(self):
+        """
+        Test if concurrent callers share a single STATUS command and if the cached status is
+        invalidated by a command.
+        """
+        self._simulator.latency = 0.05
+        self._axa.raw_status_ttl = 1.0
+        self.assertTrue(self._axa.connect())
+
+        commands = self._simulator.commands
+        threads = [threading.Thread(target=self._axa.raw_status) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(commands + 1, self._simulator.commands)
+
+        self.assertTrue(self._axa.open())
+        self.assertEqual("Weak Locked", self._axa.raw_status()[1])
+        self.assertEqual(commands + 3, self._simulator.commands)
+
+    def test_open_close(self):
+        """
+        Test a full open and close cycle.
+        """
+        self.assertTrue(self._axa.connect())
+        self.assertTrue(self._axa.open())
+        self.assertIs(AXAStatus.UNLOCKING, self._axa.status()[0])
+        self._wait_for(AXAStatus.OPENING)
+        self._wait_for(AXAStatus.OPEN)
+        self.assertEqual(100.0, self._simulator.position())
+
+        self.assertTrue(self._axa.close())
+        self.assertIs(AXAStatus.CLOSING, self._axa.status()[0])
+        self._wait_for(AXAStatus.LOCKING)
+        self._wait_for(AXAStatus.LOCKED)
+        self.assertEqual("locked", self._simulator.phase)
+
+    def test_stop(self):
+        """
+        Test stopping the simulated window opener while opening.
+        """
+        self.assertTrue(self._axa.connect())
+        self._axa.open()
+        time.sleep(_TIME_UNLOCK + (_TIME_OPEN / 2))
+        self._axa.sync_status()
+        self.assertTrue(self._axa.stop())
+        self.assertEqual("stopped", self._simulator.phase)
+        self.assertAlmostEqual(50.0, self._simulator.position(), delta=10)
+        self.assertAlmostEqual(
+            self._simulator.position(), self._axa.position(), delta=10
+        )
+
+    def test_set_position(self):
+        """
+        Test moving the simulated window opener to a given position.
+        """
+        self.assertTrue(self._axa.connect())
+        self._axa.set_position(50.0)
+        self._wait_for(AXAStatus.STOPPED)
+        self.assertAlmostEqual(50.0, self._simulator.position(), delta=10)
+
+    def test_set_position_without_polling(self):
+        """
+        Test if the window opener is stopped at the given position without polling the status.
+        """
+        self.assertTrue(self._axa.connect())
+        self._axa.set_position(30.0)
+        time.sleep(_TIME_UNLOCK + _TIME_OPEN * 0.3 + 0.2)
+        self.assertEqual("stopped", self._simulator.phase)
+        self.assertAlmostEqual(30.0, self._simulator.position(), delta=3)
+        self.assertEqual(30.0, self._axa.position())
+
+    def test_timed_stop_cancelled(self):
+        """
+        Test if a new command cancels the scheduled STOP command.
+        """
+        self.assertTrue(self._axa.connect())
+        self._axa.set_position(30.0)
+        self.assertTrue(self._axa.open())
+        time.sleep(_TIME_UNLOCK + _TIME_OPEN * 0.3 + 0.2)
+        self.assertEqual("opening", self._simulator.phase)
+
+    def test_calibrate(self):
+        """
+        Test measuring the unlock, open, close and lock times of the simulated window opener.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            store = _LockCheckingStore(os.path.join(directory, "profiles.json"))
+            store.state_lock = self._axa._state_lock
+            store.locked = []
+            self._axa.profile_store = store
+
+            self.assertTrue(self._axa.connect())
+            self._axa.set_close_time(1.5)
+            profile = self._axa.calibrate(runs=2, min_interval=0.02, max_interval=0.5)
+            self.assertIsNotNone(profile)
+            self.assertEqual(profile, store.get(self._axa.unique_id))
+
+        # The calibrated profile is stored, but not while holding the state lock
+        self.assertNotIn(True, store.locked)
+        self.assertAlmostEqual(_TIME_UNLOCK, profile.time_unlock, delta=0.05)
+        self.assertAlmostEqual(_TIME_CLOSE, profile.time_open, delta=0.05)
+        self.assertAlmostEqual(_TIME_CLOSE, profile.time_close, delta=0.05)
+        self.assertAlmostEqual(_TIME_LOCK, profile.time_lock, delta=0.05)
+        self.assertEqual(profile, self._axa.timing_profile)
+        self.assertEqual("locked", self._simulator.phase)
+        self.assertEqual(AXAStatus.LOCKED, self._axa.status()[0])
+
+    def test_learn_timings(self):
+        """
+        Test if the motion timings are refined from the raw status changes while synchronising.
+        """
+        self._axa.set_timing_profile(AXATimingProfile(0.3, 1.3, 1.3, 0.45))
+        with tempfile.TemporaryDirectory() as directory:
+            store = _LockCheckingStore(os.path.join(directory, "profiles.json"))
+            store.state_lock = self._axa._state_lock
+            store.locked = []
+            self._axa.profile_store = store
+
+            self.assertTrue(self._axa.connect())
+            self.assertTrue(self._axa.open())
+            self._wait_for(AXAStatus.OPEN)
+            time.sleep(0.1)
+            self.assertTrue(self._axa.close())
+            self._wait_for(AXAStatus.LOCKED)
+
+            profile = self._axa.timing_profile
+            self.assertEqual(profile, store.get(self._axa.unique_id))
+
+        self.assertTrue(_TIME_UNLOCK < profile.time_unlock < 0.3)
+        self.assertTrue(_TIME_CLOSE < profile.time_close < 1.3)
+        self.assertEqual(profile.time_close, profile.time_open)
+        self.assertTrue(_TIME_LOCK < profile.time_lock < 0.45)
+        # The learned profile is stored, but not while holding the state lock
+        self.assertTrue(store.locked)
+        self.assertNotIn(True, store.locked)
+
+    def test_position_estimate(self):
+        """
+        Test if the estimated position interval contains the simulated position.
+        """
+        self.assertTrue(self._axa.connect())
+        self.assertEqual(0.0, self._axa.position_estimate().uncertainty)
+        self.assertFalse(self._axa.needs_resync())
+
+        self._axa.set_position(50.0)
+        self._wait_for(AXAStatus.STOPPED)
+        estimate = self._axa.position_estimate()
+        self.assertGreater(estimate.uncertainty, 0.0)
+        self.assertTrue(
+            estimate.minimum <= self._simulator.position() <= estimate.maximum
+        )
+        self.assertTrue(self._axa.needs_resync(0.0))
+
+        self.assertTrue(self._axa.close())
+        self._wait_for(AXAStatus.LOCKED)
+        self.assertEqual(0.0, self._axa.position_estimate().maximum)
+
+    def test_unknown_command(self):
+        """
+        Test the response on an unknown command.
+        """
+        self.assertTrue(self._axa.connect())
+        response = self._axa._send_command("RESET")
+        self.assertEqual(502, response.status.value)
+
+    def test_serial(self):
+        """
+        Test connection to the simulator over a pseudo terminal serial device.
+        """
+        with AXASimulatorSerial(self._simulator) as serial:
+            axa = AXARemoteSerial(serial.serial_port)
+            self._set_times(axa)
+            try:
+                self.assertTrue(axa.connect())
+                self.assertEqual("V1.20", axa.version)
+                self.assertTrue(axa.open())
+                self.assertEqual("unlocking", self._simulator.phase)
+            finally:
+                axa.disconnect()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -155,7 +155,7 @@ class Test(unittest.TestCase):
         """
         self._axa._status = AXAStatus.UNLOCKING
         self._axa._position = 0
-        self._axa._timestamp = time.time()
+        self._axa._timestamp = self._axa.clock.time()
         time.sleep(self._axa._time_unlock / 4)
         self._axa._update()
         self.assertIs(AXAStatus.UNLOCKING, self._axa._status)
@@ -179,7 +179,7 @@ class Test(unittest.TestCase):
         """
         self._axa._status = AXAStatus.OPENING
         self._axa._position = 0
-        self._axa._timestamp = time.time() - self._axa._time_unlock
+        self._axa._timestamp = self._axa.clock.time() - self._axa._time_unlock
         time.sleep(self._axa._time_open / 4)
         self._axa._update()
         self.assertIs(AXAStatus.OPENING, self._axa._status)
@@ -203,7 +203,7 @@ class Test(unittest.TestCase):
         """
         self._axa._status = AXAStatus.CLOSING
         self._axa._position = 100
-        self._axa._timestamp = time.time()
+        self._axa._timestamp = self._axa.clock.time()
         time.sleep(self._axa._time_close / 4)
         self._axa._update()
         self.assertIs(AXAStatus.CLOSING, self._axa._status)
@@ -227,7 +227,7 @@ class Test(unittest.TestCase):
         """
         self._axa._status = AXAStatus.LOCKING
         self._axa._position = 100
-        self._axa._timestamp = time.time() - self._axa._time_close
+        self._axa._timestamp = self._axa.clock.time() - self._axa._time_close
         time.sleep(self._axa._time_lock / 4)
         self._axa._update()
         self.assertIs(AXAStatus.LOCKING, self._axa._status)
@@ -0,0 +1,101 @@
+"""
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from axaremote import AXARemoteTelnet, AXATimingProfile
+from axaremote.axastore import AXAProfileStore
+
+
+class Test(unittest.TestCase):
+    """
+    Unit Test for testing the persistent timing profile store
+    """
+
+    _directory = None
+    _path = None
+
+    def setUp(self):
+        """
+        Set up the Unit Test.
+        """
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, "profiles.json")
+
+    def tearDown(self):
+        """
+        Tear down the Unit Test.
+        """
+        self._directory.cleanup()
+
+    def test_set_get(self):
+        """
+        Test storing and removing timing profiles.
+        """
+        store = AXAProfileStore(self._path)
+        self.assertIsNone(store.get("a"))
+
+        self.assertTrue(store.set("a", AXATimingProfile(5, 40, 40, 15)))
+        self.assertTrue(store.set("b", AXATimingProfile(6, 44, 44, 17)))
+        self.assertEqual(AXATimingProfile(5, 40, 40, 15), store.get("a"))
+
+        # A second store on the same file does not lose the profiles of the first
+        self.assertTrue(
+            AXAProfileStore(self._path).set("c", AXATimingProfile(1, 2, 2, 3))
+        )
+        self.assertEqual(AXATimingProfile(6, 44, 44, 17), store.get("b"))
+
+        self.assertTrue(store.remove("a"))
+        self.assertIsNone(AXAProfileStore(self._path).get("a"))
+
+        with open(self._path, encoding="utf8") as file:
+            data = json.load(file)
+        self.assertEqual(1, data["version"])
+        self.assertEqual(["b", "c"], sorted(data["profiles"]))
+
+    def test_newer_version(self):
+        """
+        Test if a store written by a newer version is ignored and not overwritten.
+        """
+        data = {"version": 2, "profiles": {"a": {"time_close": 40}}}
+        with open(self._path, "w", encoding="utf8") as file:
+            json.dump(data, file)
+
+        store = AXAProfileStore(self._path)
+        self.assertIsNone(store.get("a"))
+        self.assertFalse(store.set("a", AXATimingProfile(5, 40, 40, 15)))
+        with open(self._path, encoding="utf8") as file:
+            self.assertEqual(data, json.load(file))
+
+    def test_invalid_profile(self):
+        """
+        Test if an invalid profile is ignored.
+        """
+        with open(self._path, "w", encoding="utf8") as file:
+            json.dump({"version": 1, "profiles": {"a": {"time_close": 0}}}, file)
+
+        self.assertIsNone(AXAProfileStore(self._path).get("a"))
+
+    def test_remote(self):
+        """
+        Test if the window opener loads its timing profile and stores the close time.
+        """
+        store = AXAProfileStore(self._path)
+        store.set("127.0.0.1:2323", AXATimingProfile(5, 40, 40, 15))
+
+        axa = AXARemoteTelnet("127.0.0.1", 2323, profile_store=store)
+        self.assertEqual(AXATimingProfile(5, 40, 40, 15), axa.timing_profile)
+
+        axa.set_close_time(110)
+        axa = AXARemoteTelnet("127.0.0.1", 2323, profile_store=store)
+        self.assertEqual(AXATimingProfile(10, 80, 80, 30), axa.timing_profile)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import asyncio
+import time
+import unittest
+
+from axaremote import AsyncAXARemoteTelnet, AXARemoteTelnet, AXAStatus
+from axaremote.axasimulator import AXARemoteSimulator, AXASimulatorServer
+from axaremote.axasubscription import AXASubscriptions
+
+
+class Test(unittest.TestCase):
+    """
+    Unit Test for testing the state change subscriptions
+    """
+
+    def _set_times(self, axa):
+        axa._time_unlock = 0.2
+        axa._time_open = 1.0
+        axa._time_close = 1.0
+        axa._time_lock = 0.3
+
+    def test_coalescing(self):
+        """
+        Test if position changes are coalesced and status transitions are not.
+        """
+        subscriptions = AXASubscriptions()
+        received = []
+        remove = subscriptions.add(received.append, position_step=5, min_interval=10)
+        subscriptions.publish([AXAStatus.OPENING, 0.0])
+        subscriptions.publish([AXAStatus.OPENING, 2.0])
+        subscriptions.publish([AXAStatus.OPENING, 20.0])
+        subscriptions.publish([AXAStatus.STOPPED, 21.0])
+        self.assertEqual(
+            [[AXAStatus.OPENING, 0.0], [AXAStatus.STOPPED, 21.0]], received
+        )
+
+        remove()
+        self.assertEqual(0, len(subscriptions))
+        subscriptions.publish([AXAStatus.CLOSING, 21.0])
+        self.assertEqual(2, len(received))
+
+    def test_subscribe(self):
+        """
+        Test receiving the status changes while opening the window opener.
+        """
+        simulator = AXARemoteSimulator(0.2, 1.0, 1.0, 0.3)
+        with AXASimulatorServer(simulator) as server:
+            axa = AXARemoteTelnet(server.host, server.port)
+            self._set_times(axa)
+            received = []
+            try:
+                unsubscribe = axa.subscribe(received.append, position_step=10)
+                time.sleep(0.2)
+                self.assertEqual([AXAStatus.LOCKED, 0.0], received[0])
+                self.assertTrue(axa.open())
+                time.sleep(1.5)
+                poller = axa._poller
+                unsubscribe()
+                self.assertFalse(poller.running)
+                self.assertIsNone(axa._poller)
+            finally:
+                axa.disconnect()
+
+        statuses = [status for status, _ in received]
+        self.assertIn(AXAStatus.OPENING, statuses)
+        self.assertEqual(AXAStatus.OPEN, statuses[-1])
+        # Position updates while opening, but not for every poll
+        opening = [
+            position for status, position in received if status == AXAStatus.OPENING
+        ]
+        self.assertTrue(1 < len(opening) <= 11)
+
+    def test_async_changes(self):
+        """
+        Test iterating over the status changes using asyncio.
+        """
+
+        async def run():
+            simulator = AXARemoteSimulator(0.2, 1.0, 1.0, 0.3)
+            with AXASimulatorServer(simulator) as server:
+                axa = AsyncAXARemoteTelnet(server.host, server.port)
+                self._set_times(axa)
+                statuses = []
+                try:
+                    changes = axa.changes(position_step=100)
+                    statuses.append((await anext(changes))[0])
+                    await axa.open()
+                    async for status, _ in changes:
+                        statuses.append(status)
+                        if status == AXAStatus.OPEN:
+                            break
+                    await changes.aclose()
+                finally:
+                    await axa.disconnect()
+                return statuses
+
+        statuses = asyncio.run(asyncio.wait_for(run(), 5))
+        self.assertEqual(AXAStatus.LOCKED, statuses[0])
+        self.assertEqual(AXAStatus.OPEN, statuses[-1])
+
+    def test_async_resubscribe(self):
+        """
+        Test if subscribing again right after the last subscriber unsubscribed gets updates.
+        """
+
+        async def run():
+            simulator = AXARemoteSimulator(0.2, 1.0, 1.0, 0.3)
+            with AXASimulatorServer(simulator) as server:
+                axa = AsyncAXARemoteTelnet(server.host, server.port)
+                received = asyncio.Queue()
+                try:
+                    unsubscribe = axa.subscribe(received.put_nowait)
+                    self.assertEqual(AXAStatus.LOCKED, (await received.get())[0])
+                    unsubscribe()
+                    # Before the stopping poller had a chance to run
+                    unsubscribe = axa.subscribe(received.put_nowait)
+                    await asyncio.sleep(0.1)
+                    self.assertTrue(axa._poller.running)
+                    self.assertEqual(1, len(axa._subscriptions))
+
+                    await axa.open()
+                    while (await received.get())[0] != AXAStatus.UNLOCKING:
+                        pass
+                    unsubscribe()
+                finally:
+                    await axa.disconnect()
+
+        asyncio.run(asyncio.wait_for(run(), 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import os
+import tempfile
+import time
+import unittest
+
+from axaremote import AXARemote, AXAStatus
+from axaremote.axaconnection import AXASocketConnection
+from axaremote.axasimulator import AXARemoteSimulator, AXASimulatorServer
+from axaremote.axatrace import (
+    READ,
+    WRITE,
+    AXAReplayConnection,
+    AXATraceConnection,
+    read_trace,
+)
+
+
+class Test(unittest.TestCase):
+    """
+    Unit Test for testing the trace recorder and the replay connection
+    """
+
+    _directory = None
+    _path = None
+
+    def setUp(self):
+        """
+        Set up the Unit Test.
+        """
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, "session.trace")
+
+    def tearDown(self):
+        """
+        Tear down the Unit Test.
+        """
+        self._directory.cleanup()
+
+    def _record(self, latency: float = 0.0) -> list:
+        with AXASimulatorServer(AXARemoteSimulator(latency=latency)) as server:
+            connection = AXATraceConnection(
+                AXASocketConnection(server.host, server.port), self._path
+            )
+            axa = AXARemote(connection)
+            try:
+                self.assertTrue(axa.connect())
+                result = [axa.device, axa.version, axa.sync_status(), axa.open()]
+            finally:
+                axa.disconnect()
+                connection.close_trace()
+
+        return result
+
+    def _replay(self, speed: float) -> tuple[list, AXAReplayConnection]:
+        connection = AXAReplayConnection(self._path, speed)
+        axa = AXARemote(connection)
+        try:
+            self.assertTrue(axa.connect())
+            result = [axa.device, axa.version, axa.sync_status(), axa.open()]
+        finally:
+            axa.disconnect()
+
+        return result, connection
+
+    def test_record(self):
+        """
+        Test recording a session.
+        """
+        self._record()
+        records = list(read_trace(self._path))
+        writes = [record.data for record in records if record.type == WRITE]
+        self.assertIn(b"DEVICE\r\nVERSION\r\nSTATUS\r\n", writes)
+        reads = [record.data for record in records if record.type == READ]
+        self.assertIn(b"260 AXA RV2900\r\n", reads)
+        timestamps = [record.timestamp for record in records]
+        self.assertEqual(sorted(timestamps), timestamps)
+
+    def test_replay(self):
+        """
+        Test if replaying a session gives the same results without the window opener.
+        """
+        recorded = self._record()
+        self.assertEqual(AXAStatus.LOCKED, recorded[2][0])
+
+        replayed, connection = self._replay(0)
+        self.assertEqual(recorded, replayed)
+        self.assertEqual(0, connection.mismatches)
+        self.assertTrue(connection.finished)
+
+    def test_replay_speed(self):
+        """
+        Test if the recorded timing is replayed, divided by the speed.
+        """
+        self._record(latency=0.05)
+
+        start = time.monotonic()
+        self._replay(1)
+        duration = time.monotonic() - start
+        self.assertGreater(duration, 0.15)
+
+        start = time.monotonic()
+        self._replay(10)
+        self.assertLess(time.monotonic() - start, duration / 2)
+
+    def test_invalid_trace(self):
+        """
+        Test reading a file that is not a trace.
+        """
+        with open(self._path, "wb") as file:
+            file.write(b"NOTATRACE")
+        with self.assertRaises(ValueError):
+            list(read_trace(self._path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import unittest
+
+from axaremote.axaremote import AXARemoteTelnet
+from axaremote.axasimulator import AXARemoteSimulator, AXASimulatorServer
+from axaremote.benchmarks.roundtrip import (
+    bench_roundtrip,
+    format_results,
+    percentile,
+    run_benchmarks,
+)
+
+
+class Test(unittest.TestCase):
+    """
+    Unit Test for testing the benchmarks
+    """
+
+    def test_percentile(self):
+        """
+        Test the nearest rank percentiles.
+        """
+        samples = [float(sample) for sample in range(20, 0, -1)]
+        self.assertEqual(1.0, percentile(samples, 0))
+        self.assertEqual(1.0, percentile(samples, 5))
+        self.assertEqual(10.0, percentile(samples, 50))
+        self.assertEqual(19.0, percentile(samples, 95))
+        self.assertEqual(20.0, percentile(samples, 99))
+        self.assertEqual(20.0, percentile(samples, 100))
+        self.assertEqual(3.0, percentile([3.0], 50))
+        self.assertEqual(0.0, percentile([], 50))
+
+        samples = [float(sample) for sample in range(1, 101)]
+        self.assertEqual(95.0, percentile(samples, 95))
+        self.assertEqual(99.0, percentile(samples, 99))
+
+    def test_roundtrip(self):
+        """
+        Test measuring the round trip latency of the STATUS command.
+        """
+        with AXASimulatorServer(AXARemoteSimulator()) as server:
+            axa = AXARemoteTelnet(server.host, server.port)
+            try:
+                self.assertTrue(axa.connect())
+                result = bench_roundtrip(axa, 20)
+            finally:
+                axa.disconnect()
+
+        self.assertEqual(20, result["count"])
+        self.assertLessEqual(result["min_ms"], result["p50_ms"])
+        self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+        self.assertLessEqual(result["p99_ms"], result["max_ms"])
+        self.assertGreater(result["commands_per_second"], 0)
+        self.assertGreaterEqual(result["cpu_us_per_command"], 0)
+
+    def test_run_benchmarks(self):
+        """
+        Test running and formatting all benchmarks.
+        """
+        results = run_benchmarks(["telnet"], commands=10, handshakes=2, cycles=1)
+        self.assertEqual(["telnet"], list(results["transports"]))
+        self.assertEqual(2, results["transports"]["telnet"]["handshake"]["count"])
+        self.assertEqual(10, results["transports"]["telnet"]["status"]["count"])
+        self.assertEqual(1, results["cycles"]["cycles"])
+        self.assertIn("telnet", format_results(results))
+
+        with self.assertRaises(ValueError):
+            run_benchmarks(["carrier pigeon"], commands=1, handshakes=1, cycles=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+"""
+Created on 18 Oct 2026
+
+@author: Rogier van Staveren
+"""
+
+import unittest
+
+from axaremote.__main__ import argument_parser
+
+
+class Test(unittest.TestCase):
+    """
+    Unit Test for testing the command line arguments
+    """
+
+    def test_debug(self):
+        """
+        Test if --debug is accepted before the command and after the arguments of the command.
+        """
+        parser = argument_parser()
+
+        args = parser.parse_args(["serial", "/dev/ttyUSB0", "status"])
+        self.assertFalse(args.debugLogging)
+        self.assertEqual("/dev/ttyUSB0", args.serial_port)
+        self.assertEqual("status", args.action)
+
+        for arguments in [
+            ["--debug", "serial", "/dev/ttyUSB0", "status"],
+            ["serial", "/dev/ttyUSB0", "status", "--debug"],
+            ["telnet", "localhost", "23", "open", "--debug", "--wait"],
+            ["simulator", "--debug"],
+            ["bench", "--commands", "10", "--debug"],
+        ]:
+            args = parser.parse_args(arguments)
+            self.assertTrue(args.debugLogging, arguments)
+
+
+if __name__ == "__main__":
+    unittest.main()